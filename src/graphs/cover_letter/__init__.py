@@ -0,0 +1,14 @@
+"""
+Cover Letter Graph
+
+Writes a cover letter for a tailored resume in one model call, with all inputs
+loaded up front and the job context sent as a prompt-cache prefix shared with tailoring.
+"""
+
+from .graph import cover_letter_graph
+from .state import CoverLetterState
+
+__all__ = [
+    "cover_letter_graph",
+    "CoverLetterState",
+]
@@ -0,0 +1,49 @@
+"""
+Cover Letter Graph
+
+Direct node flow for writing a cover letter from preloaded inputs.
+"""
+
+from langgraph.graph import StateGraph, START, END
+from .state import CoverLetterState
+from .nodes import initialize_cover_letter_state, cover_letter_writer
+
+
+def route_after_initialization(state: CoverLetterState) -> str:
+    """Stop if the inputs could not be loaded"""
+    if state.error:
+        return END
+    return "cover_letter_writer"
+
+
+def create_cover_letter_graph() -> StateGraph:
+    """
+    Creates the cover letter graph.
+
+    Flow:
+    1. initialize_cover_letter_state: Load job, resumes and recruiter feedback concurrently
+    2. cover_letter_writer: Single model call, saves COVER_LETTER.md
+
+    Returns:
+        Compiled LangGraph for cover letter writing
+    """
+    graph_builder = StateGraph(CoverLetterState)
+
+    # Add nodes
+    graph_builder.add_node("initialize_cover_letter_state", initialize_cover_letter_state)
+    graph_builder.add_node("cover_letter_writer", cover_letter_writer)
+
+    # Routing
+    graph_builder.add_edge(START, "initialize_cover_letter_state")
+    graph_builder.add_conditional_edges(
+        "initialize_cover_letter_state",
+        route_after_initialization,
+        {"cover_letter_writer": "cover_letter_writer", END: END},
+    )
+    graph_builder.add_edge("cover_letter_writer", END)
+
+    return graph_builder.compile()
+
+
+# Create the cover letter graph instance
+cover_letter_graph = create_cover_letter_graph()
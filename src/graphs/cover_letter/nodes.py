@@ -0,0 +1,124 @@
+"""
+Cover Letter Nodes
+
+Loads every input concurrently, then writes the cover letter in one model call.
+The call starts with the same job context prefix as the tailoring call, so the
+provider's prompt cache serves it to whichever of the two runs second.
+"""
+
+import logging
+from typing import Dict, Any
+from langchain_core.runnables import RunnableConfig
+
+from src.llm_config import model
+from src.graphs.cover_letter.state import CoverLetterState
+from src.tools.state_data_manager import StateDataManager, load_cover_letter_data
+from src.tools.job_description_store import load_normalized_job_description
+from src.utils.node_utils import (
+    validate_fields,
+    setup_metadata,
+    handle_error,
+    cached_prefix_message,
+    job_context_prefix,
+)
+from src.utils.resume_overlap import full_resume_supplement
+
+logging.basicConfig(level=logging.DEBUG)
+
+COVER_LETTER_MAX_TOKENS = 1500
+
+
+async def initialize_cover_letter_state(
+    state: CoverLetterState, config: RunnableConfig
+) -> Dict[str, Any]:
+    """Load the job, resumes and recruiter feedback the writer needs"""
+    try:
+        setup_metadata(config, "initialize_cover_letter_state", state.user_id, state.job_id)
+
+        load_result = await load_cover_letter_data(state.user_id, state.job_id)
+        if not load_result.success:
+            return {"error": load_result.error}
+
+        loaded_fields = dict(load_result.loaded_fields)
+
+        # Same text as tailoring saw, so the cached prefix matches byte for byte
+        if state.normalize_job_description and loaded_fields.get("job_description"):
+            normalized = await load_normalized_job_description(
+                state.user_id, state.job_id, loaded_fields["job_description"]
+            )
+            loaded_fields["job_description"] = normalized.text
+
+        return loaded_fields
+
+    except Exception as e:
+        return handle_error(e, "initialize_cover_letter_state")
+
+
+def _build_cover_letter_prompt(state: CoverLetterState) -> str:
+    """Cover letter instructions and candidate material (job context goes in the prefix)"""
+    # Only full-resume material the recruiter has not already seen in the tailored resume
+    extra_details = full_resume_supplement(
+        state.tailored_resume or "", state.full_resume or ""
+    ).supplement
+
+    return f"""
+You are a professional cover letter writer. Using the JOB_DESCRIPTION and COMPANY_STRATEGY
+above, write a cover letter that helps the candidate's overall application for this job.
+
+INSTRUCTIONS:
+- Focus on content that addresses recruiter concerns and highlights the candidate's strengths and fit for the role
+- Consider the weaknesses in RECRUITER_FEEDBACK and how the cover letter can support or explain them indirectly
+- Bring in strengths or experience that the tailored resume does not fully explain
+- Use details from FULL_RESUME_EXTRA_DETAILS where they help the application
+- Consider the psychology and goals of the recruiter and how they will assess the application
+- Write for brevity (200-500 words max), show do not tell
+- If possible make it unique in an appropriate way that could help attract attention
+- DO NOT invent information that is not in the provided material
+
+TAILORED_RESUME:
+{state.tailored_resume}
+
+FULL_RESUME_EXTRA_DETAILS:
+{extra_details or "None"}
+
+RECRUITER_FEEDBACK:
+{state.recruiter_feedback}
+
+Return only the cover letter in markdown, without any commentary.
+"""
+
+
+async def cover_letter_writer(
+    state: CoverLetterState, config: RunnableConfig
+) -> Dict[str, Any]:
+    """Write the cover letter in a single model call and save it as COVER_LETTER.md"""
+    try:
+        error = validate_fields(
+            state,
+            ["job_description", "tailored_resume", "recruiter_feedback"],
+            "cover letter writing",
+        )
+        if error:
+            return {"error": error}
+
+        setup_metadata(config, "cover_letter_writer", state.user_id, state.job_id)
+
+        prefix = job_context_prefix(state.job_description, state.company_strategy)
+        response = await model.ainvoke(
+            [cached_prefix_message(prefix, _build_cover_letter_prompt(state))],
+            config=config,
+            max_tokens=COVER_LETTER_MAX_TOKENS,
+        )
+        cover_letter = (
+            response.content if isinstance(response.content, str) else response.text()
+        ).strip()
+
+        if not await StateDataManager.save_cover_letter(
+            state.user_id, state.job_id, cover_letter
+        ):
+            logging.warning("[DEBUG] Failed to save cover letter")
+
+        return {"cover_letter": cover_letter}
+
+    except Exception as e:
+        return handle_error(e, "cover_letter_writer")
@@ -0,0 +1,53 @@
+"""
+Cover Letter Graph State
+
+Inputs are loaded up front by initialize_cover_letter_state, so the writer node
+makes a single model call instead of fetching files through tools.
+"""
+
+from typing import Optional
+from pydantic import BaseModel, Field
+
+
+class CoverLetterState(BaseModel):
+    """
+    State for the cover letter graph.
+
+    INPUTS:
+        user_id: User identifier
+        job_id: Job identifier
+
+    CONTROL FLOW:
+        normalize_job_description: Use the same normalized job description as tailoring,
+            so the cached job context prefix is shared with the tailoring call
+
+    LOADED DATA:
+        job_description, company_strategy: Job context (sent as the cached prefix)
+        tailored_resume, full_resume: Candidate material
+        recruiter_feedback: Output of resume_screener
+
+    OUTPUTS:
+        cover_letter: Generated cover letter markdown
+        error: Error message if any step failed
+    """
+
+    # Essential inputs
+    user_id: str = Field(..., description="User identifier")
+    job_id: str = Field(..., description="Job identifier")
+
+    # Control flow
+    normalize_job_description: bool = Field(
+        True, description="Use the normalized job description shared with tailoring"
+    )
+
+    # Loaded data
+    job_description: Optional[str] = Field(None, description="Job posting text")
+    company_strategy: Optional[str] = Field(None, description="Job analysis output")
+    original_resume: Optional[str] = Field(None, description="User's original resume")
+    full_resume: Optional[str] = Field(None, description="User's full resume")
+    tailored_resume: Optional[str] = Field(None, description="Tailored resume for the job")
+    recruiter_feedback: Optional[str] = Field(None, description="Recruiter screening feedback")
+
+    # Outputs
+    cover_letter: Optional[str] = Field(None, description="Generated cover letter")
+    error: Optional[str] = Field(None, description="Error message if any")
@@ -3,6 +3,7 @@ Information Collection Subgraph
 
 Manages conversations with users to collect missing resume information.
 Updated to directly accept InterruptData from resume_tailorer.py
+Pending interrupts of several jobs can be collected in one session (see batching.py).
 """
 
 from .graph import info_collection_graph
@@ -11,10 +12,22 @@ from .state import (
     create_info_collection_state_from_interrupt,
     create_info_collection_state,
 )
+from .batching import (
+    cluster_missing_info,
+    create_batched_collection_state,
+    build_resume_payloads,
+    load_pending_interrupts,
+    resume_pending_threads,
+)
 
 __all__ = [
     "info_collection_graph",
     "InfoCollectionState",
     "create_info_collection_state_from_interrupt",
     "create_info_collection_state",
+    "cluster_missing_info",
+    "create_batched_collection_state",
+    "build_resume_payloads",
+    "load_pending_interrupts",
+    "resume_pending_threads",
 ]
@@ -0,0 +1,214 @@
+"""
+Batched Info Collection
+
+Collects missing information for several pending resume_tailorer interrupts of one
+user in a single conversation:
+
+1. Gather the InterruptData payloads waiting on each job's thread
+2. Cluster near-duplicate missing_info items locally (normalized text + token overlap)
+3. Run one info_collection session over the deduplicated questions
+4. Map the collected facts back to each job and resume every waiting thread
+
+One conversation and one update_resume_with_collected_info merge replace N of each.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional
+
+from langgraph.types import Command
+
+from src.graphs.info_collection.state import InfoCollectionState
+from src.utils.text_utils import normalize_topic, topic_similarity
+
+logging.basicConfig(level=logging.DEBUG)
+
+# Minimum token overlap for two missing-info items to be asked as one question
+CLUSTER_SIMILARITY_THRESHOLD = 0.6
+
+
+@dataclass
+class MissingInfoCluster:
+    """One deduplicated question and the original items it answers per job"""
+
+    question: str
+    items_by_job: Dict[str, List[str]] = field(default_factory=dict)
+
+    def add(self, job_id: str, item: str) -> None:
+        """Attach an original missing_info item from a job to this cluster"""
+        job_items = self.items_by_job.setdefault(job_id, [])
+        if item not in job_items:
+            job_items.append(item)
+
+
+def cluster_missing_info(interrupts: List[Dict[str, Any]]) -> List[MissingInfoCluster]:
+    """
+    Group near-duplicate missing_info items across pending interrupts.
+
+    Items are matched on their normalized topic first, then on token-set
+    similarity against each cluster's question. The first phrasing seen
+    becomes the question asked to the user.
+
+    Args:
+        interrupts: InterruptData payloads from resume_tailorer (one per job)
+
+    Returns:
+        Clusters in first-seen order
+    """
+    clusters: List[MissingInfoCluster] = []
+    by_key: Dict[str, MissingInfoCluster] = {}
+
+    for payload in interrupts:
+        job_id = payload.get("job_id", "")
+        for item in payload.get("missing_info") or []:
+            key = normalize_topic(item) or item.strip().lower()
+            cluster = by_key.get(key)
+            if cluster is None:
+                cluster = max(
+                    (
+                        candidate
+                        for candidate in clusters
+                        if topic_similarity(item, candidate.question)
+                        >= CLUSTER_SIMILARITY_THRESHOLD
+                    ),
+                    key=lambda candidate: topic_similarity(item, candidate.question),
+                    default=None,
+                )
+            if cluster is None:
+                cluster = MissingInfoCluster(question=item)
+                clusters.append(cluster)
+            by_key[key] = cluster
+            cluster.add(job_id, item)
+
+    logging.debug(
+        f"[BatchCollection] Clustered {sum(len(p.get('missing_info') or []) for p in interrupts)} "
+        f"items from {len(interrupts)} jobs into {len(clusters)} questions"
+    )
+    return clusters
+
+
+def create_batched_collection_state(
+    interrupts: List[Dict[str, Any]], clusters: List[MissingInfoCluster]
+) -> InfoCollectionState:
+    """
+    Create one info collection state covering every pending interrupt.
+
+    Chat messages are stored on the first job; all interrupts of a user carry
+    the same full_resume, so the first non-empty one is used.
+
+    Args:
+        interrupts: InterruptData payloads from resume_tailorer (one per job)
+        clusters: Output of cluster_missing_info for the same payloads
+
+    Returns:
+        InfoCollectionState ready for processing
+    """
+    if not interrupts:
+        raise ValueError("No pending interrupts to collect info for")
+
+    return InfoCollectionState(
+        missing_info=[cluster.question for cluster in clusters],
+        user_id=interrupts[0].get("user_id", ""),
+        job_id=interrupts[0].get("job_id", ""),
+        full_resume=next(
+            (p["full_resume"] for p in interrupts if p.get("full_resume")), ""
+        ),
+    )
+
+
+def build_resume_payloads(
+    clusters: List[MissingInfoCluster], collection_state: Dict[str, Any]
+) -> Dict[str, Dict[str, str]]:
+    """
+    Map the batched collection result back to one resume payload per job.
+
+    Each job receives only the facts for its own missing_info items, worded with
+    the job's original item (nothing if none were answered), plus the single merged
+    full resume.
+
+    Args:
+        clusters: Clusters the collection session asked about
+        collection_state: Final info_collection state values
+
+    Returns:
+        Mapping of job_id -> InfoCollectionResult payload for Command(resume=...)
+    """
+    collected_facts = collection_state.get("collected_facts") or {}
+    updated_full_resume = collection_state.get("updated_full_resume") or ""
+
+    lines_by_job: Dict[str, List[str]] = {}
+    for cluster in clusters:
+        fact = collected_facts.get(cluster.question)
+        for job_id, items in cluster.items_by_job.items():
+            job_lines = lines_by_job.setdefault(job_id, [])
+            if fact:
+                job_lines.extend(f"- {item}: {fact}" for item in items)
+
+    return {
+        job_id: {
+            # No facts for this job's items (e.g. user ended early) → empty, never the
+            # session-wide collected info, which holds other jobs' answers
+            "final_collected_info": "\n".join(lines),
+            "updated_full_resume": updated_full_resume,
+        }
+        for job_id, lines in lines_by_job.items()
+    }
+
+
+async def load_pending_interrupts(
+    graph: Any, thread_ids: Dict[str, str]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Read the InterruptData payloads waiting on each job's resume_rewrite thread.
+
+    Args:
+        graph: Compiled resume_rewrite graph with a checkpointer
+        thread_ids: Mapping of job_id -> thread_id
+
+    Returns:
+        Mapping of job_id -> interrupt payload, for threads that are interrupted
+    """
+
+    async def _load(thread_id: str) -> Optional[Dict[str, Any]]:
+        snapshot = await graph.aget_state({"configurable": {"thread_id": thread_id}})
+        for task in snapshot.tasks:
+            for pending in task.interrupts:
+                if isinstance(pending.value, dict) and pending.value.get("missing_info"):
+                    return pending.value
+        return None
+
+    job_ids = list(thread_ids)
+    payloads = await asyncio.gather(*(_load(thread_ids[job_id]) for job_id in job_ids))
+    return {job_id: payload for job_id, payload in zip(job_ids, payloads) if payload}
+
+
+async def resume_pending_threads(
+    graph: Any, thread_ids: Dict[str, str], payloads: Dict[str, Dict[str, str]]
+) -> Dict[str, Any]:
+    """
+    Resume every waiting resume_rewrite thread with its job's collected info.
+
+    Args:
+        graph: Compiled resume_rewrite graph with a checkpointer
+        thread_ids: Mapping of job_id -> thread_id
+        payloads: Output of build_resume_payloads
+
+    Returns:
+        Mapping of job_id -> final graph state (or the exception raised for that job)
+    """
+    job_ids = [job_id for job_id in payloads if job_id in thread_ids]
+    results = await asyncio.gather(
+        *(
+            graph.ainvoke(
+                Command(resume=payloads[job_id]),
+                config={"configurable": {"thread_id": thread_ids[job_id]}},
+            )
+            for job_id in job_ids
+        ),
+        return_exceptions=True,
+    )
+    for job_id, result in zip(job_ids, results):
+        if isinstance(result, Exception):
+            logging.error(f"[BatchCollection] Failed to resume job {job_id}: {result}")
+    return dict(zip(job_ids, results))
@@ -4,19 +4,71 @@ Info Collection Nodes
 Conversational nodes for collecting missing resume information from users.
 """
 
+import asyncio
 import logging
 import json
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from langchain_core.runnables import RunnableConfig
 from langchain_core.messages import AIMessage, HumanMessage
+from pydantic import BaseModel, Field
 
 from src.llm_config import model
 from src.graphs.info_collection.state import InfoCollectionState
-from src.utils.node_utils import validate_fields, setup_profile_metadata, handle_error
+from src.utils.node_utils import (
+    validate_fields,
+    setup_profile_metadata,
+    handle_error,
+    merge_resume_patch,
+)
 from src.tools.state_data_manager import StateDataManager
+from src.tools.user_fact_store import record_facts
 
 logging.basicConfig(level=logging.DEBUG)
 
+COLLECTED_INFO_GUIDELINES = """INSTRUCTIONS:
+1. Integrate the new information into the appropriate sections
+2. Maintain the existing structure and formatting
+3. Avoid duplication - merge similar information intelligently
+4. Preserve all existing good content
+5. Ensure consistency in style and tone"""
+
+# Most recent messages sent to the model verbatim on every turn
+CONTEXT_WINDOW_MESSAGES = 6
+# Older messages are folded into the summary in batches of this size
+SUMMARY_FOLD_BATCH = 4
+SUMMARY_MAX_TOKENS = 600
+
+
+class CollectedFact(BaseModel):
+    """A single requested item answered by the user"""
+
+    item: str = Field(description="Requested item, copied verbatim from the list")
+    fact: str = Field(
+        description="Compact, resume-ready statement of what the user said about the item"
+    )
+
+
+class CollectionTurn(BaseModel):
+    """Structured output for one conversation turn: next reply plus extracted facts"""
+
+    reply: str = Field(description="Next message to send to the user")
+    facts: List[CollectedFact] = Field(
+        default_factory=list,
+        description="Requested items the user's latest messages answered",
+    )
+
+
+class ConversationSummary(BaseModel):
+    """Structured output for folding older turns into the running summary"""
+
+    summary: str = Field(
+        description="Concise summary of everything the user has shared so far"
+    )
+    facts: List[CollectedFact] = Field(
+        default_factory=list,
+        description="Requested items the user has already answered, with their facts",
+    )
+
 
 def is_user_message(msg):
     """Helper function to check if message is from user"""
@@ -101,7 +153,11 @@ Let's start with the first item. Can you tell me about: {missing_info[0] if miss
             for phrase in ["done", "finished", "that's all", "complete"]
         ):
             # Wrap up conversation
-            collected_info = await _extract_collected_info(messages, missing_info)
+            collected_info = (
+                _format_collected_facts(state.collected_facts, missing_info)
+                if state.collected_facts
+                else await _extract_collected_info(messages, missing_info)
+            )
 
             farewell_text = "Thank you! I've collected all the information. Your resume will be updated shortly."
             ai_message = AIMessage(content=farewell_text)
@@ -129,37 +185,111 @@ Let's start with the first item. Can you tell me about: {missing_info[0] if miss
         from datetime import datetime
         current_datetime = datetime.now().strftime("%A, %d %B %Y %H:%M:%S")
 
-        # Generate contextual response
+        # Only the last turns go to the model verbatim, older ones live in the summary
+        summarized_count = state.summarized_message_count
+        recent_messages = messages[summarized_count:]
+        # Items without a fact stay listed, so their facts are still extracted
+        remaining_info = [
+            item for item in missing_info if item not in state.collected_facts
+        ]
+
+        # Generate contextual response and extract answered items in the same call
         context_prompt = f"""
-You are a helpful assistant collecting missing resume information. You need to gather:
-{', '.join(missing_info)}
+You are a helpful assistant collecting missing resume information. You still need to gather:
+{chr(10).join(f"- {item}" for item in remaining_info) if remaining_info else 'nothing else - confirm with the user and let them say "done"'}
 
 Based on the conversation so far, ask relevant follow-up questions to collect the missing information.
 Be conversational and helpful. If the user has provided some information, acknowledge it and ask for the next piece.
 
 Keep responses brief and focused on collecting the specific information needed.
 
+For every item above that the user's latest messages answer, also return a fact: the item copied
+verbatim and a compact, resume-ready statement of the answer (keep numbers, names, dates, technologies).
+Only return facts for items the user actually answered.
+
+SUMMARY OF EARLIER CONVERSATION:
+{state.conversation_summary or "None yet"}
+
 Current date and time: {current_datetime}
 """
 
         # Add context to messages for model
         context_messages = [{"role": "system", "content": context_prompt}] + [
-            {"role": msg.type, "content": msg.content} for msg in messages
+            {"role": msg.type, "content": msg.content} for msg in recent_messages
         ]
 
-        response = await model.ainvoke(context_messages, config=config)
-        ai_message = AIMessage(content=response.content)
+        # Fold the oldest turns into the summary alongside the reply, for the next turn
+        updates: Dict[str, Any] = {}
+        summary_task = None
+        if len(recent_messages) > CONTEXT_WINDOW_MESSAGES + SUMMARY_FOLD_BATCH:
+            fold_count = len(recent_messages) - CONTEXT_WINDOW_MESSAGES
+            summary_task = _fold_into_summary(
+                state.conversation_summary,
+                recent_messages[:fold_count],
+                missing_info,
+                config,
+            )
+            updates["summarized_message_count"] = summarized_count + fold_count
+
+        turn_model = model.with_structured_output(CollectionTurn)
+        new_facts: List[CollectedFact] = []
+        if summary_task:
+            turn, summary = await asyncio.gather(
+                turn_model.ainvoke(context_messages, config=config), summary_task
+            )
+            updates["conversation_summary"] = summary.summary
+            # Answers folded out of the verbatim context keep their facts
+            new_facts += summary.facts
+        else:
+            turn = await turn_model.ainvoke(context_messages, config=config)
+        new_facts += turn.facts
+
+        # Merge newly answered items, keeping only ones that were actually requested
+        collected_facts = dict(state.collected_facts)
+        for fact in new_facts:
+            if fact.item in missing_info and fact.fact.strip():
+                collected_facts[fact.item] = fact.fact.strip()
+        updates["collected_facts"] = collected_facts
+        updates["satisfied_info"] = [
+            item for item in missing_info if item in collected_facts
+        ]
+        remaining_info = [
+            item for item in missing_info if item not in collected_facts
+        ]
+
+        # Every requested item is covered - finish without waiting for "done"
+        if missing_info and not remaining_info:
+            reply_text = (
+                f"{turn.reply.strip()}\n\n" if turn.reply.strip() else ""
+            ) + "That covers everything I needed. Your resume will be updated shortly."
+            ai_message = AIMessage(content=reply_text)
+            await StateDataManager.save_chat_message(
+                job_id=job_id,
+                content=reply_text,
+                role="ai",
+                metadata={"conversation_complete": True, "collected_items": len(collected_facts)}
+            )
+            logging.debug(f"[InfoCollector] All items collected for job {job_id}")
+
+            return {
+                "messages": [ai_message],
+                "final_collected_info": _format_collected_facts(collected_facts, missing_info),
+                "conversation_complete": True,
+                **updates,
+            }
+
+        ai_message = AIMessage(content=turn.reply)
 
         # Save AI response message to database
         await StateDataManager.save_chat_message(
             job_id=job_id,
-            content=response.content,
+            content=turn.reply,
             role="ai",
-            metadata={"missing_info_remaining": missing_info}
+            metadata={"missing_info_remaining": remaining_info}
         )
         logging.debug(f"[InfoCollector] Saved AI response message to database for job {job_id}")
 
-        return {"messages": [ai_message]}
+        return {"messages": [ai_message], **updates}
 
     except Exception as e:
         return handle_error(e, "info_collector_agent")
@@ -171,9 +301,12 @@ async def update_resume_with_collected_info(
     """
     Updates full resume with collected information.
 
-    Input: final_collected_info, full_resume
+    Input: final_collected_info, full_resume, collected_facts
     Output: updated_full_resume
 
+    Collected facts are also written to the user's fact store so later jobs
+    don't ask the same questions again.
+
     Args:
         state: InfoCollectionState with collected info and current resume
         config: LangChain runnable config
@@ -197,15 +330,22 @@ async def update_resume_with_collected_info(
         # Setup metadata
         setup_profile_metadata(config, "update_resume_with_collected_info", user_id)
 
-        prompt = f"""
+        # Save facts for future jobs alongside the resume update
+        facts_task = asyncio.create_task(
+            record_facts(user_id, state.collected_facts, state.job_id)
+        )
+
+        updated_resume = None
+        if state.merge_mode == "patch":
+            updated_resume = await merge_resume_patch(
+                model, current_resume, collected_info, COLLECTED_INFO_GUIDELINES, config
+            )
+
+        if updated_resume is None:
+            prompt = f"""
 Update this resume by incorporating the newly collected information.
 
-INSTRUCTIONS:
-1. Integrate the new information into the appropriate sections
-2. Maintain the existing structure and formatting
-3. Avoid duplication - merge similar information intelligently
-4. Preserve all existing good content
-5. Ensure consistency in style and tone
+{COLLECTED_INFO_GUIDELINES}
 
 CURRENT RESUME:
 {current_resume}
@@ -216,8 +356,11 @@ NEWLY COLLECTED INFORMATION:
 Return the complete updated resume.
 """
 
-        response = await model.ainvoke(prompt, config=config)
-        updated_resume = response.content
+            response = await model.ainvoke(prompt, config=config)
+            updated_resume = response.content
+
+        if not await facts_task:
+            logging.warning(f"[DEBUG] Failed to record collected facts for user {user_id}")
 
         logging.debug(
             f"[DEBUG] Resume updated with collected info: {len(updated_resume)} chars"
@@ -229,6 +372,63 @@ Return the complete updated resume.
         return handle_error(e, "update_resume_with_collected_info")
 
 
+async def _fold_into_summary(
+    previous_summary: Optional[str],
+    messages: List,
+    missing_info: List[str],
+    config: RunnableConfig,
+) -> ConversationSummary:
+    """
+    Helper function to fold older conversation turns into the running summary.
+
+    Args:
+        previous_summary: Summary of turns folded earlier (if any)
+        messages: Messages being folded out of the verbatim context
+        missing_info: List of information that is supposed to be collected
+        config: LangChain runnable config
+
+    Returns:
+        Updated summary and a fact per item the user has answered so far
+    """
+    transcript = "\n".join(f"{msg.type}: {msg.content}" for msg in messages)
+    prompt = f"""
+Update the running summary of a conversation that collects missing resume information.
+Keep every concrete fact the user shared (numbers, names, dates, technologies) and drop small talk.
+
+REQUESTED INFORMATION:
+{chr(10).join(f"- {item}" for item in missing_info)}
+
+PREVIOUS SUMMARY:
+{previous_summary or "None"}
+
+NEW CONVERSATION TURNS:
+{transcript}
+
+Return the updated summary, and for every requested item that has been answered a fact:
+the item copied verbatim and a compact, resume-ready statement of the answer.
+"""
+    model_with_structure = model.with_structured_output(ConversationSummary)
+    return await model_with_structure.ainvoke(
+        prompt, config=config, max_tokens=SUMMARY_MAX_TOKENS
+    )
+
+
+def _format_collected_facts(collected_facts: Dict[str, str], missing_info: List[str]) -> str:
+    """
+    Helper function to render extracted facts as compact text for downstream prompts.
+
+    Args:
+        collected_facts: Extracted fact per answered item
+        missing_info: List of information that was supposed to be collected
+
+    Returns:
+        One "item: fact" line per answered item, in requested order
+    """
+    ordered = [item for item in missing_info if item in collected_facts]
+    ordered += [item for item in collected_facts if item not in ordered]
+    return "\n".join(f"- {item}: {collected_facts[item]}" for item in ordered)
+
+
 async def _extract_collected_info(messages: List, missing_info: List[str]) -> str:
     """
     Helper function to extract collected information from conversation messages.
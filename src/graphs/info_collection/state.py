@@ -20,11 +20,18 @@ class InfoCollectionState(BaseModel):
         job_id: Job identifier for database operations
         full_resume: Current full resume content for updating
 
+    CONTROL FLOW:
+        merge_mode: "patch" (section-level edits applied locally) or "full" (regenerate resume)
+
     CONVERSATION:
         messages: Conversation history with user (required for react agent)
+        conversation_summary: Running summary of turns folded out of the model context
+        summarized_message_count: Number of leading messages already folded into the summary
+        satisfied_info: missing_info items the user has already answered
+        collected_facts: Compact fact extracted per answered missing_info item
 
     OUTPUTS:
-        final_collected_info: All information collected from user (formatted)
+        final_collected_info: Collected facts formatted one per requested item
         updated_full_resume: Updated full resume content after incorporating new info
         conversation_complete: Flag indicating conversation should terminate
     """
@@ -35,10 +42,25 @@ class InfoCollectionState(BaseModel):
     job_id: str = Field(..., description="Job identifier for database operations")
     full_resume: str = Field(..., description="Resume to update")
 
+    # Control flow
+    merge_mode: str = Field("patch", description="Resume merge strategy: patch, full")
+
     # Conversation management (required for react agent)
     messages: Annotated[List, add_messages] = Field(
         default_factory=list, description="Conversation history"
     )
+    conversation_summary: Optional[str] = Field(
+        None, description="Running summary of older turns"
+    )
+    summarized_message_count: int = Field(
+        0, description="Leading messages folded into the summary"
+    )
+    satisfied_info: List[str] = Field(
+        default_factory=list, description="missing_info items already answered"
+    )
+    collected_facts: Dict[str, str] = Field(
+        default_factory=dict, description="Extracted fact per answered item"
+    )
 
     # Outputs
     final_collected_info: Optional[str] = Field(
@@ -2,21 +2,40 @@
 Main Resume Tailoring Graph
 
 Clean, linear pipeline for resume tailoring with unified state management:
-START → initialize_state → job_analyzer → resume_screener → resume_tailorer → END
+START → initialize_state → job_analyzer → resume_screener → resume_tailorer → keyword_checker → END
 
-Uses StateDataManager for cohesive state loading/saving operations.
+In two_phase tailoring mode, missing_info_detector runs before resume_tailorer:
+resume_screener → missing_info_detector → (resume_tailorer if info is missing) → keyword_checker → END
+
+Uses StateDataManager for cohesive state loading/saving operations. With
+resume_from_progress enabled, initialize_state restores persisted outputs that are
+still valid for the current inputs and the pipeline starts at the first incomplete node.
+With use_precomputed_analysis (default), a company_strategy precomputed for the current
+job description (see precompute.py) is kept and the run starts at resume_screener.
 """
 
+import asyncio
+import logging
 import os
+from typing import Optional
 from langgraph.graph import StateGraph, START, END
-from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from src.graphs.resume_rewrite.state import GraphState, set_error
 from src.graphs.resume_rewrite.nodes import (
     job_analyzer,
     resume_screener,
+    missing_info_detector,
     resume_tailorer,
+    keyword_checker,
+)
+from src.graphs.resume_rewrite.pipeline_progress import (
+    restore_completed_outputs,
+    first_incomplete_node,
 )
-from src.tools.state_data_manager import load_resume_tailoring_data
+from src.tools.state_data_manager import StateDataManager, load_resume_tailoring_data
+from src.tools.sqlite_checkpointer import BlobSqliteSaver
+from src.tools.job_description_store import load_normalized_job_description
+from src.tools.resume_artifacts_store import load_resume_artifacts
 
 
 async def initialize_state(state: GraphState, config) -> dict:
@@ -38,27 +57,118 @@ async def initialize_state(state: GraphState, config) -> dict:
             "node": "initialize_state",
         }
 
-        # Load all required data using StateDataManager
-        load_result = await load_resume_tailoring_data(user_id, job_id)
+        # Load all required data and the user's known facts using StateDataManager
+        load_result, user_facts = await asyncio.gather(
+            load_resume_tailoring_data(user_id, job_id),
+            StateDataManager.load_user_facts(user_id),
+        )
 
         if not load_result.success:
             return set_error(load_result.error)
 
-        return load_result.loaded_fields
+        loaded_fields = {**load_result.loaded_fields, "user_facts": user_facts}
+
+        # Resume-derived structures are precomputed at save time; rebuilt here only if stale
+        if state.dedupe_full_resume:
+            artifacts = await load_resume_artifacts(
+                user_id, loaded_fields.get("original_resume"), loaded_fields.get("full_resume")
+            )
+            loaded_fields["resume_artifacts"] = artifacts.model_dump() if artifacts else None
+
+        # Strip boilerplate once; every analysis node gets the same cleaned text
+        if state.normalize_job_description and loaded_fields.get("job_description"):
+            normalized = await load_normalized_job_description(
+                user_id, job_id, loaded_fields["job_description"]
+            )
+            loaded_fields["job_description"] = normalized.text
+
+        if not state.resume_from_progress and not state.use_precomputed_analysis:
+            return loaded_fields
+
+        # Keep only persisted outputs generated from the current inputs
+        progress = await StateDataManager.load_pipeline_progress(user_id, job_id)
+        restored = restore_completed_outputs(loaded_fields, progress)
+        if state.resume_from_progress:
+            return restored
+
+        # Only the job analysis is reused; screening and tailoring run again
+        return {**loaded_fields, "company_strategy": restored["company_strategy"]}
 
     except Exception as e:
         return set_error(f"State initialization failed: {str(e)}")
 
 
-def create_graph() -> StateGraph:
+def route_after_initialization(state: GraphState) -> str:
+    """Route to the first node that still needs to run"""
+    if state.error:
+        return END
+
+    if not state.resume_from_progress:
+        if state.use_precomputed_analysis and state.company_strategy:
+            return "resume_screener"
+        return "job_analyzer"
+
+    next_node = first_incomplete_node(state.model_dump())
+    if next_node == "resume_tailorer":
+        return route_to_tailoring(state)
+    return next_node
+
+
+def route_to_tailoring(state: GraphState) -> str:
+    """Enter tailoring through gap detection in two_phase mode, unless the fit is too low"""
+    if state.error:
+        return END
+
+    if (
+        state.min_fit_score is not None
+        and state.confidence_score is not None
+        and state.confidence_score < state.min_fit_score
+    ):
+        logging.info(
+            f"[DEBUG] Fit score {state.confidence_score} below {state.min_fit_score}, skipping tailoring"
+        )
+        return END
+
+    if state.tailoring_mode == "two_phase":
+        return "missing_info_detector"
+    return "resume_tailorer"
+
+
+def route_after_detection(state: GraphState) -> str:
+    """Interrupt for missing info, or accept the speculative draft"""
+    if state.error:
+        return END
+
+    if state.missing_info or not state.speculative_draft:
+        return "resume_tailorer"
+    return "keyword_checker"
+
+
+def route_after_tailoring(state: GraphState) -> str:
+    """Check keyword coverage of a successfully tailored resume"""
+    if state.error or not state.tailored_resume:
+        return END
+    return "keyword_checker"
+
+
+def create_graph(checkpointer: Optional[BaseCheckpointSaver] = None) -> StateGraph:
     """
     Creates the main resume tailoring graph with unified state management.
 
     Pipeline:
-    1. initialize_state: Load ALL files using StateDataManager
+    1. initialize_state: Load ALL files using StateDataManager and normalize the job description
+       (with resume_from_progress, jump to the first incomplete node; with a valid
+       precomputed company_strategy, start at resume_screener)
     2. job_analyzer: Analyzes job to extract company strategy and requirements
     3. resume_screener: Evaluates resume from recruiter perspective
+       (ends the run when the fit score is below min_fit_score)
     4. resume_tailorer: Analyzes missing info and generates tailored resume
+       (two_phase: missing_info_detector interrupts early, generation happens once)
+    5. keyword_checker: Local ATS keyword coverage check (no model call)
+
+    Args:
+        checkpointer: Optional checkpoint saver so interrupted runs survive restarts.
+            Leave unset when the LangGraph server provides its own persistence.
 
     Returns:
         Compiled LangGraph ready for execution with checkpointer for interrupts
@@ -70,20 +180,56 @@ def create_graph() -> StateGraph:
     graph_builder.add_node("initialize_state", initialize_state)
     graph_builder.add_node("job_analyzer", job_analyzer)
     graph_builder.add_node("resume_screener", resume_screener)
+    graph_builder.add_node("missing_info_detector", missing_info_detector)
     graph_builder.add_node("resume_tailorer", resume_tailorer)
+    graph_builder.add_node("keyword_checker", keyword_checker)
 
     # Define linear pipeline
     graph_builder.add_edge(START, "initialize_state")
-    graph_builder.add_edge("initialize_state", "job_analyzer")
+    graph_builder.add_conditional_edges(
+        "initialize_state",
+        route_after_initialization,
+        {
+            "job_analyzer": "job_analyzer",
+            "resume_screener": "resume_screener",
+            "missing_info_detector": "missing_info_detector",
+            "resume_tailorer": "resume_tailorer",
+            END: END,
+        },
+    )
     graph_builder.add_edge("job_analyzer", "resume_screener")
-    graph_builder.add_edge("resume_screener", "resume_tailorer")
-    graph_builder.add_edge("resume_tailorer", END)
-
-    return graph_builder.compile()
-
-
-# Create the main graph instance
-graph = create_graph()
+    graph_builder.add_conditional_edges(
+        "resume_screener",
+        route_to_tailoring,
+        {
+            "missing_info_detector": "missing_info_detector",
+            "resume_tailorer": "resume_tailorer",
+            END: END,
+        },
+    )
+    graph_builder.add_conditional_edges(
+        "missing_info_detector",
+        route_after_detection,
+        {"resume_tailorer": "resume_tailorer", "keyword_checker": "keyword_checker", END: END},
+    )
+    graph_builder.add_conditional_edges(
+        "resume_tailorer",
+        route_after_tailoring,
+        {"keyword_checker": "keyword_checker", END: END},
+    )
+    graph_builder.add_edge("keyword_checker", END)
+
+    return graph_builder.compile(checkpointer=checkpointer)
+
+
+def create_durable_graph(db_path: str) -> StateGraph:
+    """Create the graph with a local SQLite checkpointer at db_path"""
+    return create_graph(checkpointer=BlobSqliteSaver(db_path))
+
+
+# Create the main graph instance (durable when a checkpoint database is configured)
+_checkpoint_db_path = os.getenv("RESUME_REWRITE_CHECKPOINT_DB")
+graph = create_durable_graph(_checkpoint_db_path) if _checkpoint_db_path else create_graph()
 
 # Also create with the expected name for compatibility
 resume_rewrite_graph = graph
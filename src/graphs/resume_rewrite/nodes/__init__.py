@@ -6,13 +6,22 @@ Organized node structure with clean imports:
 Analysis Pipeline:
 - job_analyzer: Job description analysis and strategy extraction
 - resume_screener: Recruiter perspective evaluation
+- missing_info_detector: Fast gap detection before generation (two_phase mode)
 - resume_tailorer: Resume customization with user interaction
+- keyword_checker: Deterministic ATS keyword coverage of the tailored resume
 
 State management is handled by StateDataManager for unified operations.
 """
 
 from .job_analyzer import job_analyzer
 from .resume_screener import resume_screener
-from .resume_tailorer import resume_tailorer
+from .resume_tailorer import missing_info_detector, resume_tailorer
+from .keyword_checker import keyword_checker
 
-__all__ = ["job_analyzer", "resume_screener", "resume_tailorer"]
+__all__ = [
+    "job_analyzer",
+    "resume_screener",
+    "missing_info_detector",
+    "resume_tailorer",
+    "keyword_checker",
+]
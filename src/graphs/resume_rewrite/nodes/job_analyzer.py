@@ -3,26 +3,112 @@ Job Analysis Node
 
 Analyzes job descriptions to extract hiring strategy and requirements.
 Pure data processing - no file I/O.
+
+Postings are fingerprinted with MinHash into a cross-user LSH index; when the same
+posting was already analyzed (reposted, saved by another user, lightly edited),
+its company_strategy is reused instead of making a new model call.
+
+The company-wide part of the analysis (culture, values, hiring priorities, decision
+makers) is cached per employer; postings from a cached company only generate the
+role-specific analysis on top of it. The company name is resolved before the cache
+lookup: from the job row, from the posting header, or with a short model call.
 """
 
 import logging
 from typing import Dict, Any
 from langchain_core.runnables import RunnableConfig
+from pydantic import BaseModel, Field
 
 from src.llm_config import model
 from src.graphs.resume_rewrite.state import GraphState, set_error
 from src.tools.state_data_manager import save_processing_result
-from src.utils.node_utils import validate_fields, setup_metadata, handle_error
+from src.tools.job_dedup_store import find_near_duplicate_jobs, find_reusable_analysis
+from src.tools.company_profile_store import load_company_profile, save_company_profile
+from src.graphs.resume_rewrite.pipeline_progress import record_node_completion
+from src.utils.node_utils import (
+    validate_fields,
+    setup_metadata,
+    handle_error,
+    ainvoke_with_continuation,
+)
+from src.utils.text_utils import company_name_from_header
 
 logging.basicConfig(level=logging.DEBUG)
 
+# Near-duplicates at least this similar share one analysis without a model call
+REUSE_SIMILARITY_THRESHOLD = 0.9
+# The employer is named near the top of a posting; only this much is sent to extract it
+COMPANY_NAME_EXCERPT_CHARS = 2000
+COMPANY_NAME_MAX_TOKENS = 50
+# Company profile plus role analysis in one structured call
+JOB_ANALYSIS_MAX_TOKENS = 3000
+ROLE_ANALYSIS_MAX_TOKENS = 1500
+
+COMPANY_ANALYSIS_INSTRUCTIONS = """1. **Company Culture & Values**: What values and culture does this company prioritize?
+
+2. **Hiring Priorities**: What type of candidate are they really looking for beyond the obvious requirements?
+
+3. **Decision Makers**: Who likely makes the hiring decision and what would impress them?"""
+
+ROLE_ANALYSIS_INSTRUCTIONS = """1. **Key Requirements**: What are the must-have vs nice-to-have qualifications?
+
+2. **Success Metrics**: How does this company likely measure success in this role?
+
+3. **Competitive Advantage**: What would make a candidate stand out for this specific role?"""
+
+
+class JobAnalysis(BaseModel):
+    """Structured output splitting company-wide from role-specific analysis"""
+
+    company_name: str = Field(
+        description="Name of the hiring company as stated in the posting, empty if not stated"
+    )
+    company_profile: str = Field(
+        description="Markdown analysis of the company-wide points, valid for any of its postings"
+    )
+    role_analysis: str = Field(description="Markdown analysis of the role-specific points")
+
+
+class CompanyName(BaseModel):
+    """Structured output for the cheap company name lookup"""
+
+    company_name: str = Field(
+        description="Name of the hiring company as stated in the posting, empty if not stated"
+    )
+
+
+async def _extract_company_name(job_description: str, config: RunnableConfig) -> str:
+    """Company name from the posting header, or from a short model call on its start"""
+    company_name = company_name_from_header(job_description)
+    if company_name:
+        return company_name
+
+    prompt = f"""
+Which company is hiring for this job posting? Return its name exactly as written,
+or an empty string if the posting does not name it.
+
+JOB_POSTING_START:
+{job_description[:COMPANY_NAME_EXCERPT_CHARS]}
+"""
+    model_with_structure = model.with_structured_output(CompanyName)
+    result = await model_with_structure.ainvoke(
+        prompt, config=config, max_tokens=COMPANY_NAME_MAX_TOKENS
+    )
+    return result.company_name.strip() if result else ""
+
+
+def _combine_analysis(company_profile: str, role_analysis: str) -> str:
+    return f"{company_profile.strip()}\n\n{role_analysis.strip()}"
+
 
 async def job_analyzer(state: GraphState, config: RunnableConfig) -> Dict[str, Any]:
     """
     Analyzes job posting to understand company hiring strategy and requirements.
 
     Input: job_description (loaded by data_loader)
-    Output: company_strategy (strategic analysis and company insights)
+    Output: company_strategy (strategic analysis and company insights),
+        near_duplicate_jobs (postings similar enough to offer their analysis),
+        company_name (extracted from the posting when not set on the job)
 
     Args:
         state: Graph state containing job description
@@ -45,39 +131,139 @@ async def job_analyzer(state: GraphState, config: RunnableConfig) -> Dict[str, A
         # Setup metadata
         setup_metadata(config, "job_analyzer", user_id, job_id)
 
-        prompt = f"""
+        near_duplicates = []
+        if state.reuse_duplicate_analysis:
+            try:
+                matches = await find_near_duplicate_jobs(job_id, job_description)
+                near_duplicates = [
+                    {"job_id": duplicate_id, "similarity": round(similarity, 3)}
+                    for duplicate_id, similarity in matches
+                ]
+                reusable = await find_reusable_analysis(
+                    [m for m in matches if m[1] >= REUSE_SIMILARITY_THRESHOLD]
+                )
+            except Exception as e:
+                logging.warning(f"[JobAnalyzer] Near-duplicate lookup failed: {e}")
+                reusable = None
+
+            if reusable:
+                duplicate_id, similarity, company_strategy = reusable
+                logging.debug(
+                    f"[JobAnalyzer] Reusing analysis of job {duplicate_id} "
+                    f"(similarity {similarity:.2f})"
+                )
+                saved = await save_processing_result(
+                    user_id, job_id, "company_strategy", company_strategy
+                )
+                if saved:
+                    await record_node_completion(
+                        user_id, job_id, "job_analyzer", {"job_description": job_description}
+                    )
+                return {
+                    "company_strategy": company_strategy,
+                    "near_duplicate_jobs": near_duplicates,
+                }
+
+        company_name = state.company_name
+        company_profile = None
+        if state.cache_company_profile:
+            # Resolve the employer before the lookup so jobs without a stored name hit the cache
+            if not company_name:
+                try:
+                    company_name = await _extract_company_name(job_description, config)
+                except Exception as e:
+                    logging.warning(f"[JobAnalyzer] Company name extraction failed: {e}")
+                if company_name:
+                    await save_processing_result(user_id, job_id, "company_name", company_name)
+            company_profile = await load_company_profile(company_name)
+
+        if company_profile:
+            # Company section is cached; only the role-specific delta is generated
+            prompt = f"""
 You are a strategic analyst helping someone understand a company's hiring priorities.
 
-Analyze this job posting and provide a comprehensive strategic analysis:
+The company-wide analysis below is already known. Do not repeat it. Analyze only what
+is specific to this role:
+
+{ROLE_ANALYSIS_INSTRUCTIONS}
+
+Provide actionable insights that help understand the company's hiring strategy for this role.
+
+COMPANY_PROFILE:
+{company_profile}
 
-1. **Company Culture & Values**: What values and culture does this company prioritize?
+JOB_DESCRIPTION:
+{job_description}
+"""
+            role_analysis, _ = await ainvoke_with_continuation(
+                model, prompt, config, ROLE_ANALYSIS_MAX_TOKENS
+            )
+            company_strategy = _combine_analysis(company_profile, role_analysis)
+        else:
+            prompt = f"""
+You are a strategic analyst helping someone understand a company's hiring priorities.
 
-2. **Key Requirements**: What are the must-have vs nice-to-have qualifications?
+Analyze this job posting and provide a comprehensive strategic analysis in two parts.
 
-3. **Success Metrics**: How does this company likely measure success in this role?
+Company profile (company-wide, must hold for any posting of this company):
 
-4. **Hiring Priorities**: What type of candidate are they really looking for beyond the obvious requirements?
+{COMPANY_ANALYSIS_INSTRUCTIONS}
 
-5. **Decision Makers**: Who likely makes the hiring decision and what would impress them?
+Role analysis (specific to this posting):
 
-6. **Competitive Advantage**: What would make a candidate stand out for this specific role?
+{ROLE_ANALYSIS_INSTRUCTIONS}
 
 Provide actionable insights that help understand the company's hiring strategy.
 
 JOB_DESCRIPTION:
 {job_description}
 """
+            model_with_structure = model.with_structured_output(JobAnalysis, include_raw=True)
+            output = await model_with_structure.ainvoke(
+                prompt, config=config, max_tokens=JOB_ANALYSIS_MAX_TOKENS
+            )
+            analysis = output.get("parsed") if output else None
 
-        # Generate company strategy using simple model call
-        response = await model.ainvoke(prompt, config=config)
-        company_strategy = response.content
+            if (
+                analysis is None
+                or not analysis.company_profile.strip()
+                or not analysis.role_analysis.strip()
+            ):
+                # Truncated or unparsed tool call: fall back to the plain text analysis,
+                # which cannot be split into a cacheable company profile
+                logging.warning(
+                    f"[JobAnalyzer] Structured analysis unavailable "
+                    f"({output.get('parsing_error') if output else 'no output'}), using plain text"
+                )
+                company_strategy, _ = await ainvoke_with_continuation(
+                    model, prompt, config, JOB_ANALYSIS_MAX_TOKENS
+                )
+            else:
+                company_strategy = _combine_analysis(
+                    analysis.company_profile, analysis.role_analysis
+                )
+                if not company_name and analysis.company_name.strip():
+                    company_name = analysis.company_name.strip()
+                    await save_processing_result(user_id, job_id, "company_name", company_name)
+                if state.cache_company_profile:
+                    await save_company_profile(company_name, analysis.company_profile, job_id)
 
         # Save to storage using StateDataManager
-        await save_processing_result(user_id, job_id, "company_strategy", company_strategy)
+        saved = await save_processing_result(
+            user_id, job_id, "company_strategy", company_strategy
+        )
+        if saved:
+            await record_node_completion(
+                user_id, job_id, "job_analyzer", {"job_description": job_description}
+            )
 
         logging.debug(f"[DEBUG] Company strategy generated: {len(company_strategy)} chars")
 
-        return {"company_strategy": company_strategy}
+        return {
+            "company_strategy": company_strategy,
+            "company_name": company_name,
+            "near_duplicate_jobs": near_duplicates,
+        }
 
     except Exception as e:
         return handle_error(e, "job_analyzer")
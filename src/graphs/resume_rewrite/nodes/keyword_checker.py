@@ -0,0 +1,60 @@
+"""
+Keyword Checker Node
+
+Measures ATS keyword coverage of the tailored resume against the job description
+with the local keyword engine. Deterministic - no model calls - so misses are
+caught before any LLM judge runs.
+"""
+
+import logging
+from typing import Dict, Any
+from langchain_core.runnables import RunnableConfig
+
+from src.graphs.resume_rewrite.state import GraphState
+from src.utils.keyword_matcher import keyword_coverage
+from src.utils.node_utils import validate_fields, setup_metadata, handle_error
+
+logging.basicConfig(level=logging.DEBUG)
+
+
+async def keyword_checker(state: GraphState, config: RunnableConfig) -> Dict[str, Any]:
+    """
+    Reports which job description keywords the tailored resume covers.
+
+    Input: job_description, tailored_resume
+    Output: keyword_coverage (keywords, covered, missing, coverage ratio)
+
+    Args:
+        state: Graph state with the tailored resume
+        config: LangChain runnable config
+
+    Returns:
+        Dictionary with keyword_coverage or error state
+    """
+    try:
+        error_msg = validate_fields(
+            state, ["job_description", "tailored_resume"], "keyword check"
+        )
+        if error_msg:
+            return {"error": error_msg}
+
+        # Setup metadata
+        setup_metadata(config, "keyword_checker", state.user_id, state.job_id)
+
+        result = keyword_coverage(state.job_description, state.tailored_resume)
+
+        logging.debug(
+            f"[DEBUG] Keyword coverage {result.coverage:.0%}: missing {result.missing}"
+        )
+
+        return {
+            "keyword_coverage": {
+                "keywords": result.keywords,
+                "covered": result.covered,
+                "missing": result.missing,
+                "coverage": round(result.coverage, 3),
+            }
+        }
+
+    except Exception as e:
+        return handle_error(e, "keyword_checker")
@@ -3,26 +3,68 @@ Resume Screening Node
 
 Evaluates resumes from a recruiter's perspective against job requirements.
 Pure data processing - no file I/O.
+
+The evaluation is structured (fit score, must-have gaps, strengths, rationale) and
+rendered as compact markdown for recruiter_feedback, so downstream prompts stay small.
+The fit score is persisted as the job's confidence_score.
 """
 
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List, Literal
 from langchain_core.runnables import RunnableConfig
+from pydantic import BaseModel, Field
 
 from src.llm_config import model
 from src.graphs.resume_rewrite.state import GraphState, set_error
 from src.tools.state_data_manager import save_processing_result
+from src.graphs.resume_rewrite.pipeline_progress import record_node_completion
 from src.utils.node_utils import validate_fields, setup_metadata, handle_error
 
 logging.basicConfig(level=logging.DEBUG)
 
+SCREENING_MAX_TOKENS = 1024
+
+
+class ScreeningResult(BaseModel):
+    """Structured output for recruiter screening"""
+
+    fit_score: int = Field(
+        ge=0, le=100, description="Overall fit for the role from 0 (no fit) to 100 (ideal)"
+    )
+    recommendation: Literal["advance", "consider", "reject"] = Field(
+        description="Screening decision"
+    )
+    must_have_gaps: List[str] = Field(
+        default_factory=list,
+        description="Must-have requirements the resume does not demonstrate (short phrases)",
+    )
+    strengths: List[str] = Field(
+        default_factory=list,
+        description="Strongest matches with the role (short phrases)",
+    )
+    rationale: str = Field(description="Two or three sentences justifying the decision")
+
+
+def render_recruiter_feedback(result: ScreeningResult) -> str:
+    """Render the screening result as compact markdown for storage and prompts"""
+    lines = [
+        f"**Fit score:** {result.fit_score}/100 ({result.recommendation})",
+        "",
+        f"**Rationale:** {result.rationale.strip()}",
+    ]
+    if result.strengths:
+        lines += ["", "**Strengths:**"] + [f"- {item}" for item in result.strengths]
+    if result.must_have_gaps:
+        lines += ["", "**Must-have gaps:**"] + [f"- {item}" for item in result.must_have_gaps]
+    return "\n".join(lines)
+
 
 async def resume_screener(state: GraphState, config: RunnableConfig) -> Dict[str, Any]:
     """
     Screens resume from recruiter perspective against job requirements.
 
     Input: original_resume, job_description, company_strategy (all loaded by data_loader)
-    Output: recruiter_feedback (analysis and recommendations)
+    Output: recruiter_feedback (compact analysis), confidence_score (fit score 0-100)
 
     Args:
         state: Graph state with required inputs loaded
@@ -54,13 +96,14 @@ You are a professional recruiter evaluating candidates for a specific role.
 
 Assess the resume below against the job description and strategic analysis. Consider that you have hundreds of candidates and need to be selective.
 
-Provide a comprehensive markdown analysis with:
-- Pros and cons of this candidate
-- Clear reasoning for accept/reject recommendation
-- Specific areas where candidate excels or falls short
-- Well-reasoned justification for your decision
+Provide a structured evaluation with:
+- fit_score: 0-100, where 70+ means you would advance the candidate
+- recommendation: advance, consider or reject
+- must_have_gaps: must-have requirements the resume does not demonstrate
+- strengths: where the candidate clearly matches the role
+- rationale: a short, well-reasoned justification for your decision
 
-Be thorough and professional in your evaluation.
+Be rigorous and concise - list items are short phrases, not paragraphs.
 
 RESUME:
 {original_resume}
@@ -72,20 +115,40 @@ STRATEGIC_ANALYSIS:
 {company_strategy}
 """
 
-        # Generate recruiter feedback using simple model call
-        response = await model.ainvoke(prompt, config=config)
-        recruiter_feedback = response.content
+        # Generate structured screening result
+        model_with_structure = model.with_structured_output(ScreeningResult)
+        result = await model_with_structure.ainvoke(
+            prompt, config=config, max_tokens=SCREENING_MAX_TOKENS
+        )
+        recruiter_feedback = render_recruiter_feedback(result)
 
         # Save to storage using StateDataManager
-        await save_processing_result(
+        saved = await save_processing_result(
             user_id, job_id, "recruiter_feedback", recruiter_feedback
         )
+        await save_processing_result(
+            user_id, job_id, "confidence_score", str(result.fit_score)
+        )
+        if saved:
+            await record_node_completion(
+                user_id,
+                job_id,
+                "resume_screener",
+                {
+                    "original_resume": original_resume,
+                    "job_description": job_description,
+                    "company_strategy": company_strategy,
+                },
+            )
 
         logging.debug(
-            f"[DEBUG] Recruiter feedback generated: {len(recruiter_feedback)} chars"
+            f"[DEBUG] Recruiter feedback generated: fit score {result.fit_score}, {len(recruiter_feedback)} chars"
         )
 
-        return {"recruiter_feedback": recruiter_feedback}
+        return {
+            "recruiter_feedback": recruiter_feedback,
+            "confidence_score": result.fit_score,
+        }
 
     except Exception as e:
         return handle_error(e, "resume_screener")
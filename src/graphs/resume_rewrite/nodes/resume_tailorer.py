@@ -3,23 +3,87 @@ Resume Tailoring Node
 
 Tailors resumes to specific jobs using analysis results and user interaction.
 Tracks missing information persistently to reduce hallucinations and support iterative improvements.
+
+Two tailoring modes are supported (GraphState.tailoring_mode):
+- single_pass: one call detects missing info AND generates the resume, then interrupts
+- two_phase: missing_info_detector runs a short gap-detection call first and interrupts
+  before any full generation; resume_tailorer then generates the resume exactly once
+
+With GraphState.section_parallel, generation is split per section of the original
+resume (summary, each experience entry, skills, projects, ...), the sections are
+tailored concurrently with the same shared context and stitched back in order.
+
+Facts the user answered for earlier jobs (GraphState.user_facts) are included in every
+prompt, and missing-info items they already answer never trigger an interrupt.
+
+With GraphState.dedupe_full_resume, prompts carry only the full-resume material that is
+not already in the original resume, instead of both documents in full.
+
+The single-call tailoring prompt starts with the job description and company strategy
+as a prompt-cache breakpoint (node_utils.job_context_prefix), shared verbatim with the
+cover letter graph.
 """
 
+import asyncio
 import logging
 import json
-from typing import Dict, Any, List
+import re
+from typing import Dict, Any, List, Optional, Tuple, Union
 from langchain_core.runnables import RunnableConfig
 from pydantic import BaseModel, Field
 
-from src.llm_config import model
+from src.llm_config import model, get_llm_limiter
 from src.graphs.resume_rewrite.state import GraphState
 from src.tools.state_data_manager import save_processing_result
-from src.utils.node_utils import validate_fields, setup_metadata, handle_error
+from src.tools.user_fact_store import split_answered, format_known_facts
+from src.utils.node_utils import (
+    validate_fields,
+    setup_metadata,
+    handle_error,
+    ainvoke_with_continuation,
+    cached_prefix_message,
+    gather_with_limit,
+    job_context_prefix,
+)
+from src.utils.markdown_sections import split_sections, split_entries, join_blocks
+from src.utils.resume_overlap import OverlapResult, full_resume_supplement
+from src.utils.resume_artifacts import ResumeArtifacts
+from src.utils.text_utils import estimate_tokens
 from langgraph.types import interrupt
 from langgraph.errors import GraphInterrupt
 
 logging.basicConfig(level=logging.DEBUG)
 
+# Output budgets: tailoring is sized from the input resume, gap detection is fixed
+TAILORING_MIN_TOKENS = 4000
+TAILORING_MAX_TOKENS = 8192
+TAILORING_MAX_CONTINUATIONS = 3
+GAP_DETECTION_MAX_TOKENS = 512
+SECTION_MIN_TOKENS = 1024
+
+# Sections whose entries (jobs, projects, ...) are tailored one call per entry
+ENTRY_SECTION_PATTERN = re.compile(
+    r"experience|employment|work history|projects|leadership|volunteer", re.IGNORECASE
+)
+
+REQUIRED_FIELDS = [
+    "original_resume",
+    "full_resume",
+    "job_description",
+    "company_strategy",
+    "recruiter_feedback",
+]
+
+MISSING_INFO_GUIDELINES = """MISSING INFO ANALYSIS:
+Consider what's missing for optimal job matching:
+- Missing relevant skills/technologies mentioned in job
+- Lack of quantifiable achievements matching requirements
+- Missing industry experience or certifications
+- Absence of required leadership/project examples
+
+Be conservative with missing info - only flag things that would significantly impact application success.
+Never flag anything already answered in KNOWN_USER_FACTS."""
+
 
 class ResumeAnalysisAndGeneration(BaseModel):
     """Structured output for resume analysis and generation"""
@@ -30,12 +94,32 @@ class ResumeAnalysisAndGeneration(BaseModel):
     tailored_resume: str = Field(description="The tailored resume in markdown format")
 
 
+class SectionTailoringResult(BaseModel):
+    """Structured output for tailoring a single resume section"""
+
+    missing_info: List[str] = Field(
+        description="Missing information that would significantly improve this section"
+    )
+    tailored_section: str = Field(
+        description="The tailored section in markdown, starting with its original heading/title line"
+    )
+
+
+class MissingInfoAnalysis(BaseModel):
+    """Structured output for the fast gap-detection pass"""
+
+    missing_info: List[str] = Field(
+        description="List of specific missing information/experiences that would significantly improve the application"
+    )
+
+
 class InterruptData(BaseModel):
     """Typed data sent to client when missing info is detected"""
 
     missing_info: List[str] = Field(description="List of specific missing information")
     tailored_resume: str = Field(
-        description="Current tailored resume generated with available info"
+        default="",
+        description="Current tailored resume generated with available info (empty in two_phase mode)",
     )
     user_id: str = Field(description="User identifier for context")
     job_id: str = Field(description="Job identifier for context")
@@ -51,58 +135,89 @@ class InfoCollectionResult(BaseModel):
     updated_full_resume: str = Field(description="Updated full resume with new info")
 
 
-async def resume_tailorer(state: GraphState, config: RunnableConfig) -> Dict[str, Any]:
-    """
-    Tailors resume for specific job using analysis results with persistent missing info tracking.
+def _full_resume_overlap(state: GraphState, full_resume: str) -> OverlapResult:
+    """Overlap of full and original resume, from the precomputed artifacts when current"""
+    if state.resume_artifacts:
+        artifacts = ResumeArtifacts.model_validate(state.resume_artifacts)
+        if artifacts.is_current(state.original_resume, full_resume):
+            return artifacts.overlap()
+    return full_resume_supplement(state.original_resume, full_resume)
 
-    Input: original_resume, full_resume, job_description, company_strategy, recruiter_feedback
-    Output: tailored_resume, missing_info (persistent context)
 
-    Approach:
-    1. Single AI call that analyzes missing info AND generates resume
-    2. If missing_info found → interrupt with current resume + missing info
-    3. On resume → restart entire node from top with new info
-    4. Always produces resume output regardless of gaps
+def _render_full_resume(state: GraphState, full_resume: str) -> str:
+    """Full resume section of the prompt, minus material already in ORIGINAL_RESUME"""
+    if not state.dedupe_full_resume or not state.original_resume:
+        return f"FULL_RESUME:\n{full_resume}"
 
-    Args:
-        state: Graph state with all analysis results and data loaded
-        config: LangChain runnable config
+    overlap = _full_resume_overlap(state, full_resume)
+    return f"""FULL_RESUME_ADDITIONS (material from the user's full resume that is NOT already in
+ORIGINAL_RESUME - the full resume is ORIGINAL_RESUME plus these additions):
+{overlap.supplement or "None - everything is already in ORIGINAL_RESUME"}"""
 
-    Returns:
-        Dictionary with tailored_resume and updated missing_info
+
+def _record_prompt_savings(state: GraphState, full_resume: str, config: RunnableConfig) -> None:
+    """Log and attach to run metadata how many tokens deduplication saves per prompt"""
+    if not state.dedupe_full_resume or not state.original_resume or not full_resume:
+        return
+
+    overlap = _full_resume_overlap(state, full_resume)
+    logging.info(
+        f"[DEBUG] Full resume deduplicated: {overlap.duplicate_blocks}/{overlap.total_blocks} blocks "
+        f"already in original, ~{overlap.saved_tokens} tokens saved per prompt"
+    )
+    config.setdefault("metadata", {}).update(
+        {
+            "full_resume_tokens": overlap.full_tokens,
+            "full_resume_tokens_sent": overlap.supplement_tokens,
+            "full_resume_tokens_saved": overlap.saved_tokens,
+        }
+    )
+
+
+def _build_context_sections(
+    state: GraphState, full_resume: str, additional_info: str, include_job: bool = True
+) -> str:
     """
-    try:
-        # Validate required fields using dot notation
-        required = [
-            "original_resume",
-            "full_resume",
-            "job_description",
-            "company_strategy",
-            "recruiter_feedback",
-        ]
-        error_msg = validate_fields(state, required, "tailoring")
-        if error_msg:
-            return {"error": error_msg}
+    Render the shared input sections used by every tailoring prompt.
 
-        # Extract fields using type-safe dot notation
-        user_id = state.user_id
-        job_id = state.job_id
-        original_resume = state.original_resume
-        full_resume = state.full_resume
-        job_description = state.job_description
-        company_strategy = state.company_strategy
-        recruiter_feedback = state.recruiter_feedback
+    With include_job=False the job description and company strategy are left out,
+    because the caller sends them first as the cached job_context_prefix.
+    """
+    known_facts = ""
+    if state.user_facts:
+        known_facts = f"""
 
-        # Setup metadata
-        setup_metadata(config, "resume_tailorer", user_id, job_id)
+KNOWN_USER_FACTS (answered by the user for earlier jobs, use where relevant):
+{format_known_facts(state.user_facts)}"""
 
-        # Initialize with current full resume
-        additional_info = ""
-        working_full_resume = full_resume
+    return f"""RECRUITER_FEEDBACK:
+{state.recruiter_feedback}
+
+ORIGINAL_RESUME:
+{state.original_resume}
+
+{_render_full_resume(state, full_resume)}
+
+ADDITIONAL_COLLECTED_INFO:
+{additional_info}{known_facts}""" + (
+        f"\n\n{job_context_prefix(state.job_description, state.company_strategy)}"
+        if include_job
+        else ""
+    )
+
+
+def _build_tailoring_prompt(
+    state: GraphState, full_resume: str, additional_info: str
+) -> str:
+    """
+    Build the prompt that analyzes missing info AND generates the tailored resume.
 
-        # Single AI call: Analyze missing info AND generate tailored resume
-        prompt = f"""
-You are a professional resume expert. Your task is to:
+    The job description and company strategy are not included: they are sent before
+    this prompt as the cached job_context_prefix shared with the cover letter call.
+    """
+    return f"""
+You are a professional resume expert. Using the JOB_DESCRIPTION and COMPANY_STRATEGY
+above, your task is to:
 1. Identify what critical information is missing for optimal job tailoring
 2. Generate the best possible tailored resume using available information
 
@@ -111,14 +226,7 @@ CRITICAL INSTRUCTIONS:
 - You MUST provide tailored_resume (complete resume)
 - NEVER return only one field - always return both
 
-MISSING INFO ANALYSIS:
-Consider what's missing for optimal job matching:
-- Missing relevant skills/technologies mentioned in job
-- Lack of quantifiable achievements matching requirements
-- Missing industry experience or certifications
-- Absence of required leadership/project examples
-
-Be conservative with missing info - only flag things that would significantly impact application success.
+{MISSING_INFO_GUIDELINES}
 
 RESUME GENERATION:
 Create a complete tailored resume:
@@ -129,23 +237,7 @@ Create a complete tailored resume:
 - DO NOT invent information to fill gaps - work with what you have
 - Focus on strongest available experiences if missing critical info
 
-RECRUITER_FEEDBACK:
-{recruiter_feedback}
-
-ORIGINAL_RESUME:
-{original_resume}
-
-FULL_RESUME:
-{working_full_resume}
-
-ADDITIONAL_COLLECTED_INFO:
-{additional_info}
-
-JOB_DESCRIPTION:
-{job_description}
-
-COMPANY_STRATEGY:
-{company_strategy}
+{_build_context_sections(state, full_resume, additional_info, include_job=False)}
 
 REQUIRED OUTPUT FORMAT:
 You MUST return a valid JSON object with exactly this structure:
@@ -166,85 +258,481 @@ CRITICAL JSON REQUIREMENTS:
 BOTH FIELDS ARE MANDATORY - DO NOT OMIT EITHER ONE.
 """
 
-        # Use structured output for reliable parsing with increased token limit for long resumes
-        model_with_structure = model.with_structured_output(ResumeAnalysisAndGeneration)
-        
+
+def _build_gap_detection_prompt(state: GraphState) -> str:
+    """Build the short prompt that only lists missing information"""
+    return f"""
+You are a professional resume expert preparing to tailor a resume for a job.
+
+Before any resume is written, identify what critical information is missing for optimal
+job tailoring. DO NOT write the resume - only list the missing information.
+
+{MISSING_INFO_GUIDELINES}
+
+{_build_context_sections(state, state.full_resume, "")}
+
+Return missing_info as an array of short, specific strings (can be empty []).
+"""
+
+
+def _build_section_prompt(
+    state: GraphState,
+    full_resume: str,
+    additional_info: str,
+    outline: str,
+    section_markdown: str,
+) -> str:
+    """Build the prompt that tailors one section; the shared context comes first"""
+    return f"""
+{_build_context_sections(state, full_resume, additional_info)}
+
+You are a professional resume expert tailoring ONE part of the ORIGINAL_RESUME above for
+this job. The other parts are tailored separately and merged afterwards, so only rewrite
+the part below and do not repeat content that belongs to other sections.
+
+RESUME GENERATION:
+- SHOW DON'T TELL: Write about experiences matching job requirements
+- Use quantifiable achievements and evidence-backed claims
+- Include job description keywords for ATS optimization
+- Never fabricate experiences or mischaracterize background
+- DO NOT invent information to fill gaps - work with what you have
+- Keep the first heading/title line of the part unchanged
+
+{MISSING_INFO_GUIDELINES}
+Only list missing info that concerns this part (can be empty []).
+
+RESUME_OUTLINE:
+{outline}
+
+PART_TO_TAILOR:
+{section_markdown}
+"""
+
+
+def _plan_sections(original_resume: str) -> Tuple[List[Union[str, int]], List[str]]:
+    """
+    Split the original resume into independently tailored units.
+
+    Returns:
+        Tuple of (layout, units). The layout lists, in document order, either literal
+        markdown kept as-is (contact header, section headings of split sections) or
+        the index of a unit to be replaced by its tailored version.
+    """
+    layout: List[Union[str, int]] = []
+    units: List[str] = []
+
+    for section in split_sections(original_resume):
+        if section.level == 0:
+            # Name and contact details are kept verbatim
+            layout.append(section.markdown)
+            continue
+
+        if ENTRY_SECTION_PATTERN.search(section.heading):
+            intro, entries = split_entries(section)
+            if entries:
+                layout.append(join_blocks([section.heading_line, intro]))
+                for entry in entries:
+                    layout.append(len(units))
+                    units.append(entry)
+                continue
+
+        layout.append(len(units))
+        units.append(section.markdown)
+
+    return layout, units
+
+
+def _assemble_sections(
+    layout: List[Union[str, int]],
+    units: List[str],
+    results: List[Optional[SectionTailoringResult]],
+) -> ResumeAnalysisAndGeneration:
+    """
+    Deterministically stitch tailored units back in order and merge missing info.
+
+    A unit whose call returned no result (or an empty section) keeps its original text.
+    """
+    blocks = [
+        block
+        if isinstance(block, str)
+        else (results[block] and results[block].tailored_section) or units[block]
+        for block in layout
+    ]
+
+    missing_info: List[str] = []
+    seen = set()
+    for result in results:
+        if result is None:
+            continue
+        for item in result.missing_info:
+            key = " ".join(item.lower().split())
+            if key and key not in seen:
+                seen.add(key)
+                missing_info.append(item)
+
+    return ResumeAnalysisAndGeneration(
+        missing_info=missing_info, tailored_resume=join_blocks(blocks)
+    )
+
+
+async def _generate_by_section(
+    state: GraphState, full_resume: str, additional_info: str, config: RunnableConfig
+) -> Optional[ResumeAnalysisAndGeneration]:
+    """
+    Tailor each section of the original resume concurrently.
+
+    A section whose call fails keeps its original text; if every call fails the
+    caller falls back to single-pass tailoring.
+
+    Returns:
+        Merged result, or None if the resume has too few sections to split or no
+        section could be tailored
+    """
+    layout, units = _plan_sections(state.original_resume)
+    if len(units) < 2:
+        return None
+
+    outline = "\n".join(
+        section.heading_line for section in split_sections(state.original_resume)
+        if section.heading_line
+    )
+    model_with_structure = model.with_structured_output(SectionTailoringResult)
+    calls = [
+        model_with_structure.ainvoke(
+            _build_section_prompt(state, full_resume, additional_info, outline, unit),
+            config=config,
+            max_tokens=max(SECTION_MIN_TOKENS, estimate_tokens(unit) * 2 + 300),
+        )
+        for unit in units
+    ]
+    results = await gather_with_limit(calls, get_llm_limiter(), return_exceptions=True)
+
+    failed = [index for index, result in enumerate(results) if isinstance(result, BaseException)]
+    for index in failed:
+        logging.warning(f"[DEBUG] Tailoring section {index} failed: {results[index]}")
+        results[index] = None
+    if len(failed) == len(units):
+        return None
+
+    logging.debug(f"[DEBUG] Tailored {len(units) - len(failed)}/{len(units)} resume sections concurrently")
+    return _assemble_sections(layout, units, results)
+
+
+async def _generate_tailoring(
+    state: GraphState, full_resume: str, additional_info: str, config: RunnableConfig
+) -> ResumeAnalysisAndGeneration:
+    """Generate the tailored resume with the configured generation strategy"""
+    if state.section_parallel:
+        result = await _generate_by_section(state, full_resume, additional_info, config)
+        if result:
+            return result
+        logging.debug("[DEBUG] Section tailoring unavailable, tailoring in one call")
+
+    return await _generate_tailored_resume(
+        _build_tailoring_prompt(state, full_resume, additional_info),
+        config,
+        _output_token_budget(state),
+        prefix=job_context_prefix(state.job_description, state.company_strategy),
+    )
+
+
+def _output_token_budget(state: GraphState) -> int:
+    """
+    Size the tailoring output budget from the input resume length.
+
+    The tailored resume is roughly as long as the original one, plus JSON escaping
+    and the missing_info list. Anything beyond the budget is handled by continuation.
+    """
+    estimate = int(estimate_tokens(state.original_resume) * 1.5) + 1000
+    return max(TAILORING_MIN_TOKENS, min(TAILORING_MAX_TOKENS, estimate))
+
+
+def _parse_tailoring_output(text: str) -> ResumeAnalysisAndGeneration:
+    """Parse the JSON object from a (possibly fenced) text response"""
+    start, end = text.find("{"), text.rfind("}")
+    if start == -1 or end <= start:
+        raise ValueError("No JSON object found in tailoring response")
+    # strict=False tolerates raw newlines inside the markdown string
+    return ResumeAnalysisAndGeneration.model_validate(
+        json.loads(text[start : end + 1], strict=False)
+    )
+
+
+async def _generate_tailored_resume(
+    prompt: str,
+    config: RunnableConfig,
+    max_tokens: int = TAILORING_MIN_TOKENS,
+    prefix: Optional[str] = None,
+) -> ResumeAnalysisAndGeneration:
+    """
+    Run the tailoring call, continuing generation if it is cut off at max_tokens.
+
+    The JSON is generated as plain text so a truncated response can be continued and
+    stitched together. Structured output is only used as a fallback when the stitched
+    text is not valid JSON for another reason.
+    """
+    text, continuations = await ainvoke_with_continuation(
+        model, prompt, config, max_tokens, TAILORING_MAX_CONTINUATIONS, prefix=prefix
+    )
+    try:
+        result = _parse_tailoring_output(text)
+        if continuations:
+            logging.info(f"[DEBUG] Tailored resume stitched from {continuations + 1} parts")
+        return result
+    except Exception as error:
+        logging.warning(
+            f"[DEBUG] Could not parse tailoring JSON ({error}), falling back to structured output"
+        )
+
+    model_with_structure = model.with_structured_output(ResumeAnalysisAndGeneration)
+    return await model_with_structure.ainvoke(
+        [cached_prefix_message(prefix, prompt)] if prefix else prompt,
+        config=config,
+        max_tokens=TAILORING_MAX_TOKENS,
+    )
+
+
+async def _detect_missing_info(state: GraphState, config: RunnableConfig) -> List[str]:
+    """Run the short structured gap-detection call"""
+    model_with_structure = model.with_structured_output(MissingInfoAnalysis)
+    result = await model_with_structure.ainvoke(
+        _build_gap_detection_prompt(state),
+        config=config,
+        max_tokens=GAP_DETECTION_MAX_TOKENS,
+    )
+    return result.missing_info if result else []
+
+
+def _unanswered(state: GraphState, missing_info: List[str]) -> List[str]:
+    """Drop missing-info items the user's fact store already answers"""
+    answered, unanswered = split_answered(state.user_facts, missing_info)
+    if answered:
+        logging.info(
+            f"[DEBUG] Suppressing {len(answered)} missing info items answered for earlier jobs: {list(answered)}"
+        )
+    return unanswered
+
+
+def _parse_collection_result(collection_result: Any) -> Optional[InfoCollectionResult]:
+    """Validate the value the client resumed the interrupt with"""
+    if not collection_result:
+        logging.info("[DEBUG] No collection result provided, using original resume")
+        return None
+
+    try:
+        # Parse JSON string if needed
+        if isinstance(collection_result, str):
+            collection_result = json.loads(collection_result)
+        return InfoCollectionResult.model_validate(collection_result)
+    except Exception as e:
+        logging.warning(f"[DEBUG] Invalid collection result: {e}, using original resume")
+        return None
+
+
+async def missing_info_detector(
+    state: GraphState, config: RunnableConfig
+) -> Dict[str, Any]:
+    """
+    First phase of two_phase tailoring: detects missing info before generating anything.
+
+    Input: original_resume, full_resume, job_description, company_strategy, recruiter_feedback
+    Output: missing_info, plus tailored_resume when nothing is missing
+
+    Approach:
+    1. Short structured gap-detection call (small output budget → fast time-to-interrupt)
+    2. If speculative_draft is set, a full draft generation runs in parallel
+    3. Gaps found → draft is cancelled and resume_tailorer interrupts immediately
+    4. No gaps → the draft is the final tailored resume, no second generation needed
+
+    Args:
+        state: Graph state with all analysis results and data loaded
+        config: LangChain runnable config
+
+    Returns:
+        Dictionary with missing_info (and tailored_resume if complete)
+    """
+    try:
+        error_msg = validate_fields(state, REQUIRED_FIELDS, "missing info detection")
+        if error_msg:
+            return {"error": error_msg}
+
+        user_id = state.user_id
+        job_id = state.job_id
+
+        # Setup metadata
+        setup_metadata(config, "missing_info_detector", user_id, job_id)
+        _record_prompt_savings(state, state.full_resume, config)
+
+        draft_task = None
+        if state.speculative_draft:
+            draft_task = asyncio.create_task(
+                _generate_tailoring(state, state.full_resume, "", config)
+            )
+
         try:
-            # Increase max_tokens for long resume content
-            result = await model_with_structure.ainvoke(prompt, config=config, max_tokens=4000)
+            missing_info = _unanswered(state, await _detect_missing_info(state, config))
+        except Exception:
+            if draft_task:
+                draft_task.cancel()
+            raise
+
+        if missing_info:
+            logging.info(f"[DEBUG] Gap detection found missing info: {missing_info}")
+            if draft_task:
+                draft_task.cancel()
+            return {"missing_info": missing_info}
+
+        if draft_task is None:
+            # Nothing missing - let resume_tailorer generate the single final version
+            return {"missing_info": []}
+
+        try:
+            result = await draft_task
         except Exception as error:
             logging.error(f"[ERROR] Structured output failed: {error}")
             return {"error": f"Failed to generate resume analysis: {error}"}
 
+        await save_processing_result(
+            user_id, job_id, "tailored_resume", result.tailored_resume
+        )
+
         logging.debug(
-            f"[DEBUG] Generated resume with {len(result.missing_info) if result and result.missing_info else 0} missing items identified"
+            f"[DEBUG] No missing info, speculative draft accepted: {len(result.tailored_resume)} chars"
         )
 
-        # If we have missing info, interrupt to let client decide whether to collect more info
-        if result.missing_info:
-            logging.info(
-                f"[DEBUG] Missing critical info detected, interrupting: {result.missing_info}"
-            )
+        return {"tailored_resume": result.tailored_resume, "missing_info": []}
+
+    except Exception as e:
+        return handle_error(e, "missing_info_detector")
+
+
+async def resume_tailorer(state: GraphState, config: RunnableConfig) -> Dict[str, Any]:
+    """
+    Tailors resume for specific job using analysis results with persistent missing info tracking.
+
+    Input: original_resume, full_resume, job_description, company_strategy, recruiter_feedback
+    Output: tailored_resume, missing_info (persistent context)
+
+    Approach (single_pass):
+    1. Single AI call that analyzes missing info AND generates resume
+    2. If missing_info found → interrupt with current resume + missing info
+    3. On resume → restart entire node from top with new info
+    4. Always produces resume output regardless of gaps
+
+    Approach (two_phase):
+    1. missing_info already detected by missing_info_detector → interrupt right away
+    2. Generate the tailored resume once, with collected info or after the user skips
+
+    Args:
+        state: Graph state with all analysis results and data loaded
+        config: LangChain runnable config
+
+    Returns:
+        Dictionary with tailored_resume and updated missing_info
+    """
+    try:
+        # Validate required fields using dot notation
+        error_msg = validate_fields(state, REQUIRED_FIELDS, "tailoring")
+        if error_msg:
+            return {"error": error_msg}
+
+        # Extract fields using type-safe dot notation
+        user_id = state.user_id
+        job_id = state.job_id
+        full_resume = state.full_resume
+
+        # Setup metadata
+        setup_metadata(config, "resume_tailorer", user_id, job_id)
+        _record_prompt_savings(state, full_resume, config)
+
+        # Initialize with current full resume
+        additional_info = ""
+        working_full_resume = full_resume
+
+        if state.tailoring_mode == "two_phase":
+            if state.missing_info:
+                logging.info(
+                    f"[DEBUG] Interrupting before generation for missing info: {state.missing_info}"
+                )
+                interrupt_data = InterruptData(
+                    missing_info=state.missing_info,
+                    user_id=user_id,
+                    job_id=job_id,
+                    full_resume=working_full_resume,
+                )
+                collection = _parse_collection_result(
+                    interrupt(interrupt_data.model_dump())
+                )
+                if collection:
+                    additional_info = collection.final_collected_info
+                    working_full_resume = collection.updated_full_resume
+
+            try:
+                result = await _generate_tailoring(
+                    state, working_full_resume, additional_info, config
+                )
+            except Exception as error:
+                logging.error(f"[ERROR] Structured output failed: {error}")
+                return {"error": f"Failed to generate resume analysis: {error}"}
+
+        else:
+            # Single AI call: Analyze missing info AND generate tailored resume
+            try:
+                result = await _generate_tailoring(
+                    state, working_full_resume, additional_info, config
+                )
+            except Exception as error:
+                logging.error(f"[ERROR] Structured output failed: {error}")
+                return {"error": f"Failed to generate resume analysis: {error}"}
 
-            # Prepare typed interrupt data for client
-            interrupt_data = InterruptData(
-                missing_info=result.missing_info,
-                tailored_resume=result.tailored_resume,
-                user_id=user_id,
-                job_id=job_id,
-                full_resume=working_full_resume,
+            result.missing_info = _unanswered(state, result.missing_info)
+            logging.debug(
+                f"[DEBUG] Generated resume with {len(result.missing_info) if result and result.missing_info else 0} missing items identified"
             )
 
-            # Interrupt execution - when resumed, interrupt() returns the collection result
-            collection_result = interrupt(interrupt_data.model_dump())
-
-            # If we get here, client has resumed with info collection result
-            if collection_result:
-                logging.info("[DEBUG] Resuming with collection result")
-                try:
-                    # Parse JSON string if needed
-                    if isinstance(collection_result, str):
-                        collection_result = json.loads(collection_result)
-                    
-                    validated_result = InfoCollectionResult.model_validate(
-                        collection_result
-                    )
-                    additional_info = validated_result.final_collected_info
-                    working_full_resume = validated_result.updated_full_resume
+            # If we have missing info, interrupt to let client decide whether to collect more info
+            if result.missing_info:
+                logging.info(
+                    f"[DEBUG] Missing critical info detected, interrupting: {result.missing_info}"
+                )
+
+                # Prepare typed interrupt data for client
+                interrupt_data = InterruptData(
+                    missing_info=result.missing_info,
+                    tailored_resume=result.tailored_resume,
+                    user_id=user_id,
+                    job_id=job_id,
+                    full_resume=working_full_resume,
+                )
+
+                # Interrupt execution - when resumed, interrupt() returns the collection result
+                collection = _parse_collection_result(
+                    interrupt(interrupt_data.model_dump())
+                )
+
+                # If we get here, client has resumed with info collection result
+                if collection:
+                    additional_info = collection.final_collected_info
+                    working_full_resume = collection.updated_full_resume
 
                     logging.info(
                         f"[DEBUG] Restarting with collected info: {len(additional_info)} chars"
                     )
 
-                    # Restart the AI call with new information
-                    updated_prompt = prompt.replace(
-                        f"FULL_RESUME:\n{full_resume}",
-                        f"FULL_RESUME:\n{working_full_resume}"
-                    ).replace(
-                        "ADDITIONAL_COLLECTED_INFO:\n",
-                        f"ADDITIONAL_COLLECTED_INFO:\n{additional_info}",
-                    )
-
                     try:
-                        # Increase max_tokens for long resume content on restart
-                        result = await model_with_structure.ainvoke(updated_prompt, config=config, max_tokens=4000)
+                        # Restart the AI call with new information
+                        result = await _generate_tailoring(
+                            state, working_full_resume, additional_info, config
+                        )
                     except Exception as error:
                         logging.error(f"[ERROR] Structured output failed on restart: {error}")
                         return {"error": f"Failed to generate resume analysis on restart: {error}"}
-                        
+
+                    result.missing_info = _unanswered(state, result.missing_info)
                     logging.debug(
                         f"[DEBUG] Regenerated resume with {len(result.missing_info)} remaining missing items"
                     )
 
-                except Exception as e:
-                    logging.warning(
-                        f"[DEBUG] Invalid collection result: {e}, using original resume"
-                    )
-            else:
-                logging.info(
-                    "[DEBUG] No collection result provided, using original resume"
-                )
-
         # Save generated resume to storage
         await save_processing_result(
             user_id, job_id, "tailored_resume", result.tailored_resume
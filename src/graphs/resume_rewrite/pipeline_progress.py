@@ -0,0 +1,110 @@
+"""
+Pipeline Progress Tracking
+
+Records a fingerprint of the inputs each persisted node output was generated from,
+so a rerun can tell which outputs already stored on the job row are still valid
+for the current inputs and jump straight to the first incomplete node.
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Tuple
+
+from src.tools.state_data_manager import StateDataManager
+from src.utils.text_utils import content_hash
+
+logging.basicConfig(level=logging.DEBUG)
+
+# Persisted pipeline nodes in execution order: (node_name, output_field, input_fields)
+PERSISTED_NODES: List[Tuple[str, str, List[str]]] = [
+    ("job_analyzer", "company_strategy", ["job_description"]),
+    (
+        "resume_screener",
+        "recruiter_feedback",
+        ["original_resume", "job_description", "company_strategy"],
+    ),
+]
+
+# First node that does not persist a reusable output
+FINAL_NODE = "resume_tailorer"
+
+
+def compute_input_fingerprint(node_name: str, fields: Dict[str, Any]) -> str:
+    """
+    Fingerprint the inputs a persisted node consumes.
+
+    Args:
+        node_name: Name of the persisted node
+        fields: Mapping containing (at least) the node's input fields
+
+    Returns:
+        Hex digest identifying the exact inputs
+    """
+    input_fields = next(inputs for name, _, inputs in PERSISTED_NODES if name == node_name)
+    return content_hash(node_name, *(fields.get(field) or "" for field in input_fields))
+
+
+async def record_node_completion(
+    user_id: str, job_id: str, node_name: str, fields: Dict[str, Any]
+) -> bool:
+    """
+    Record that a node's output was persisted for the given inputs.
+
+    Args:
+        user_id: User identifier
+        job_id: Job identifier
+        node_name: Name of the persisted node that just completed
+        fields: Mapping containing the node's input fields
+
+    Returns:
+        True if the progress record was saved, False otherwise
+    """
+    progress = await StateDataManager.load_pipeline_progress(user_id, job_id)
+    progress[node_name] = {
+        "fingerprint": compute_input_fingerprint(node_name, fields),
+        "completed_at": datetime.now(timezone.utc).isoformat(),
+    }
+    return await StateDataManager.save_pipeline_progress(user_id, job_id, progress)
+
+
+def restore_completed_outputs(
+    loaded_fields: Dict[str, Any], progress: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Keep persisted outputs whose recorded fingerprint matches the current inputs.
+
+    Outputs are checked in pipeline order, so an invalidated upstream output
+    also invalidates everything downstream that consumed it.
+
+    Args:
+        loaded_fields: Fields loaded from storage, including persisted outputs
+        progress: Completion record loaded via StateDataManager
+
+    Returns:
+        Copy of loaded_fields with stale persisted outputs cleared
+    """
+    fields = dict(loaded_fields)
+    for node_name, output_field, _ in PERSISTED_NODES:
+        entry = progress.get(node_name) or {}
+        is_valid = bool(fields.get(output_field)) and entry.get(
+            "fingerprint"
+        ) == compute_input_fingerprint(node_name, fields)
+        if not is_valid:
+            fields[output_field] = None
+    return fields
+
+
+def first_incomplete_node(fields: Dict[str, Any]) -> str:
+    """
+    Find the first pipeline node whose output is not available yet.
+
+    Args:
+        fields: Current state fields after restore_completed_outputs
+
+    Returns:
+        Name of the node the pipeline should (re)start at
+    """
+    for node_name, output_field, _ in PERSISTED_NODES:
+        if not fields.get(output_field):
+            return node_name
+    return FINAL_NODE
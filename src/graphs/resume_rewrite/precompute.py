@@ -0,0 +1,195 @@
+"""
+Job Analysis Precompute Worker
+
+Runs the job-only part of the resume_rewrite pipeline ahead of time, as soon as a
+job row is inserted or updated: job description normalization, the ranking index
+update and job_analyzer (which also registers the posting for near-duplicate
+detection). Outputs are persisted with their pipeline progress fingerprint, so an
+interactive run finds a valid company_strategy and starts at the screener.
+
+The worker polls a JobChangeSource and handles one job at a time. Before each job it
+waits until no interactive run has a model call in flight (llm_config's
+interactive_call_tracker), and its own calls are tagged as background work so they
+never count as interactive load.
+
+Usage:
+    worker = PrecomputeWorker(SupabaseJobSource())
+    await worker.run(stop_event)
+"""
+
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+from src.llm_config import BACKGROUND_METADATA_KEY, interactive_call_tracker
+from src.graphs.resume_rewrite.state import GraphState
+from src.graphs.resume_rewrite.nodes import job_analyzer
+from src.graphs.resume_rewrite.pipeline_progress import restore_completed_outputs
+from src.tools.state_data_manager import StateDataManager
+from src.tools.job_description_store import load_normalized_job_description
+from src.tools.job_ranker import index_job
+
+logging.basicConfig(level=logging.DEBUG)
+
+POLL_INTERVAL_SECONDS = 30.0
+BUSY_BACKOFF_SECONDS = 1.0
+# Interactive runs make several calls in a row; wait this long after the last one
+INTERACTIVE_QUIET_SECONDS = 5.0
+
+
+class JobChangeSource(ABC):
+    """Source of inserted or updated job rows (id, user_id, job_description, updated_at)"""
+
+    @abstractmethod
+    async def poll(self) -> List[Dict[str, Any]]:
+        """Return job rows changed since the previous poll"""
+
+
+class SupabaseJobSource(JobChangeSource):
+    """
+    Polls the jobs table in (updated_at, id) order, resuming after the last row seen.
+
+    Paging on the pair means rows sharing the last timestamp of a batch are picked
+    up by the next poll instead of being skipped.
+    """
+
+    def __init__(
+        self, since: Optional[str] = None, batch_size: int = 50, after_id: Optional[str] = None
+    ) -> None:
+        self.since = since
+        self.after_id = after_id
+        self.batch_size = batch_size
+
+    async def poll(self) -> List[Dict[str, Any]]:
+        rows = await StateDataManager.list_jobs_updated_since(
+            self.since, self.batch_size, after_id=self.after_id
+        )
+        if rows and rows[-1].get("updated_at"):
+            self.since = rows[-1]["updated_at"]
+            self.after_id = str(rows[-1]["id"])
+        return rows
+
+
+class InMemoryJobSource(JobChangeSource):
+    """Local stand-in for tests and scripts: changed jobs are pushed explicitly"""
+
+    def __init__(self) -> None:
+        self._pending: List[Dict[str, Any]] = []
+
+    def push(self, job: Dict[str, Any]) -> None:
+        """Queue a job row as if it had just been inserted or updated"""
+        self._pending.append(job)
+
+    async def poll(self) -> List[Dict[str, Any]]:
+        rows, self._pending = self._pending, []
+        return rows
+
+
+async def precompute_job(
+    user_id: str, job_id: str, config: Optional[Dict[str, Any]] = None
+) -> bool:
+    """
+    Prepare a job for an interactive resume_rewrite run.
+
+    Normalizes the job description, updates the user's ranking index and runs
+    job_analyzer unless a company_strategy valid for the current description exists.
+
+    Args:
+        user_id: Owner of the job
+        job_id: Job identifier
+        config: Optional runnable config for the model call
+
+    Returns:
+        True if the job now has a valid company_strategy
+    """
+    job_fields = await StateDataManager.load_job_fields(
+        job_id, ["job_description", "company_name", "company_strategy"]
+    )
+    raw_description = job_fields.get("job_description")
+    if not raw_description:
+        return False
+
+    normalized = await load_normalized_job_description(user_id, job_id, raw_description)
+    await index_job(user_id, job_id, raw_description)
+
+    progress = await StateDataManager.load_pipeline_progress(user_id, job_id)
+    restored = restore_completed_outputs(
+        {
+            "job_description": normalized.text,
+            "company_strategy": job_fields.get("company_strategy"),
+        },
+        progress,
+    )
+    if restored["company_strategy"]:
+        return True
+
+    state = GraphState(
+        user_id=user_id,
+        job_id=job_id,
+        job_description=normalized.text,
+        company_name=job_fields.get("company_name"),
+    )
+    result = await job_analyzer(state, config or {"metadata": {BACKGROUND_METADATA_KEY: True}})
+    if result.get("error"):
+        logging.warning(f"[Precompute] Job {job_id} analysis failed: {result['error']}")
+        return False
+
+    logging.info(f"[Precompute] Job {job_id} analysis ready")
+    return True
+
+
+class PrecomputeWorker:
+    """Background worker that precomputes job analysis for changed jobs"""
+
+    def __init__(
+        self,
+        source: JobChangeSource,
+        poll_interval: float = POLL_INTERVAL_SECONDS,
+        busy_backoff: float = BUSY_BACKOFF_SECONDS,
+    ) -> None:
+        self.source = source
+        self.poll_interval = poll_interval
+        self.busy_backoff = busy_backoff
+
+    async def _wait_for_idle_slot(self) -> None:
+        # Low priority: start a job only when no interactive run is using the model
+        while interactive_call_tracker.is_busy(INTERACTIVE_QUIET_SECONDS):
+            await asyncio.sleep(self.busy_backoff)
+
+    async def run_once(self) -> int:
+        """
+        Poll the source once and precompute every changed job.
+
+        Returns:
+            Number of jobs that have a valid company_strategy afterwards
+        """
+        # A job updated several times since the last poll is processed once
+        latest = {str(row["id"]): row for row in await self.source.poll() if row.get("id")}
+
+        ready = 0
+        for job_id, row in latest.items():
+            await self._wait_for_idle_slot()
+            try:
+                if await precompute_job(str(row.get("user_id")), job_id):
+                    ready += 1
+            except Exception as e:
+                logging.error(f"[Precompute] Job {job_id} failed: {e}")
+        return ready
+
+    async def run(self, stop_event: Optional[asyncio.Event] = None) -> None:
+        """
+        Poll until stop_event is set (forever if None).
+
+        Args:
+            stop_event: Event that ends the loop after the current poll
+        """
+        stop_event = stop_event or asyncio.Event()
+        while not stop_event.is_set():
+            ready = await self.run_once()
+            if ready:
+                logging.debug(f"[Precompute] {ready} jobs ready")
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
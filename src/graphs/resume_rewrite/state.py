@@ -11,16 +11,45 @@ class GraphState(BaseModel):
         user_id: Session user identifier
         job_id: Session job identifier
 
+    CONTROL FLOW:
+        resume_from_progress: Reuse persisted node outputs that are still valid for the
+            current inputs and start at the first incomplete node
+        use_precomputed_analysis: Keep a company_strategy persisted for the current job
+            description (e.g. by the precompute worker) and start at the screener
+        tailoring_mode: "single_pass" (generate, then interrupt for missing info) or
+            "two_phase" (fast gap detection and interrupt first, generate once after)
+        speculative_draft: In two_phase mode, generate a draft in parallel with gap
+            detection so it can be used directly when nothing is missing
+        section_parallel: Tailor each section of the original resume concurrently and
+            merge them deterministically instead of one long generation
+        min_fit_score: Stop before tailoring when the screener's fit score is below this
+            (unset = always tailor); lets bulk runs skip poor matches
+        normalize_job_description: Strip boilerplate (EEO, benefits, banners, shared
+            company blurbs) from the job description once when it is loaded
+        dedupe_full_resume: Send only full-resume material not already in the original
+            resume to tailoring prompts
+        reuse_duplicate_analysis: Reuse the company_strategy of a near-duplicate posting
+            (MinHash/LSH over all analyzed jobs) instead of generating a new one
+        cache_company_profile: Reuse the cached company-wide analysis of the employer and
+            generate only the role-specific part
+
     INPUT DATA (Loaded by data_loader node):
-        job_description: Raw job posting text
+        job_description: Job posting text (normalized unless normalize_job_description is off)
+        company_name: Hiring company (extracted by job_analyzer when not set on the job)
         original_resume: User's base resume content
         full_resume: User's complete resume with all details
+        user_facts: User's cross-job fact store (normalized topic -> fact entry)
+        resume_artifacts: Job-independent artifacts precomputed when the resumes were
+            saved (section index, skills, original/full overlap, token counts)
 
     PROCESSING OUTPUTS (Generated by analysis nodes):
         company_strategy: Company analysis and hiring strategy (from job_analyzer)
-        recruiter_feedback: Resume evaluation from recruiter perspective (from resume_screener)
+        near_duplicate_jobs: Near-duplicate postings found for this job (from job_analyzer)
+        recruiter_feedback: Compact resume evaluation from recruiter perspective (from resume_screener)
+        confidence_score: Fit score 0-100 (from resume_screener)
         missing_info: List of specific missing information for tailoring (from resume_tailorer)
         tailored_resume: Customized resume for the job (from resume_tailorer)
+        keyword_coverage: Covered/missing job keywords in tailored_resume (from keyword_checker)
 
     ERROR HANDLING:
         error: Error message if processing fails
@@ -30,28 +59,77 @@ class GraphState(BaseModel):
     user_id: str = Field(..., description="Session user identifier")
     job_id: str = Field(..., description="Session job identifier")
 
+    # Control flow
+    resume_from_progress: bool = Field(
+        False,
+        description="Skip nodes whose persisted outputs are valid for the current inputs",
+    )
+    use_precomputed_analysis: bool = Field(
+        True, description="Start at the screener when a valid job analysis exists"
+    )
+    tailoring_mode: str = Field(
+        "single_pass", description="Tailoring strategy: single_pass, two_phase"
+    )
+    speculative_draft: bool = Field(
+        True, description="Draft in parallel with two_phase gap detection"
+    )
+    section_parallel: bool = Field(
+        False, description="Tailor resume sections concurrently and merge them"
+    )
+    min_fit_score: Optional[int] = Field(
+        None, description="Skip tailoring below this fit score (0-100)"
+    )
+    normalize_job_description: bool = Field(
+        True, description="Strip boilerplate from the job description on load"
+    )
+    dedupe_full_resume: bool = Field(
+        True, description="Drop full-resume blocks already in the original from prompts"
+    )
+    reuse_duplicate_analysis: bool = Field(
+        True, description="Reuse the analysis of a near-duplicate job posting"
+    )
+    cache_company_profile: bool = Field(
+        True, description="Reuse the cached company-wide analysis of the employer"
+    )
+
     # Input data (loaded by data_loader)
     job_description: Optional[str] = Field(None, description="Raw job posting text")
+    company_name: Optional[str] = Field(None, description="Hiring company name")
     original_resume: Optional[str] = Field(
         None, description="User's base resume content"
     )
     full_resume: Optional[str] = Field(
         None, description="User's complete resume with all details"
     )
+    user_facts: Dict[str, Any] = Field(
+        default_factory=dict, description="Facts the user answered for earlier jobs"
+    )
+    resume_artifacts: Optional[Dict[str, Any]] = Field(
+        None, description="Precomputed artifacts derived from the user's resumes"
+    )
 
     # Processing pipeline outputs
     company_strategy: Optional[str] = Field(
         None, description="Company analysis and hiring strategy"
     )
+    near_duplicate_jobs: Optional[List[Dict[str, Any]]] = Field(
+        None, description="Near-duplicate postings (job_id, similarity) of this job"
+    )
     recruiter_feedback: Optional[str] = Field(
         None, description="Resume evaluation from recruiter perspective"
     )
+    confidence_score: Optional[float] = Field(
+        None, description="Screener fit score from 0 to 100"
+    )
     missing_info: Optional[List[str]] = Field(
         None, description="Persistent context of missing information for tailoring"
     )
     tailored_resume: Optional[str] = Field(
         None, description="Customized resume for the job"
     )
+    keyword_coverage: Optional[Dict[str, Any]] = Field(
+        None, description="Job keyword coverage of the tailored resume"
+    )
 
     # Error handling
     error: Optional[str] = Field(None, description="Error message if processing fails")
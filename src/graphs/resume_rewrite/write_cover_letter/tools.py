@@ -1,5 +0,0 @@
-from .write_cover_letter import write_cover_letter
-
-write_cover_letter_tools = [
-    write_cover_letter,
-]
@@ -3,20 +3,54 @@ File Parser Node
 
 Extracts structured information from files and converts to markdown.
 Pure data processing - no file I/O.
+
+Text uploads (.md/.txt) that already are clean markdown resumes skip the model:
+a local quality check looks at heading structure, dated entries and bullet density,
+and documents that pass only get deterministic cleanup.
+
+Multiple documents are parsed map-reduce style: each document is normalized by its
+own model call, concurrently and bounded by the shared LLM limiter, then the results
+are merged deterministically on the structured resume model. The model is only
+asked again for entries whose variants contradict each other.
 """
 
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List
 from langchain_core.runnables import RunnableConfig
+from pydantic import BaseModel, Field
 
-from src.tools.state_data_manager import StateDataManager
+from src.tools.state_data_manager import StateDataManager, save_processing_result
+from src.tools.resume_artifacts_store import refresh_resume_artifacts
 from src.tools.parse_document_tool import parse_document
-from src.llm_config import model
+from src.llm_config import model, get_llm_limiter
 from src.graphs.update_user_profile.state import UpdateUserProfileState, set_error
-from src.utils.node_utils import validate_fields, setup_profile_metadata, handle_error
+from src.utils.node_utils import (
+    validate_fields,
+    setup_profile_metadata,
+    handle_error,
+    gather_with_limit,
+)
+from src.utils.markdown_quality import assess_resume_markdown, clean_resume_markdown
+from src.utils.resume_merge import EntryConflict, merge_resume_markdowns
 
 logging.basicConfig(level=logging.DEBUG)
 
+# Uploads read as plain text; only these can take the markdown fast path
+TEXT_EXTENSIONS = {"md", "markdown", "txt"}
+
+
+class ResolvedEntry(BaseModel):
+    """One merge conflict resolved into a single entry"""
+
+    conflict: int = Field(description="Number of the conflict being resolved")
+    markdown: str = Field(description="Single merged entry in markdown, same layout as the variants")
+
+
+class ConflictResolutions(BaseModel):
+    """Structured output for resolving merge conflicts"""
+
+    entries: List[ResolvedEntry] = Field(description="One resolved entry per conflict")
+
 
 async def file_parser(
     state: UpdateUserProfileState, config: RunnableConfig
@@ -49,7 +83,8 @@ async def file_parser(
         setup_profile_metadata(config, "file_parser", user_id)
 
         # Read all files content using StateDataManager
-        all_content = []
+        # (file name, content, cleaned markdown if it can skip the model)
+        documents = []
         missing_files = []
         original_resume_content = None  # Track if we find an ORIGINAL_RESUME file
         
@@ -78,10 +113,17 @@ async def file_parser(
                 original_resume_content = file_content
                 logging.debug(f"[DEBUG] Detected ORIGINAL_RESUME file: {file_name}, will update original_resume field")
 
-            all_content.append(f"Content from {file_name}:\n{file_content}")
+            structured = None
+            if file_extension in TEXT_EXTENSIONS and state.markdown_fast_path:
+                quality = assess_resume_markdown(file_content)
+                logging.debug(f"[DEBUG] Markdown quality of {file_name}: {quality}")
+                if quality.is_structured:
+                    structured = clean_resume_markdown(file_content)
+
+            documents.append((file_name, file_content, structured))
             logging.debug(f"[DEBUG] Successfully read file: {file_name}, content length: {len(file_content)}")
 
-        if not all_content:
+        if not documents:
             error_msg = f"No valid file content found to parse. Missing files: {missing_files}. " \
                        f"Files should be uploaded to temp storage at paths: " \
                        f"{[f'{user_id}/temp/{f}' for f in missing_files]}"
@@ -90,16 +132,55 @@ async def file_parser(
 
         # Save original resume if we found one
         if original_resume_content:
-            from src.tools.state_data_manager import save_processing_result
-            await save_processing_result(user_id, None, "original_resume", original_resume_content)
+            saved = await save_processing_result(
+                user_id, None, "original_resume", original_resume_content
+            )
             logging.debug(f"[DEBUG] Updated original_resume field with content from ORIGINAL_RESUME file")
+            # The original/full overlap changed; resume_updater refreshes again after the merge
+            if saved:
+                await refresh_resume_artifacts(user_id, original_resume=original_resume_content)
+
+        # Map: normalize each document on its own, concurrently
+        parsed_documents = [structured for _, _, structured in documents]
+        to_parse = [index for index, document in enumerate(documents) if not document[2]]
+        results = await gather_with_limit(
+            [_parse_document(*documents[index][:2], config) for index in to_parse],
+            get_llm_limiter(),
+        )
+        for index, parsed in zip(to_parse, results):
+            parsed_documents[index] = parsed
+        logging.debug(
+            f"[DEBUG] {len(documents) - len(to_parse)} structured markdown files skipped model parsing"
+        )
+
+        # Reduce: deterministic merge, model only for contradicting entries
+        parsed_content = await _merge_documents(parsed_documents, config)
 
-        combined_content = "\n\n---\n\n".join(all_content)
+        logging.debug(
+            f"[DEBUG] Files parsed: {len(parsed_content)} chars from {len(file_names)} files"
+        )
 
-        prompt = f"""
+        # Delete all files from temp storage
+        for file_name in file_names:
+            logging.debug(f"[DEBUG] Deleting file from temp storage: {file_name}")
+            try:
+                await StateDataManager.delete_temp_file(user_id, file_name)
+            except Exception as e:
+                logging.error(f"[DEBUG] Error deleting file from temp storage: {e}")
+
+        return {"parsed_content": parsed_content}
+
+    except Exception as e:
+        return handle_error(e, "file_parser")
+
+
+async def _parse_document(file_name: str, file_content: str, config: RunnableConfig) -> str:
+    """Normalize one uploaded document into a markdown resume with the model"""
+
+    prompt = f"""
 You are a professional resume parser tasked with extracting comprehensive career information.
 
-Your goal is to convert the provided document(s) into a well-structured resume format.
+Your goal is to convert the provided document into a well-structured resume format.
 
 Follow these strict guidelines:
 
@@ -124,31 +205,59 @@ Follow these strict guidelines:
    - Keep professional language and tone
    - Remove any redundant information
    - Ensure consistent formatting across sections
-   - Merge information from multiple sources without duplication
 
-SOURCE CONTENT:
-{combined_content}
+SOURCE CONTENT (from {file_name}):
+{file_content}
 
 Return ONLY the properly formatted markdown content. Do not include any explanations, comments, or other text before or after the markdown content.
 """
 
-        # Parse file content using model
-        response = await model.ainvoke(prompt, config=config)
-        parsed_content = response.content
+    # Parse file content using model
+    response = await model.ainvoke(prompt, config=config)
+    logging.debug(f"[DEBUG] Parsed {file_name}: {len(response.content)} chars")
+    return response.content
 
-        logging.debug(
-            f"[DEBUG] Files parsed: {len(parsed_content)} chars from {len(file_names)} files"
-        )
 
-        # Delete all files from temp storage
-        for file_name in file_names:
-            logging.debug(f"[DEBUG] Deleting file from temp storage: {file_name}")
-            try:
-                await StateDataManager.delete_temp_file(user_id, file_name)
-            except Exception as e:
-                logging.error(f"[DEBUG] Error deleting file from temp storage: {e}")
+async def _merge_documents(parsed_documents: List[str], config: RunnableConfig) -> str:
+    """Merge per-document resumes; only contradicting entries go to the model"""
+    if len(parsed_documents) == 1:
+        return parsed_documents[0]
 
-        return {"parsed_content": parsed_content}
+    merge = merge_resume_markdowns(parsed_documents)
+    if not merge.conflicts:
+        return merge.resolve()
 
+    logging.debug(f"[DEBUG] Resolving {len(merge.conflicts)} merge conflicts with the model")
+    try:
+        resolutions = await _resolve_conflicts(merge.conflicts, config)
     except Exception as e:
-        return handle_error(e, "file_parser")
+        logging.warning(f"[DEBUG] Conflict resolution failed, keeping first variants: {e}")
+        resolutions = {}
+    return merge.resolve(resolutions)
+
+
+async def _resolve_conflicts(
+    conflicts: List[EntryConflict], config: RunnableConfig
+) -> Dict[int, str]:
+    """Ask the model to unify each set of contradicting entry variants"""
+    rendered = "\n\n".join(
+        f"CONFLICT {index} (section: {conflict.section}):\n"
+        + "\n--- variant ---\n".join(conflict.variants)
+        for index, conflict in enumerate(conflicts)
+    )
+    prompt = f"""
+The same resume entry was extracted from several documents with contradicting details
+(usually dates). For each conflict, return ONE merged entry in the same markdown layout:
+- Prefer the most specific and most recent-looking dates and titles
+- Keep every distinct bullet point, without duplicates
+- Do not invent information
+
+{rendered}
+"""
+    model_with_structure = model.with_structured_output(ConflictResolutions)
+    result = await model_with_structure.ainvoke(prompt, config=config)
+    return {
+        entry.conflict: entry.markdown
+        for entry in result.entries
+        if 0 <= entry.conflict < len(conflicts) and entry.markdown.strip()
+    }
@@ -3,6 +3,11 @@ Parse LinkedIn Profile Node
 
 Parses LinkedIn profile content into structured information.
 Pure data processing - no file I/O.
+
+When input_data is a profile URL, the profile is fetched through the pooled
+LinkedIn MCP session. Fetches and parses are cached per normalized URL (or per
+content hash for pasted profiles): a fresh entry is used directly, and an expired
+one is only re-parsed when the fetched content changed.
 """
 
 import logging
@@ -12,6 +17,15 @@ from langchain_core.runnables import RunnableConfig
 from src.llm_config import model
 from src.graphs.update_user_profile.state import UpdateUserProfileState, set_error
 from src.utils.node_utils import validate_fields, setup_profile_metadata, handle_error
+from src.utils.text_utils import content_hash
+from src.tools.linkedin_profile_store import (
+    cache_key,
+    fetch_linkedin_profile,
+    is_fresh,
+    load_cached_profile,
+    normalize_profile_url,
+    save_cached_profile,
+)
 
 logging.basicConfig(level=logging.DEBUG)
 
@@ -22,7 +36,7 @@ async def parse_linkedin_profile(
     """
     Parses LinkedIn profile content into structured information.
 
-    Input: input_data (LinkedIn profile content)
+    Input: input_data (LinkedIn profile URL or content)
     Output: parsed_content (structured profile information)
 
     Args:
@@ -45,7 +59,48 @@ async def parse_linkedin_profile(
         # Setup metadata
         setup_profile_metadata(config, "parse_linkedin_profile", user_id)
 
-        prompt = f"""
+        profile_url = normalize_profile_url(input_data)
+        key = cache_key(profile_url, input_data)
+        entry = await load_cached_profile(key) if state.cache_linkedin_profile else {}
+
+        if is_fresh(entry):
+            logging.debug(f"[DEBUG] Using cached LinkedIn profile parse ({key})")
+            return {"parsed_content": entry["parsed_content"]}
+
+        raw_profile = input_data
+        if profile_url:
+            try:
+                raw_profile = await fetch_linkedin_profile(profile_url)
+            except Exception as e:
+                if entry.get("parsed_content"):
+                    logging.warning(f"[DEBUG] LinkedIn fetch failed, using cached parse: {e}")
+                    return {"parsed_content": entry["parsed_content"]}
+                # A bare URL has nothing to parse, and caching that would last the whole TTL
+                return set_error(f"Could not fetch LinkedIn profile {profile_url}: {e}")
+
+        # Conditional refresh: unchanged content keeps its previous parse
+        if entry.get("parsed_content") and entry.get("content_hash") == content_hash(raw_profile):
+            logging.debug(f"[DEBUG] LinkedIn profile unchanged, skipping parse ({key})")
+            parsed_content = entry["parsed_content"]
+            parsed_at = entry.get("parsed_at")
+        else:
+            parsed_content = await _parse_profile(raw_profile, config)
+            parsed_at = None
+
+        if state.cache_linkedin_profile:
+            await save_cached_profile(key, profile_url, raw_profile, parsed_content, parsed_at)
+
+        logging.debug(f"[DEBUG] LinkedIn profile parsed: {len(parsed_content)} chars")
+
+        return {"parsed_content": parsed_content}
+
+    except Exception as e:
+        return handle_error(e, "parse_linkedin_profile")
+
+
+async def _parse_profile(raw_profile: str, config: RunnableConfig) -> str:
+    """Parse raw profile text into structured resume information with the model"""
+    prompt = f"""
 Parse this LinkedIn profile content into structured information.
 
 Extract and organize the following information:
@@ -60,16 +115,9 @@ Extract and organize the following information:
 Format the output as clear, structured text that can be easily integrated into a resume.
 
 LINKEDIN_PROFILE:
-{input_data}
+{raw_profile}
 """
 
-        # Generate parsed content
-        response = await model.ainvoke(prompt, config=config)
-        parsed_content = response.content
-
-        logging.debug(f"[DEBUG] LinkedIn profile parsed: {len(parsed_content)} chars")
-
-        return {"parsed_content": parsed_content}
-
-    except Exception as e:
-        return handle_error(e, "parse_linkedin_profile")
+    # Generate parsed content
+    response = await model.ainvoke(prompt, config=config)
+    return response.content
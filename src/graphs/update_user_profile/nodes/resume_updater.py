@@ -3,6 +3,10 @@ Resume Update Node
 
 Merges new information into existing resume content.
 Pure data processing - no file I/O.
+
+In patch merge mode the model only returns section-level edits, which are applied
+locally; the full resume is regenerated only when there is nothing to patch or the
+patch cannot be applied.
 """
 
 import logging
@@ -12,10 +16,35 @@ from langchain_core.runnables import RunnableConfig
 from src.llm_config import model
 from src.graphs.update_user_profile.state import UpdateUserProfileState, set_error
 from src.tools.state_data_manager import save_processing_result
-from src.utils.node_utils import validate_fields, setup_profile_metadata, handle_error
+from src.tools.resume_artifacts_store import refresh_resume_artifacts
+from src.utils.node_utils import (
+    validate_fields,
+    setup_profile_metadata,
+    handle_error,
+    merge_resume_patch,
+)
 
 logging.basicConfig(level=logging.DEBUG)
 
+MERGE_GUIDELINES = """1. STRUCTURE:
+   - Maintain proper markdown formatting throughout the document
+   - Keep existing section headers and structure
+   - Add new sections only if they don't exist and are relevant
+   - Ensure consistent formatting across all sections
+
+2. CONTENT MERGING:
+   - Carefully analyze the new information against existing content
+   - Only add non-duplicate information
+   - Merge similar experiences/skills into existing entries when appropriate
+   - Preserve all existing important information
+   - Maintain chronological order in experience/education sections
+
+3. QUALITY CONTROL:
+   - Ensure all dates and formatting remain consistent
+   - Verify that merged content flows naturally
+   - Maintain professional language and tone throughout
+   - Remove any redundant or repetitive information"""
+
 
 async def resume_updater(
     state: UpdateUserProfileState, config: RunnableConfig
@@ -53,31 +82,48 @@ async def resume_updater(
         # Setup metadata
         setup_profile_metadata(config, "resume_updater", user_id)
 
-        prompt = f"""
+        updated_full_resume = None
+        if state.merge_mode == "patch" and current_full_resume.strip():
+            updated_full_resume = await merge_resume_patch(
+                model, current_full_resume, content_to_merge, MERGE_GUIDELINES, config
+            )
+            if updated_full_resume is None:
+                logging.info("[DEBUG] Falling back to full resume regeneration")
+
+        if updated_full_resume is None:
+            updated_full_resume = await _regenerate_resume(
+                current_full_resume, content_to_merge, config
+            )
+
+        # Save to storage using StateDataManager
+        saved = await save_processing_result(
+            user_id, None, "full_resume", updated_full_resume
+        )
+
+        # Derive tailoring artifacts now instead of in every resume_rewrite run
+        if saved:
+            await refresh_resume_artifacts(user_id, full_resume=updated_full_resume)
+
+        logging.debug(f"[DEBUG] Resume updated: {len(updated_full_resume)} chars")
+
+        return {"updated_full_resume": updated_full_resume}
+
+    except Exception as e:
+        return handle_error(e, "resume_updater")
+
+
+async def _regenerate_resume(
+    current_full_resume: str, content_to_merge: str, config: RunnableConfig
+) -> str:
+    """Have the model output the complete merged resume (full merge mode)"""
+    prompt = f"""
 You are a professional resume writer tasked with updating a user's comprehensive resume.
 
 Your goal is to merge new information into an existing resume while maintaining professional formatting and avoiding duplicates.
 
 Follow these strict guidelines:
 
-1. STRUCTURE:
-   - Maintain proper markdown formatting throughout the document
-   - Keep existing section headers and structure
-   - Add new sections only if they don't exist and are relevant
-   - Ensure consistent formatting across all sections
-
-2. CONTENT MERGING:
-   - Carefully analyze the new information against existing content
-   - Only add non-duplicate information
-   - Merge similar experiences/skills into existing entries when appropriate
-   - Preserve all existing important information
-   - Maintain chronological order in experience/education sections
-
-3. QUALITY CONTROL:
-   - Ensure all dates and formatting remain consistent
-   - Verify that merged content flows naturally
-   - Maintain professional language and tone throughout
-   - Remove any redundant or repetitive information
+{MERGE_GUIDELINES}
 
 EXISTING RESUME:
 {current_full_resume}
@@ -89,18 +135,6 @@ Return the complete, updated markdown resume with all content properly merged an
 IMPORTANT: Return ONLY the markdown content. Do not include any explanations, comments, or other text before or after the markdown content.
 """
 
-        # Generate updated resume
-        response = await model.ainvoke(prompt, config=config)
-        updated_full_resume = response.content
-
-        # Save to storage using StateDataManager
-        await save_processing_result(
-            user_id, None, "full_resume", updated_full_resume
-        )
-
-        logging.debug(f"[DEBUG] Resume updated: {len(updated_full_resume)} chars")
-
-        return {"updated_full_resume": updated_full_resume}
-
-    except Exception as e:
-        return handle_error(e, "resume_updater")
+    # Generate updated resume
+    response = await model.ainvoke(prompt, config=config)
+    return response.content
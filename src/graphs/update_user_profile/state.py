@@ -15,6 +15,13 @@ class UpdateUserProfileState(BaseModel):
             - "update_resume": Direct resume update from new information
             - "parse_linkedin": Parse LinkedIn profile and merge into resume
             - "parse_file": Parse additional file and merge into resume
+        merge_mode: How new information is merged into the existing resume
+            - "patch": Model emits section-level edits that are applied locally
+            - "full": Model regenerates the complete resume
+        markdown_fast_path: Use .md/.txt uploads that already are clean markdown resumes
+            directly instead of normalizing them with the model
+        cache_linkedin_profile: Reuse cached LinkedIn fetches and parses (by profile URL
+            or content hash); re-parse only when the fetched profile changed
 
     INPUT DATA (Loaded by data_loader or provided by caller):
         input_data: Raw input content to process (LinkedIn profile, file content, or direct info)
@@ -35,6 +42,13 @@ class UpdateUserProfileState(BaseModel):
     operation_mode: str = Field(
         ..., description="Processing path: update_resume, parse_linkedin, parse_file"
     )
+    merge_mode: str = Field("patch", description="Resume merge strategy: patch, full")
+    markdown_fast_path: bool = Field(
+        True, description="Skip model parsing for already structured markdown uploads"
+    )
+    cache_linkedin_profile: bool = Field(
+        True, description="Reuse cached LinkedIn profile fetches and parses"
+    )
 
     # Input data
     input_data: str = Field(..., description="Raw input content to process")
@@ -3,25 +3,115 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+import asyncio
+import os
+import threading
+import time
+import weakref
+from typing import Any, Dict, Optional
+from uuid import UUID
 from langchain_anthropic import ChatAnthropic
+from langchain_core.callbacks import BaseCallbackHandler
 from langgraph.prebuilt import create_react_agent
 
+# Runs that set this metadata key are background work (see resume_rewrite/precompute.py)
+BACKGROUND_METADATA_KEY = "precompute"
+
+
+class InteractiveCallTracker(BaseCallbackHandler):
+    """
+    Counts in-flight model calls of interactive runs, across threads and event loops.
+
+    Calls whose run metadata sets BACKGROUND_METADATA_KEY are not counted, so
+    background workers can wait until no interactive run is using the model.
+    """
+
+    run_inline = True
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._in_flight: set = set()
+        self._last_finished = 0.0
+
+    def _start(self, run_id: UUID, metadata: Optional[Dict[str, Any]]) -> None:
+        if (metadata or {}).get(BACKGROUND_METADATA_KEY):
+            return
+        with self._lock:
+            self._in_flight.add(run_id)
+
+    def _finish(self, run_id: UUID) -> None:
+        with self._lock:
+            if run_id in self._in_flight:
+                self._in_flight.discard(run_id)
+                self._last_finished = time.monotonic()
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, metadata=None, **kwargs):
+        self._start(run_id, metadata)
+
+    def on_llm_start(self, serialized, prompts, *, run_id, metadata=None, **kwargs):
+        self._start(run_id, metadata)
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        self._finish(run_id)
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        self._finish(run_id)
+
+    def is_busy(self, quiet_seconds: float = 0.0) -> bool:
+        """
+        Whether an interactive call is in flight or finished within quiet_seconds.
+
+        The quiet period bridges the gap between consecutive nodes of one run.
+        """
+        with self._lock:
+            return bool(self._in_flight) or (
+                time.monotonic() - self._last_finished < quiet_seconds
+            )
+
+
+interactive_call_tracker = InteractiveCallTracker()
+
 isTest = False
 
 if isTest:
     # Using Groq for free, fast cloud inference (no local installation needed)
     from langchain_groq import ChatGroq
 
-    import os
     # Initialize with Groq's free API - very fast and generous free tier
     model = ChatGroq(
         model="llama-3.1-8b-instant",
         api_key=os.getenv("GROQ_API_KEY"),
         temperature=0.1,
-        timeout=120
+        timeout=120,
+        callbacks=[interactive_call_tracker],
     )
 else:
     # Initialize the model
-    model = ChatAnthropic(model_name="claude-3-7-sonnet-latest", timeout=120, stop=None)
+    model = ChatAnthropic(
+        model_name="claude-3-7-sonnet-latest",
+        timeout=120,
+        stop=None,
+        callbacks=[interactive_call_tracker],
+    )
 
 agent = create_react_agent(model, [])
+
+# Process-wide bound on concurrent model calls made by fan-out nodes
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "6"))
+_llm_limiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_llm_limiter() -> asyncio.Semaphore:
+    """
+    Semaphore bounding concurrent model calls on the running event loop.
+
+    A semaphore is bound to the loop it is first awaited on, so each loop (e.g. one per
+    asyncio.run call) gets its own instead of sharing one created at import time.
+    """
+    loop = asyncio.get_running_loop()
+    limiter = _llm_limiters.get(loop)
+    if limiter is None:
+        limiter = _llm_limiters[loop] = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+    return limiter
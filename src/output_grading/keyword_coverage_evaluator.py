@@ -0,0 +1,21 @@
+"""
+Keyword Coverage Evaluator
+
+Deterministic ATS keyword coverage score for a tailored resume, using the same
+keyword engine as the keyword_checker node. No model calls.
+"""
+
+from src.utils.keyword_matcher import keyword_coverage
+
+
+def keyword_coverage_evaluator(inputs, outputs, reference_outputs=None, **kwargs):
+    """Deterministic ATS keyword coverage of the tailored resume (no model call)"""
+    result = keyword_coverage(inputs["job_description"], outputs["tailored_resume"])
+    return {
+        "key": "keyword_coverage",
+        "score": result.coverage,
+        "comment": (
+            f"Covered {len(result.covered)}/{len(result.keywords)} job keywords. "
+            f"Missing: {', '.join(result.missing) or 'none'}"
+        ),
+    }
@@ -7,6 +7,7 @@ import asyncio
 from langsmith import Client
 from src.output_grading.cover_letter_evaluator import cover_letter_evaluator
 from src.output_grading.resume_tailoring_evaluator import resume_tailoring_evaluator
+from src.output_grading.keyword_coverage_evaluator import keyword_coverage_evaluator
 from src.tools.state_data_manager import StateDataManager
 from src.tools.file_path_manager import get_file_paths
 import argparse
@@ -73,7 +74,11 @@ async def run_evaluation(user_id, job_id):
     await client.aevaluate(
         target,
         data=dataset_name,
-        evaluators=[resume_tailoring_evaluator, cover_letter_evaluator],
+        evaluators=[
+            keyword_coverage_evaluator,
+            resume_tailoring_evaluator,
+            cover_letter_evaluator,
+        ],
         experiment_prefix="resume-tailoring",
         max_concurrency=2,
     )
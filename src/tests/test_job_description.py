@@ -0,0 +1,44 @@
+from src.utils.job_description import normalize_job_description
+
+
+def test_plain_section_names_end_a_benefits_block():
+    text = """Senior Engineer
+
+About the role
+Build data pipelines.
+
+Benefits
+- Health insurance
+- Unlimited PTO
+
+Requirements
+- 5+ years of Python
+
+Responsibilities
+- Own the ingestion service"""
+    result = normalize_job_description(text)
+    assert "Health insurance" not in result.text
+    assert "5+ years of Python" in result.text
+    assert "Own the ingestion service" in result.text
+    assert result.removed == {"benefits": 1}
+
+
+def test_single_rule_hit_does_not_remove_a_responsibilities_list():
+    text = """What you'll do
+- Design privacy reviews for new products
+- Build tooling so personal data we process is tagged and deleted on time
+- Partner with legal on data retention
+- Run threat models with security engineers"""
+    result = normalize_job_description(text)
+    assert "personal data we process" in result.text
+    assert result.removed == {}
+
+
+def test_salary_range_is_kept_and_eeo_statement_removed():
+    text = """Pay transparency: the base salary range for this role is $150,000 - $180,000.
+
+Acme is an equal opportunity employer. We do not discriminate on the basis of race, color, religion, sexual orientation or gender identity."""
+    result = normalize_job_description(text)
+    assert "$150,000 - $180,000" in result.text
+    assert "equal opportunity" not in result.text
+    assert result.removed == {"eeo": 1}
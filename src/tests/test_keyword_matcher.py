@@ -0,0 +1,13 @@
+from src.utils.keyword_matcher import extract_job_keywords, keyword_coverage
+
+
+def test_common_word_skills_match_only_their_aliases():
+    keywords = ["excel", "go", "swift"]
+    coverage = keyword_coverage("", "Let's go. Excel at swift delivery.", keywords)
+    assert coverage.covered == []
+    assert keyword_coverage("", "Built services in Golang", keywords).covered == ["go"]
+
+
+def test_short_alias_does_not_match_inside_dotted_names():
+    assert "javascript" not in extract_job_keywords("Experience with React.js and node.js")
+    assert "javascript" in extract_job_keywords("Strong JS skills. Also JS.")
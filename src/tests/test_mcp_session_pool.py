@@ -0,0 +1,33 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("mcp.server.fastmcp", exc_type=ImportError)
+pytest.importorskip("langchain_mcp_adapters.tools", exc_type=ImportError)
+
+from src.tools.mcp_session_pool import McpSessionPool  # noqa: E402
+from src.tools.mcp_stub_server import stub_server_params  # noqa: E402
+
+
+async def _echo(pool: McpSessionPool, close: bool) -> bool:
+    # Concurrent requests contend for the per-server lock and share one session
+    first, second = await asyncio.gather(
+        pool.get_session(stub_server_params), pool.get_session(stub_server_params)
+    )
+    assert first is second
+    tools = {tool.name: tool for tool in await pool.get_tools(stub_server_params)}
+    assert await tools["echo"].ainvoke({"text": "hello"}) == "hello"
+    reused = await pool.get_session(stub_server_params) is first
+    if close:
+        await pool.close_all()
+    return reused
+
+
+def test_session_is_reused_and_works_across_event_loops(tmp_path, monkeypatch):
+    # Outside the repository root, the stub server must still start
+    monkeypatch.chdir(tmp_path)
+    pool = McpSessionPool()
+    # The first loop ends without closing its session
+    assert asyncio.run(_echo(pool, close=False))
+    # A second loop starts its own session instead of reusing the first loop's
+    assert asyncio.run(_echo(pool, close=True))
@@ -0,0 +1,22 @@
+from src.utils.resume_overlap import full_resume_supplement
+
+ORIGINAL = """# Jane Doe
+
+## Experience
+
+**Engineer, Acme**
+- Maintained the billing platform for enterprise customers
+"""
+
+
+def test_short_new_bullet_sharing_letters_is_kept():
+    full = ORIGINAL + "- AI\n"
+    result = full_resume_supplement(ORIGINAL, full)
+    assert "- AI" in result.supplement
+
+
+def test_repeated_bullet_is_dropped():
+    full = ORIGINAL + "- Mentored two junior engineers\n"
+    result = full_resume_supplement(ORIGINAL, full)
+    assert "Maintained the billing platform" not in result.supplement
+    assert "- Mentored two junior engineers" in result.supplement
@@ -0,0 +1,15 @@
+import re
+
+from src.utils.text_utils import company_name_from_header, normalize_company_name
+
+
+def test_company_keys_are_path_safe():
+    for name in ["C# Labs", "Google+", "AT&T Inc.", "Ünïcode Co"]:
+        assert re.fullmatch(r"[a-z0-9-]+", normalize_company_name(name))
+    assert normalize_company_name("C# Labs") != normalize_company_name("C Labs")
+
+
+def test_company_name_from_header():
+    assert company_name_from_header("# Engineer\n**Company:** Acme Inc.\n") == "Acme Inc"
+    assert company_name_from_header("## About Stripe\nWe build payments") == "Stripe"
+    assert company_name_from_header("## About the role\nAbout you: curious") == ""
@@ -0,0 +1,16 @@
+from src.utils.tfidf_index import TfidfIndex
+
+
+def test_single_indexed_job_is_ranked():
+    index = TfidfIndex()
+    index.add("job-1", "Senior Python engineer building data pipelines")
+    results = index.search("Python data engineer")
+    assert [doc_id for doc_id, _ in results] == ["job-1"]
+    assert results[0][1] > 0
+
+
+def test_rarer_terms_rank_higher():
+    index = TfidfIndex()
+    index.add("python", "Python engineer")
+    index.add("java", "Java engineer")
+    assert index.search("Python engineer")[0][0] == "python"
@@ -0,0 +1,18 @@
+from src.tools.user_fact_store import find_fact
+from src.utils.text_utils import normalize_topic
+
+
+def _store(*topics):
+    return {normalize_topic(topic): {"topic": topic, "fact": topic} for topic in topics}
+
+
+def test_different_technologies_do_not_share_a_fact():
+    store = _store("Java experience years in production")
+    assert find_fact(store, "Python experience years in production") is None
+
+
+def test_rephrased_topic_finds_the_fact():
+    store = _store("Size of teams managed")
+    assert find_fact(store, "team size managed")["topic"] == "Size of teams managed"
+    store = _store("Years of Python experience")
+    assert find_fact(store, "Python years of professional experience") is not None
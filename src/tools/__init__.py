@@ -22,6 +22,12 @@ from .file_path_manager import (
     get_field_to_path_mapping,
 )
 
+# Cross-job facts collected from the user
+from .user_fact_store import find_fact, split_answered, record_facts
+
+# Durable local checkpointing for graphs with interrupts
+from .sqlite_checkpointer import BlobSqliteSaver
+
 # Agent tools for LangChain workflows
 from .storage_tools import storage_tools
 
@@ -43,6 +49,12 @@ __all__ = [
     "get_file_paths",
     "UserFilePaths",
     "get_field_to_path_mapping",
+    # User Facts
+    "find_fact",
+    "split_answered",
+    "record_facts",
+    # Checkpointing
+    "BlobSqliteSaver",
     # Agent Tools
     "storage_tools",
     # Utilities
@@ -0,0 +1,81 @@
+"""
+Company Profile Store
+
+Caches the company-wide part of job analysis (culture, values, decision makers,
+hiring priorities) per employer, keyed by normalized company name, so postings
+from the same company only need a role-specific analysis. Entries expire after a
+TTL so the profile follows changes at the company.
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from src.tools.state_data_manager import StateDataManager
+from src.utils.text_utils import normalize_company_name
+
+logging.basicConfig(level=logging.DEBUG)
+
+# Bump when the profile prompt changes so cached profiles are regenerated
+COMPANY_PROFILE_VERSION = 1
+COMPANY_PROFILE_TTL = timedelta(days=30)
+
+
+async def load_company_profile(company_name: Optional[str]) -> Optional[str]:
+    """
+    Return the cached company profile if it exists and has not expired.
+
+    Args:
+        company_name: Company name as written on the job
+
+    Returns:
+        Company profile markdown, or None on a cache miss
+    """
+    company_key = normalize_company_name(company_name)
+    if not company_key:
+        return None
+
+    entry = await StateDataManager.load_company_profile(company_key)
+    if not entry.get("profile") or entry.get("version") != COMPANY_PROFILE_VERSION:
+        return None
+
+    try:
+        created_at = datetime.fromisoformat(entry["created_at"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    if datetime.now(timezone.utc) - created_at > COMPANY_PROFILE_TTL:
+        logging.debug(f"[CompanyProfile] Profile for {company_key} expired")
+        return None
+
+    logging.debug(f"[CompanyProfile] Cache hit for {company_key}")
+    return entry["profile"]
+
+
+async def save_company_profile(
+    company_name: Optional[str], profile: str, job_id: str = ""
+) -> bool:
+    """
+    Cache a company profile under the normalized company name.
+
+    Args:
+        company_name: Company name as written on the job
+        profile: Company-wide analysis markdown
+        job_id: Posting the profile was generated from
+
+    Returns:
+        True if saved, False if the name is empty or saving failed
+    """
+    company_key = normalize_company_name(company_name)
+    if not company_key or not profile:
+        return False
+
+    return await StateDataManager.save_company_profile(
+        company_key,
+        {
+            "company_name": company_name,
+            "profile": profile,
+            "source_job_id": job_id,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "version": COMPANY_PROFILE_VERSION,
+        },
+    )
@@ -24,16 +24,46 @@ class UserFilePaths:
         """Path to user's complete resume with all details"""
         return f"{self.user_id}/FULL_RESUME.md"
 
+    @property
+    def full_resume_index_path(self) -> str:
+        """Path to the parsed section index of the user's full resume"""
+        return f"{self.user_id}/FULL_RESUME.index.json"
+
+    @property
+    def resume_artifacts_path(self) -> str:
+        """Path to job-independent artifacts derived from the user's resumes"""
+        return f"{self.user_id}/RESUME_ARTIFACTS.json"
+
     @property
     def original_resume_path(self) -> str:
         """Path to user's base resume"""
         return f"{self.user_id}/ORIGINAL_RESUME.md"
 
+    @property
+    def user_facts_path(self) -> str:
+        """Path to facts the user provided during info collection, reused across jobs"""
+        return f"{self.user_id}/USER_FACTS.json"
+
+    @property
+    def job_paragraph_index_path(self) -> str:
+        """Path to counts of job description paragraphs seen across the user's postings"""
+        return f"{self.user_id}/JOB_PARAGRAPH_INDEX.json"
+
+    @property
+    def job_rank_index_path(self) -> str:
+        """Path to the TF-IDF index over the user's job descriptions"""
+        return f"{self.user_id}/JOB_RANK_INDEX.json"
+
     @property
     def job_description_path(self) -> str:
         """Path to job posting content"""
         return f"{self.user_id}/{self.job_id}/JOB_DESCRIPTION.md"
 
+    @property
+    def normalized_job_description_path(self) -> str:
+        """Path to the cleaned job posting cached with its source hash"""
+        return f"{self.user_id}/{self.job_id}/JOB_DESCRIPTION.normalized.json"
+
     @property
     def job_strategy_path(self) -> str:
         """Path to job analysis and strategy document"""
@@ -54,6 +84,11 @@ class UserFilePaths:
         """Path to cover letter for this job"""
         return f"{self.user_id}/{self.job_id}/COVER_LETTER.md"
 
+    @property
+    def pipeline_progress_path(self) -> str:
+        """Path to input fingerprints of completed pipeline nodes for this job"""
+        return f"{self.user_id}/{self.job_id}/PIPELINE_PROGRESS.json"
+
     def custom_file_path(self, filename: str) -> str:
         """Path for any custom file in the job directory"""
         return f"{self.user_id}/{self.job_id}/{filename}"
@@ -87,6 +122,19 @@ def get_file_paths(user_id: str, job_id: Optional[str] = None) -> UserFilePaths:
     return UserFilePaths(user_id=user_id, job_id=job_id or "")
 
 
+def get_shared_file_path(filename: str) -> str:
+    """
+    Path for a file shared across all users (e.g. cross-user indexes).
+
+    Args:
+        filename: File name inside the shared directory
+
+    Returns:
+        Storage path of the shared file
+    """
+    return f"_shared/{filename}"
+
+
 def get_field_to_path_mapping(file_paths: UserFilePaths) -> dict[str, str]:
     """
     Get mapping from state field names to file paths.
@@ -0,0 +1,86 @@
+"""
+Job Near-Duplicate Store
+
+Keeps a MinHash signature of every analyzed job description in a cross-user LSH
+index, so a posting saved again (from another board, by another user, with small
+edits) can reuse the analysis already generated for its near-duplicate.
+
+The index lives in two Supabase tables, so a lookup reads only the rows of the
+job's own buckets and a registration writes only that job's rows:
+    job_lsh_bands(band_key text, job_id text, primary key (band_key, job_id))
+    job_lsh_signatures(job_id text primary key, signature jsonb, version int)
+"""
+
+import logging
+from typing import List, Optional, Tuple
+
+from src.tools.state_data_manager import StateDataManager
+from src.utils.minhash import band_keys, estimate_similarity, minhash_signature
+
+logging.basicConfig(level=logging.DEBUG)
+
+# Postings at least this similar are reported as near-duplicates
+NEAR_DUPLICATE_THRESHOLD = 0.8
+
+
+async def find_near_duplicate_jobs(
+    job_id: str,
+    job_description: str,
+    threshold: float = NEAR_DUPLICATE_THRESHOLD,
+    register: bool = True,
+) -> List[Tuple[str, float]]:
+    """
+    Find previously indexed jobs whose descriptions are near-duplicates.
+
+    Args:
+        job_id: Job being processed (excluded from the results)
+        job_description: Its job posting text
+        threshold: Minimum estimated Jaccard similarity
+        register: Add this job's signature to the index
+
+    Returns:
+        (job_id, similarity) pairs, most similar first
+    """
+    signature = minhash_signature(job_description)
+    keys = band_keys(signature)
+
+    # Only jobs sharing a band bucket are compared (plus this job, to skip re-registering)
+    candidates = await StateDataManager.find_lsh_candidates(keys)
+    signatures = await StateDataManager.load_job_signatures(list({*candidates, job_id}))
+    matches = sorted(
+        (
+            (candidate_id, similarity)
+            for candidate_id, candidate_signature in signatures.items()
+            if candidate_id != job_id
+            and (similarity := estimate_similarity(signature, candidate_signature)) >= threshold
+        ),
+        key=lambda match: match[1],
+        reverse=True,
+    )
+
+    if register and signatures.get(job_id) != signature:
+        await StateDataManager.save_job_signature(job_id, signature, keys)
+
+    if matches:
+        logging.debug(f"[JobDedup] Job {job_id} near-duplicates: {matches[:5]}")
+    return matches
+
+
+async def find_reusable_analysis(
+    matches: List[Tuple[str, float]], field_name: str = "company_strategy"
+) -> Optional[Tuple[str, float, str]]:
+    """
+    Return the stored analysis of the most similar near-duplicate that has one.
+
+    Args:
+        matches: Output of find_near_duplicate_jobs
+        field_name: Job field holding the analysis to reuse
+
+    Returns:
+        (job_id, similarity, analysis) or None if no near-duplicate has it yet
+    """
+    for duplicate_id, similarity in matches:
+        fields = await StateDataManager.load_job_fields(duplicate_id, [field_name])
+        if fields.get(field_name):
+            return duplicate_id, similarity, fields[field_name]
+    return None
@@ -0,0 +1,70 @@
+"""
+Job Description Store
+
+Normalizes a job posting once per job and caches the cleaned text with the hash of
+the raw posting, so every analysis node receives the same compact text and the
+normalization is skipped on reruns. Also maintains the per-user index of paragraphs
+seen across postings, used to detect shared boilerplate.
+"""
+
+import logging
+from dataclasses import asdict
+
+from src.tools.state_data_manager import StateDataManager
+from src.utils.job_description import (
+    NORMALIZER_VERSION,
+    NormalizedJobDescription,
+    boilerplate_keys,
+    clean_whitespace,
+    normalize_job_description,
+    split_paragraphs,
+)
+from src.utils.text_utils import content_hash
+
+logging.basicConfig(level=logging.DEBUG)
+
+# Job ids kept per paragraph key; enough to cross the boilerplate threshold
+MAX_JOBS_PER_PARAGRAPH = 10
+
+
+async def load_normalized_job_description(
+    user_id: str, job_id: str, job_description: str
+) -> NormalizedJobDescription:
+    """
+    Return the normalized job description, from cache when the posting is unchanged.
+
+    Args:
+        user_id: User identifier
+        job_id: Job identifier
+        job_description: Raw job posting text as stored on the job
+
+    Returns:
+        NormalizedJobDescription for the current posting
+    """
+    cached = await StateDataManager.load_normalized_job_description(user_id, job_id)
+    if (
+        cached.get("source_hash") == content_hash(job_description)
+        and cached.get("version") == NORMALIZER_VERSION
+    ):
+        return NormalizedJobDescription(**cached)
+
+    index = await StateDataManager.load_job_paragraph_index(user_id)
+    normalized = normalize_job_description(job_description, index, job_id)
+
+    # Count this posting's paragraphs for future boilerplate detection
+    for key in boilerplate_keys(split_paragraphs(clean_whitespace(job_description))):
+        job_ids = index.setdefault(key, [])
+        if job_id not in job_ids:
+            job_ids.append(job_id)
+            del job_ids[:-MAX_JOBS_PER_PARAGRAPH]
+
+    await StateDataManager.save_job_paragraph_index(user_id, index)
+    await StateDataManager.save_normalized_job_description(
+        user_id, job_id, asdict(normalized)
+    )
+
+    logging.info(
+        f"[JobDescription] Normalized job {job_id}: removed {normalized.removed}, "
+        f"~{normalized.saved_tokens} tokens saved per prompt"
+    )
+    return normalized
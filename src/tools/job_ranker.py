@@ -0,0 +1,120 @@
+"""
+Job Ranker
+
+Ranks a user's saved jobs by how well their descriptions match the user's full
+resume, using a local TF-IDF index (no model calls). The index is persisted per
+user and synced incrementally: only new or changed job descriptions are
+re-indexed and deleted jobs are dropped. Use it to decide which jobs get the
+full tailoring pipeline first.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional
+
+from src.tools.state_data_manager import StateDataManager
+from src.utils.tfidf_index import TfidfIndex
+from src.utils.text_utils import content_hash
+
+logging.basicConfig(level=logging.DEBUG)
+
+
+@dataclass
+class JobMatch:
+    """A job and its similarity to the user's resume"""
+
+    job_id: str
+    score: float
+
+
+def sync_index(index: TfidfIndex, jobs: List[Dict[str, Any]]) -> bool:
+    """
+    Bring the index in line with the given job rows.
+
+    Args:
+        index: Index to update in place
+        jobs: Job rows with id and job_description
+
+    Returns:
+        True if the index changed
+    """
+    changed = False
+    current_ids = set()
+    for job in jobs:
+        job_id = str(job.get("id"))
+        description = job.get("job_description") or ""
+        current_ids.add(job_id)
+        description_hash = content_hash(description)
+        if index.doc_hashes.get(job_id) != description_hash:
+            index.add(job_id, description, description_hash)
+            changed = True
+
+    for job_id in list(index.doc_hashes):
+        if job_id not in current_ids:
+            index.remove(job_id)
+            changed = True
+    return changed
+
+
+async def load_job_index(user_id: str) -> TfidfIndex:
+    """
+    Load the user's job index and sync it with the jobs table.
+
+    Args:
+        user_id: User identifier
+
+    Returns:
+        Up-to-date TfidfIndex over the user's job descriptions
+    """
+    index = TfidfIndex.from_dict(await StateDataManager.load_job_rank_index(user_id))
+    jobs = await StateDataManager.list_user_jobs(user_id)
+    if sync_index(index, jobs):
+        await StateDataManager.save_job_rank_index(user_id, index.to_dict())
+        logging.debug(f"[JobRanker] Index for user {user_id} synced: {len(index)} jobs")
+    return index
+
+
+async def index_job(user_id: str, job_id: str, job_description: str) -> bool:
+    """
+    Add or update a single job in the user's index (e.g. right after a job is created).
+
+    Args:
+        user_id: User identifier
+        job_id: Job identifier
+        job_description: Raw job posting text
+
+    Returns:
+        True if the index was saved (or already up to date)
+    """
+    index = TfidfIndex.from_dict(await StateDataManager.load_job_rank_index(user_id))
+    description_hash = content_hash(job_description)
+    if index.doc_hashes.get(job_id) == description_hash:
+        return True
+    index.add(job_id, job_description, description_hash)
+    return await StateDataManager.save_job_rank_index(user_id, index.to_dict())
+
+
+async def rank_jobs(
+    user_id: str, limit: Optional[int] = 20, resume_text: Optional[str] = None
+) -> List[JobMatch]:
+    """
+    Rank a user's jobs by similarity to their full resume.
+
+    Args:
+        user_id: User identifier
+        limit: Maximum number of jobs to return (all if None)
+        resume_text: Resume to rank against (loads the user's full resume if None)
+
+    Returns:
+        JobMatch list, best match first
+    """
+    if resume_text is None:
+        profile = await StateDataManager.load_state_data(user_id)
+        resume_text = (
+            profile.loaded_fields.get("full_resume")
+            or profile.loaded_fields.get("original_resume")
+            or ""
+        )
+
+    index = await load_job_index(user_id)
+    return [JobMatch(job_id, score) for job_id, score in index.search(resume_text, limit)]
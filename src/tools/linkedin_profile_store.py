@@ -0,0 +1,158 @@
+"""
+LinkedIn Profile Store
+
+Fetch-and-parse cache for LinkedIn profiles. Entries are keyed by the normalized
+profile URL (or by content hash when raw profile text is passed) and store both the
+fetched profile and its parsed output. Within the TTL the cached parse is used as
+is; after it the profile is fetched again and only re-parsed when its content hash
+changed.
+"""
+
+import logging
+import os
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+from langchain_core.tools import BaseTool
+
+from src.tools.mcp_agent import linkedin_server_params
+from src.tools.mcp_session_pool import mcp_session_pool
+from src.tools.state_data_manager import StateDataManager
+from src.utils.text_utils import content_hash
+
+logging.basicConfig(level=logging.DEBUG)
+
+# Bump when the parse prompt changes so cached parses are redone
+LINKEDIN_PARSE_VERSION = 1
+LINKEDIN_PROFILE_TTL = timedelta(days=7)
+# MCP tool returning a profile for a URL (HorizonDataWave, or the local stub server)
+LINKEDIN_PROFILE_TOOL = os.getenv("LINKEDIN_PROFILE_TOOL", "get_linkedin_profile")
+# Tool argument taking the profile URL (inferred from the tool schema if unset)
+LINKEDIN_PROFILE_URL_ARG = os.getenv("LINKEDIN_PROFILE_URL_ARG")
+
+PROFILE_PATH_PATTERN = re.compile(r"^/(in|pub)/([^/?#]+)", re.IGNORECASE)
+
+
+def normalize_profile_url(text: Optional[str]) -> Optional[str]:
+    """
+    Canonical form of a LinkedIn profile URL.
+
+    "https://www.linkedin.com/in/Jane-Doe/?trk=x" and "linkedin.com/in/jane-doe"
+    both become "https://linkedin.com/in/jane-doe".
+
+    Args:
+        text: Input that may be a profile URL
+
+    Returns:
+        Normalized URL, or None if the text is not a LinkedIn profile URL
+    """
+    text = (text or "").strip()
+    if not text or any(character.isspace() for character in text):
+        return None
+    parsed = urlparse(text if "://" in text else f"https://{text}")
+    host = (parsed.hostname or "").lower()
+    if host != "linkedin.com" and not host.endswith(".linkedin.com"):
+        return None
+    match = PROFILE_PATH_PATTERN.match(parsed.path)
+    if not match:
+        return None
+    return f"https://linkedin.com/{match.group(1).lower()}/{match.group(2).lower()}"
+
+
+def cache_key(profile_url: Optional[str], raw_profile: Optional[str] = None) -> str:
+    """Cache key for a profile URL, or for raw profile text when there is no URL"""
+    if profile_url:
+        return "url-" + content_hash(profile_url)[:24]
+    return "content-" + content_hash(raw_profile)[:24]
+
+
+def is_fresh(entry: Dict[str, Any]) -> bool:
+    """Whether a cache entry was fetched within the TTL by the current parser"""
+    if not entry.get("parsed_content") or entry.get("version") != LINKEDIN_PARSE_VERSION:
+        return False
+    try:
+        fetched_at = datetime.fromisoformat(entry["fetched_at"])
+    except (KeyError, TypeError, ValueError):
+        return False
+    return datetime.now(timezone.utc) - fetched_at <= LINKEDIN_PROFILE_TTL
+
+
+def profile_url_argument(tool: BaseTool) -> str:
+    """
+    Name of the tool argument that takes the profile URL.
+
+    Uses LINKEDIN_PROFILE_URL_ARG when set; otherwise the tool's only argument, or
+    its only argument with "url" in the name.
+    """
+    if LINKEDIN_PROFILE_URL_ARG:
+        return LINKEDIN_PROFILE_URL_ARG
+    arguments = list(tool.args)
+    if len(arguments) == 1:
+        return arguments[0]
+    url_arguments = [argument for argument in arguments if "url" in argument.lower()]
+    if len(url_arguments) == 1:
+        return url_arguments[0]
+    raise ValueError(
+        f"Cannot tell which {tool.name} argument takes the profile URL ({arguments}); "
+        "set LINKEDIN_PROFILE_URL_ARG"
+    )
+
+
+async def fetch_linkedin_profile(profile_url: str) -> str:
+    """
+    Fetch a profile through the pooled LinkedIn MCP session.
+
+    Args:
+        profile_url: Normalized profile URL
+
+    Returns:
+        Raw profile text
+    """
+    tools = await mcp_session_pool.get_tools(linkedin_server_params)
+    tool = next((tool for tool in tools if tool.name == LINKEDIN_PROFILE_TOOL), None)
+    if tool is None:
+        raise ValueError(f"MCP server has no {LINKEDIN_PROFILE_TOOL} tool")
+    result = await tool.ainvoke({profile_url_argument(tool): profile_url})
+    return result if isinstance(result, str) else str(result)
+
+
+async def load_cached_profile(key: str) -> Dict[str, Any]:
+    """Cached entry for a key, empty if nothing stored"""
+    return await StateDataManager.load_linkedin_profile(key)
+
+
+async def save_cached_profile(
+    key: str,
+    profile_url: Optional[str],
+    raw_profile: str,
+    parsed_content: str,
+    parsed_at: Optional[str] = None,
+) -> bool:
+    """
+    Store a fetched profile and its parse.
+
+    Args:
+        key: Cache key
+        profile_url: Normalized profile URL (None for raw text input)
+        raw_profile: Fetched profile text
+        parsed_content: Parsed output for raw_profile
+        parsed_at: When the parse was made (now if None)
+
+    Returns:
+        True if saved
+    """
+    now = datetime.now(timezone.utc).isoformat()
+    return await StateDataManager.save_linkedin_profile(
+        key,
+        {
+            "profile_url": profile_url,
+            "raw_profile": raw_profile,
+            "content_hash": content_hash(raw_profile),
+            "parsed_content": parsed_content,
+            "fetched_at": now,
+            "parsed_at": parsed_at or now,
+            "version": LINKEDIN_PARSE_VERSION,
+        },
+    )
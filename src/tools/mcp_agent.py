@@ -1,13 +1,12 @@
 import logging
-from mcp.client.stdio import stdio_client
-from mcp import ClientSession, StdioServerParameters
-from langchain_mcp_adapters.tools import load_mcp_tools
+from mcp import StdioServerParameters
 import asyncio
 from langgraph.prebuilt import create_react_agent
 from langchain_anthropic import ChatAnthropic
-from contextlib import AsyncExitStack
 import os
 
+from src.tools.mcp_session_pool import mcp_session_pool
+
 # Using fetch mcp server to fetch LinkedIn data does not work because we need authentication
 # Server parameters for HorizonDataWave LinkedIn MCP server
 # Make sure to set these environment variables in your system or .env file
@@ -25,7 +24,8 @@ linkedin_server_params = StdioServerParameters(
 async def invoke_mcp_agent(messages: list[dict[str, str]], server_params_list: list, additional_tools: list = []):
     """
     Invokes an agent with tools loaded from multiple MCP servers.
-    Keeps all sessions open for the duration of the agent call.
+    Sessions and their tool lists come from the shared pool and stay open across
+    calls; a session is restarted on the next call if this one fails.
     """
     all_tools = []
     all_tools.extend(additional_tools)
@@ -35,17 +35,18 @@ async def invoke_mcp_agent(messages: list[dict[str, str]], server_params_list: l
         stop=None
     )
 
-    async with AsyncExitStack() as stack:
-        sessions = []
-        for params in server_params_list:
-            client = await stack.enter_async_context(stdio_client(params))
-            session = await stack.enter_async_context(ClientSession(*client))
-            await asyncio.wait_for(session.initialize(), timeout=30)
-            tools = await asyncio.wait_for(load_mcp_tools(session), timeout=30)
-            logging.debug(f"Loaded tools: {tools}")
-            all_tools.extend(tools)
-            sessions.append(session)  # Keep reference if needed
+    server_tools = await asyncio.gather(
+        *(mcp_session_pool.get_tools(params) for params in server_params_list)
+    )
+    for tools in server_tools:
+        logging.debug(f"Loaded tools: {tools}")
+        all_tools.extend(tools)
 
-        agent = create_react_agent(model, all_tools)
-        result = await agent.ainvoke({"messages": messages})
-        return result
+    agent = create_react_agent(model, all_tools)
+    try:
+        return await agent.ainvoke({"messages": messages})
+    except Exception:
+        # A broken session must not be handed out again
+        for params in server_params_list:
+            await mcp_session_pool.discard_if_unhealthy(params)
+        raise
@@ -0,0 +1,234 @@
+"""
+MCP Session Pool
+
+Keeps long-lived MCP client sessions per server parameter set, so tool calls do not
+pay for a subprocess spawn (npx resolution), the initialize handshake and tool
+loading every time. Each session lives in its own background task, because the
+stdio client and ClientSession contexts must be entered and exited in the same
+task. Sessions expose a cached tool list, are pinged before reuse after a quiet
+period, evicted after an idle timeout and restarted when they fail.
+
+Sessions and locks are kept per running event loop (like llm_config.get_llm_limiter):
+an owner task and an asyncio.Lock only work on the loop that created them, so a new
+loop (another asyncio.run, a per-test loop) starts its own sessions.
+
+Usage:
+    tools = await mcp_session_pool.get_tools(linkedin_server_params)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+import weakref
+from typing import Dict, List, Optional, Tuple
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+from langchain_core.tools import BaseTool
+from langchain_mcp_adapters.tools import load_mcp_tools
+
+logging.basicConfig(level=logging.DEBUG)
+
+STARTUP_TIMEOUT_SECONDS = 30
+PING_TIMEOUT_SECONDS = 5
+# Sessions unused for this long are pinged before being handed out again
+HEALTH_CHECK_AFTER_SECONDS = 60
+IDLE_TIMEOUT_SECONDS = 15 * 60
+
+
+def server_key(params: StdioServerParameters) -> str:
+    """Stable key identifying a server parameter set"""
+    payload = json.dumps(
+        {
+            "command": params.command,
+            "args": list(params.args),
+            "env": sorted((params.env or {}).items()),
+            "cwd": str(params.cwd or ""),
+        },
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class PooledSession:
+    """One MCP client session owned by a background task"""
+
+    def __init__(self, params: StdioServerParameters) -> None:
+        self.params = params
+        self.session: Optional[ClientSession] = None
+        self.tools: List[BaseTool] = []
+        self.last_used = time.monotonic()
+        self._ready = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._error: Optional[BaseException] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_alive(self) -> bool:
+        """Whether the owning task is still holding the session open"""
+        return self._task is not None and not self._task.done() and self.session is not None
+
+    async def start(self) -> None:
+        """Spawn the server, initialize the session and load its tools"""
+        self._task = asyncio.create_task(self._run())
+        await asyncio.wait_for(self._ready.wait(), timeout=STARTUP_TIMEOUT_SECONDS * 2)
+        if self._error is not None:
+            raise self._error
+
+    async def _run(self) -> None:
+        try:
+            async with stdio_client(self.params) as (read, write):
+                async with ClientSession(read, write) as session:
+                    await asyncio.wait_for(session.initialize(), timeout=STARTUP_TIMEOUT_SECONDS)
+                    self.tools = await asyncio.wait_for(
+                        load_mcp_tools(session), timeout=STARTUP_TIMEOUT_SECONDS
+                    )
+                    self.session = session
+                    logging.debug(
+                        f"[MCPPool] Session started for {self.params.command}: "
+                        f"{[tool.name for tool in self.tools]}"
+                    )
+                    self._ready.set()
+                    await self._closing.wait()
+        except BaseException as e:
+            self._error = e
+            if not isinstance(e, asyncio.CancelledError):
+                logging.error(f"[MCPPool] Session for {self.params.command} failed: {e}")
+        finally:
+            self.session = None
+            self._ready.set()
+
+    async def ping(self) -> bool:
+        """Check the server still answers"""
+        if not self.is_alive:
+            return False
+        try:
+            await asyncio.wait_for(self.session.send_ping(), timeout=PING_TIMEOUT_SECONDS)
+            return True
+        except Exception as e:
+            logging.warning(f"[MCPPool] Ping to {self.params.command} failed: {e}")
+            return False
+
+    async def close(self) -> None:
+        """Close the session and terminate the server process"""
+        self._closing.set()
+        if self._task is not None:
+            try:
+                await asyncio.wait_for(self._task, timeout=PING_TIMEOUT_SECONDS)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                self._task.cancel()
+            except Exception:
+                pass
+
+
+class McpSessionPool:
+    """Pool of MCP sessions, one per server parameter set and event loop"""
+
+    def __init__(self, idle_timeout: float = IDLE_TIMEOUT_SECONDS) -> None:
+        self.idle_timeout = idle_timeout
+        # event loop -> (server key -> session, server key -> lock)
+        self._loops: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def _loop_state(self) -> Tuple[Dict[str, PooledSession], Dict[str, asyncio.Lock]]:
+        """Sessions and locks belonging to the running event loop"""
+        loop = asyncio.get_running_loop()
+        state = self._loops.get(loop)
+        if state is None:
+            state = self._loops[loop] = ({}, {})
+        return state
+
+    @property
+    def _sessions(self) -> Dict[str, PooledSession]:
+        return self._loop_state()[0]
+
+    async def get_session(self, params: StdioServerParameters) -> PooledSession:
+        """
+        Return a healthy session for the server, starting or restarting it if needed.
+
+        Args:
+            params: Server parameters
+
+        Returns:
+            Ready PooledSession
+        """
+        await self.evict_idle()
+        key = server_key(params)
+        lock = self._loop_state()[1].setdefault(key, asyncio.Lock())
+        async with lock:
+            pooled = self._sessions.get(key)
+            if pooled is not None:
+                quiet_for = time.monotonic() - pooled.last_used
+                healthy = pooled.is_alive and (
+                    quiet_for < HEALTH_CHECK_AFTER_SECONDS or await pooled.ping()
+                )
+                if not healthy:
+                    logging.info(f"[MCPPool] Restarting session for {params.command}")
+                    await pooled.close()
+                    pooled = None
+
+            if pooled is None:
+                pooled = PooledSession(params)
+                try:
+                    await pooled.start()
+                except BaseException:
+                    await pooled.close()
+                    self._sessions.pop(key, None)
+                    raise
+                self._sessions[key] = pooled
+
+            pooled.last_used = time.monotonic()
+            return pooled
+
+    async def get_tools(self, params: StdioServerParameters) -> List[BaseTool]:
+        """Cached tool list of the server's pooled session"""
+        return (await self.get_session(params)).tools
+
+    async def discard_if_unhealthy(self, params: StdioServerParameters) -> bool:
+        """
+        Ping a pooled session after a failed call and close it if it stopped answering.
+
+        Returns:
+            True if the session was discarded
+        """
+        pooled = self._sessions.get(server_key(params))
+        if pooled is None or await pooled.ping():
+            return False
+        await self.invalidate(params)
+        return True
+
+    async def invalidate(self, params: StdioServerParameters) -> None:
+        """Close a session after a failure so the next call starts a fresh one"""
+        pooled = self._sessions.pop(server_key(params), None)
+        if pooled is not None:
+            await pooled.close()
+
+    async def evict_idle(self) -> int:
+        """
+        Close sessions that have not been used within the idle timeout.
+
+        Returns:
+            Number of sessions closed
+        """
+        now = time.monotonic()
+        idle = [
+            key
+            for key, pooled in self._sessions.items()
+            if now - pooled.last_used > self.idle_timeout or not pooled.is_alive
+        ]
+        for key in idle:
+            pooled = self._sessions.pop(key)
+            logging.debug(f"[MCPPool] Evicting session for {pooled.params.command}")
+            await pooled.close()
+        return len(idle)
+
+    async def close_all(self) -> None:
+        """Close every pooled session of the running event loop"""
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        await asyncio.gather(*(pooled.close() for pooled in sessions))
+
+
+# Shared pool for the process
+mcp_session_pool = McpSessionPool()
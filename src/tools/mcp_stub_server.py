@@ -0,0 +1,50 @@
+"""
+Stub MCP Server
+
+Minimal local stdio MCP server for tests and offline development of MCP-based
+flows (session pool, LinkedIn fetching) without npm or third-party credentials.
+Returns canned data.
+
+Usage:
+    tools = await mcp_session_pool.get_tools(stub_server_params)
+    python -m src.tools.mcp_stub_server  # run standalone
+"""
+
+import sys
+from pathlib import Path
+
+from mcp import StdioServerParameters
+from mcp.server.fastmcp import FastMCP
+
+# Run from the repository root so "-m src.tools..." resolves from any working directory
+stub_server_params = StdioServerParameters(
+    command=sys.executable,
+    args=["-m", "src.tools.mcp_stub_server"],
+    cwd=str(Path(__file__).resolve().parents[2]),
+)
+
+server = FastMCP("stub")
+
+STUB_PROFILE = """Jane Doe
+Senior Software Engineer at Acme Corp
+Experience:
+- Senior Software Engineer, Acme Corp (Jan 2020 - Present): Built APIs serving 10M users
+- Software Engineer, Beta Inc (2017 - 2019): Migrated services to Kubernetes
+Education: BSc Computer Science, MIT (2013 - 2017)
+Skills: Python, Go, Kubernetes, PostgreSQL"""
+
+
+@server.tool()
+def get_linkedin_profile(url: str) -> str:
+    """Return a canned LinkedIn profile for any profile URL"""
+    return f"Profile URL: {url}\n{STUB_PROFILE}"
+
+
+@server.tool()
+def echo(text: str) -> str:
+    """Return the input text unchanged"""
+    return text
+
+
+if __name__ == "__main__":
+    server.run()
@@ -0,0 +1,84 @@
+"""
+Resume Artifacts Store
+
+Post-save stage for the user's resumes: whenever the full or original resume is
+saved, the job-independent artifacts (section index, skills, original/full overlap,
+token counts) are rebuilt and persisted, so every later tailoring run just loads
+them. Loading falls back to rebuilding when the stored artifacts are stale.
+"""
+
+import logging
+from typing import Optional
+
+from src.tools.state_data_manager import StateDataManager
+from src.utils.resume_artifacts import ResumeArtifacts
+
+logging.basicConfig(level=logging.DEBUG)
+
+
+async def refresh_resume_artifacts(
+    user_id: str,
+    original_resume: Optional[str] = None,
+    full_resume: Optional[str] = None,
+) -> Optional[ResumeArtifacts]:
+    """
+    Rebuild and persist the user's resume artifacts after a resume was saved.
+
+    Args:
+        user_id: User identifier
+        original_resume: Current original resume (loaded if None)
+        full_resume: Current full resume (loaded if None)
+
+    Returns:
+        Fresh ResumeArtifacts, or None if the resumes could not be loaded
+    """
+    if original_resume is None or full_resume is None:
+        load_result = await StateDataManager.load_state_data(user_id)
+        if not load_result.success:
+            logging.warning(f"[ResumeArtifacts] Could not load resumes for user {user_id}")
+            return None
+        if original_resume is None:
+            original_resume = load_result.loaded_fields.get("original_resume") or ""
+        if full_resume is None:
+            full_resume = load_result.loaded_fields.get("full_resume") or ""
+
+    stored = await StateDataManager.load_resume_artifacts(user_id)
+    if stored:
+        try:
+            artifacts = ResumeArtifacts.model_validate(stored)
+            if artifacts.is_current(original_resume, full_resume):
+                return artifacts
+        except ValueError:
+            pass
+
+    document = await StateDataManager.load_resume_document(user_id, full_resume)
+    artifacts = ResumeArtifacts.build(original_resume, full_resume, document)
+    await StateDataManager.save_resume_artifacts(user_id, artifacts.model_dump())
+
+    logging.debug(
+        f"[ResumeArtifacts] Built for user {user_id}: {len(artifacts.sections)} sections, "
+        f"{len(artifacts.skills)} skills, ~{artifacts.full_tokens - artifacts.supplement_tokens} "
+        f"tokens deduplicated"
+    )
+    return artifacts
+
+
+async def load_resume_artifacts(
+    user_id: str, original_resume: Optional[str], full_resume: Optional[str]
+) -> Optional[ResumeArtifacts]:
+    """
+    Load the artifacts for the given resumes, rebuilding them only if stale.
+
+    Args:
+        user_id: User identifier
+        original_resume: Original resume the caller is working with
+        full_resume: Full resume the caller is working with
+
+    Returns:
+        ResumeArtifacts matching both resumes, or None on failure
+    """
+    try:
+        return await refresh_resume_artifacts(user_id, original_resume or "", full_resume or "")
+    except Exception as e:
+        logging.error(f"[ResumeArtifacts] Error loading artifacts for user {user_id}: {e}")
+        return None
@@ -0,0 +1,511 @@
+"""
+Durable SQLite Checkpointer
+
+Local LangGraph checkpoint saver that stores channel values and pending writes as
+content-addressed blobs. Each checkpoint only references blobs by hash, so large
+state fields (full_resume, job_description, tailored_resume, ...) are serialized and
+stored once no matter how many supersteps or threads carry them.
+
+Finished threads are cleaned up with prune(), which drops threads idle past a TTL,
+trims history of the remaining threads and garbage-collects unreferenced blobs.
+"""
+
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator, Sequence
+from typing import Any, Dict, Optional, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+from langgraph.checkpoint.serde.types import TASKS
+
+logging.basicConfig(level=logging.DEBUG)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    hash TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    data BLOB
+);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    parent_checkpoint_id TEXT,
+    checkpoint_type TEXT NOT NULL,
+    checkpoint BLOB NOT NULL,
+    metadata_type TEXT NOT NULL,
+    metadata BLOB NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+);
+CREATE TABLE IF NOT EXISTS channel_values (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    channel TEXT NOT NULL,
+    version TEXT NOT NULL,
+    blob_hash TEXT,
+    PRIMARY KEY (thread_id, checkpoint_ns, channel, version)
+);
+CREATE TABLE IF NOT EXISTS checkpoint_channels (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    channel TEXT NOT NULL,
+    version TEXT NOT NULL,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, channel)
+);
+CREATE TABLE IF NOT EXISTS writes (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    channel TEXT NOT NULL,
+    blob_hash TEXT NOT NULL,
+    task_path TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+);
+CREATE INDEX IF NOT EXISTS idx_checkpoints_thread_created
+    ON checkpoints (thread_id, created_at);
+"""
+
+
+class BlobSqliteSaver(BaseCheckpointSaver[int]):
+    """
+    SQLite checkpoint saver with content-addressed blob storage.
+
+    Only channels listed in new_versions are serialized on each put, and the
+    serialized bytes are keyed by their SHA-256 hash, so an unchanged resume is
+    never written twice. Async methods run the sqlite calls in a worker thread.
+
+    Args:
+        db_path: SQLite database file (":memory:" for an ephemeral store)
+    """
+
+    def __init__(self, db_path: str, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
+
+    # Blob helpers
+
+    def _store_blob(self, value: Any) -> str:
+        """Serialize a value and store it once under its content hash"""
+        type_, data = self.serde.dumps_typed(value)
+        blob_hash = hashlib.sha256(type_.encode("utf-8") + b"\x1f" + data).hexdigest()
+        self._conn.execute(
+            "INSERT OR IGNORE INTO blobs (hash, type, data) VALUES (?, ?, ?)",
+            (blob_hash, type_, data),
+        )
+        return blob_hash
+
+    def _load_blob(self, blob_hash: str) -> Any:
+        """Load and deserialize a blob by hash"""
+        row = self._conn.execute(
+            "SELECT type, data FROM blobs WHERE hash = ?", (blob_hash,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(f"Missing checkpoint blob {blob_hash}")
+        return self.serde.loads_typed((row[0], row[1]))
+
+    def _load_channel_values(
+        self, thread_id: str, checkpoint_ns: str, versions: ChannelVersions
+    ) -> Dict[str, Any]:
+        """Resolve the channel values referenced by a checkpoint's channel versions"""
+        values = {}
+        for channel, version in versions.items():
+            row = self._conn.execute(
+                "SELECT blob_hash FROM channel_values WHERE thread_id = ? AND "
+                "checkpoint_ns = ? AND channel = ? AND version = ?",
+                (thread_id, checkpoint_ns, channel, str(version)),
+            ).fetchone()
+            if row and row[0]:
+                values[channel] = self._load_blob(row[0])
+        return values
+
+    def _build_tuple(self, row: Tuple) -> CheckpointTuple:
+        """Assemble a CheckpointTuple from a checkpoints table row"""
+        (
+            thread_id,
+            checkpoint_ns,
+            checkpoint_id,
+            parent_checkpoint_id,
+            checkpoint_type,
+            checkpoint_data,
+            metadata_type,
+            metadata_data,
+        ) = row
+        checkpoint = self.serde.loads_typed((checkpoint_type, checkpoint_data))
+
+        writes = self._conn.execute(
+            "SELECT task_id, channel, blob_hash FROM writes WHERE thread_id = ? AND "
+            "checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
+            (thread_id, checkpoint_ns, checkpoint_id),
+        ).fetchall()
+
+        pending_sends = []
+        if parent_checkpoint_id:
+            sends = self._conn.execute(
+                "SELECT blob_hash FROM writes WHERE thread_id = ? AND checkpoint_ns = ? "
+                "AND checkpoint_id = ? AND channel = ? ORDER BY task_path, task_id, idx",
+                (thread_id, checkpoint_ns, parent_checkpoint_id, TASKS),
+            ).fetchall()
+            pending_sends = [self._load_blob(send[0]) for send in sends]
+
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint={
+                **checkpoint,
+                "channel_values": self._load_channel_values(
+                    thread_id, checkpoint_ns, checkpoint["channel_versions"]
+                ),
+                "pending_sends": pending_sends,
+            },
+            metadata=self.serde.loads_typed((metadata_type, metadata_data)),
+            parent_config=(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": parent_checkpoint_id,
+                    }
+                }
+                if parent_checkpoint_id
+                else None
+            ),
+            pending_writes=[
+                (task_id, channel, self._load_blob(blob_hash))
+                for task_id, channel, blob_hash in writes
+            ],
+        )
+
+    # BaseCheckpointSaver interface
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        """Get the requested checkpoint, or the latest one for the thread"""
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        columns = (
+            "thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, "
+            "checkpoint_type, checkpoint, metadata_type, metadata"
+        )
+        with self._lock:
+            if checkpoint_id := get_checkpoint_id(config):
+                row = self._conn.execute(
+                    f"SELECT {columns} FROM checkpoints WHERE thread_id = ? AND "
+                    "checkpoint_ns = ? AND checkpoint_id = ?",
+                    (thread_id, checkpoint_ns, checkpoint_id),
+                ).fetchone()
+            else:
+                row = self._conn.execute(
+                    f"SELECT {columns} FROM checkpoints WHERE thread_id = ? AND "
+                    "checkpoint_ns = ? ORDER BY checkpoint_id DESC LIMIT 1",
+                    (thread_id, checkpoint_ns),
+                ).fetchone()
+            return self._build_tuple(row) if row else None
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        """List checkpoints newest first, optionally filtered by metadata"""
+        query = (
+            "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, "
+            "checkpoint_type, checkpoint, metadata_type, metadata FROM checkpoints"
+        )
+        conditions, params = [], []
+        if config:
+            conditions.append("thread_id = ?")
+            params.append(config["configurable"]["thread_id"])
+            checkpoint_ns = config["configurable"].get("checkpoint_ns")
+            if checkpoint_ns is not None:
+                conditions.append("checkpoint_ns = ?")
+                params.append(checkpoint_ns)
+            if checkpoint_id := get_checkpoint_id(config):
+                conditions.append("checkpoint_id = ?")
+                params.append(checkpoint_id)
+        if before and (before_id := get_checkpoint_id(before)):
+            conditions.append("checkpoint_id < ?")
+            params.append(before_id)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY checkpoint_id DESC"
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        yielded = 0
+        for row in rows:
+            if limit is not None and yielded >= limit:
+                break
+            with self._lock:
+                checkpoint_tuple = self._build_tuple(row)
+            if filter and not all(
+                checkpoint_tuple.metadata.get(key) == value
+                for key, value in filter.items()
+            ):
+                continue
+            yielded += 1
+            yield checkpoint_tuple
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Save a checkpoint, storing only the channels that changed"""
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        parent_checkpoint_id = config["configurable"].get("checkpoint_id")
+
+        stripped = checkpoint.copy()
+        stripped.pop("pending_sends", None)
+        values: Dict[str, Any] = stripped.pop("channel_values")
+        checkpoint_type, checkpoint_data = self.serde.dumps_typed(stripped)
+        metadata_type, metadata_data = self.serde.dumps_typed(
+            get_checkpoint_metadata(config, metadata)
+        )
+
+        with self._lock:
+            for channel, version in new_versions.items():
+                blob_hash = self._store_blob(values[channel]) if channel in values else None
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO channel_values (thread_id, checkpoint_ns, "
+                    "channel, version, blob_hash) VALUES (?, ?, ?, ?, ?)",
+                    (thread_id, checkpoint_ns, channel, str(version), blob_hash),
+                )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO checkpoint_channels (thread_id, checkpoint_ns, "
+                "checkpoint_id, channel, version) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (thread_id, checkpoint_ns, checkpoint["id"], channel, str(version))
+                    for channel, version in checkpoint["channel_versions"].items()
+                ],
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, "
+                "checkpoint_id, parent_checkpoint_id, checkpoint_type, checkpoint, "
+                "metadata_type, metadata, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint["id"],
+                    parent_checkpoint_id,
+                    checkpoint_type,
+                    checkpoint_data,
+                    metadata_type,
+                    metadata_data,
+                    time.time(),
+                ),
+            )
+            self._conn.commit()
+
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Save intermediate writes linked to a checkpoint"""
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        with self._lock:
+            for idx, (channel, value) in enumerate(writes):
+                # Special writes (errors, interrupts) overwrite, regular writes are idempotent
+                verb = "INSERT OR REPLACE" if channel in WRITES_IDX_MAP else "INSERT OR IGNORE"
+                self._conn.execute(
+                    f"{verb} INTO writes (thread_id, checkpoint_ns, checkpoint_id, "
+                    "task_id, idx, channel, blob_hash, task_path) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        thread_id,
+                        checkpoint_ns,
+                        checkpoint_id,
+                        task_id,
+                        WRITES_IDX_MAP.get(channel, idx),
+                        channel,
+                        self._store_blob(value),
+                        task_path,
+                    ),
+                )
+            self._conn.commit()
+
+    def delete_thread(self, thread_id: str) -> None:
+        """Delete all checkpoints and writes of a thread"""
+        with self._lock:
+            for table in ("checkpoints", "channel_values", "checkpoint_channels", "writes"):
+                self._conn.execute(f"DELETE FROM {table} WHERE thread_id = ?", (thread_id,))
+            self._conn.commit()
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        checkpoint_tuples = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for checkpoint_tuple in checkpoint_tuples:
+            yield checkpoint_tuple
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+    # Retention
+
+    def prune(self, ttl_seconds: float, keep_latest: int = 1) -> Dict[str, int]:
+        """
+        Compact checkpoint storage.
+
+        Threads whose most recent checkpoint is older than ttl_seconds are treated as
+        finished and deleted. Remaining threads keep only their keep_latest newest
+        checkpoints per namespace. Channel values and blobs that are no longer
+        referenced are garbage-collected afterwards.
+
+        Args:
+            ttl_seconds: Idle time after which a thread is considered finished
+            keep_latest: Number of newest checkpoints to keep for live threads
+
+        Returns:
+            Dictionary with counts of deleted threads, checkpoints and blobs
+        """
+        cutoff = time.time() - ttl_seconds
+        with self._lock:
+            expired_threads = [
+                row[0]
+                for row in self._conn.execute(
+                    "SELECT thread_id FROM checkpoints GROUP BY thread_id "
+                    "HAVING MAX(created_at) < ?",
+                    (cutoff,),
+                ).fetchall()
+            ]
+            for thread_id in expired_threads:
+                for table in ("checkpoints", "channel_values", "checkpoint_channels", "writes"):
+                    self._conn.execute(
+                        f"DELETE FROM {table} WHERE thread_id = ?", (thread_id,)
+                    )
+
+            # Trim history of live threads, keeping parents of kept checkpoints for pending sends
+            stale = self._conn.execute(
+                "SELECT thread_id, checkpoint_ns, checkpoint_id FROM ("
+                "  SELECT thread_id, checkpoint_ns, checkpoint_id, ROW_NUMBER() OVER ("
+                "    PARTITION BY thread_id, checkpoint_ns ORDER BY checkpoint_id DESC"
+                "  ) AS position FROM checkpoints"
+                ") WHERE position > ?",
+                (keep_latest,),
+            ).fetchall()
+            for thread_id, checkpoint_ns, checkpoint_id in stale:
+                key = (thread_id, checkpoint_ns, checkpoint_id)
+                self._conn.execute(
+                    "DELETE FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? "
+                    "AND checkpoint_id = ?",
+                    key,
+                )
+                self._conn.execute(
+                    "DELETE FROM checkpoint_channels WHERE thread_id = ? AND "
+                    "checkpoint_ns = ? AND checkpoint_id = ?",
+                    key,
+                )
+                self._conn.execute(
+                    "DELETE FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND "
+                    "checkpoint_id = ? AND NOT EXISTS (SELECT 1 FROM checkpoints c WHERE "
+                    "c.thread_id = writes.thread_id AND c.checkpoint_ns = writes.checkpoint_ns "
+                    "AND c.parent_checkpoint_id = writes.checkpoint_id)",
+                    key,
+                )
+
+            self._conn.execute(
+                "DELETE FROM channel_values WHERE NOT EXISTS (SELECT 1 FROM "
+                "checkpoint_channels cc WHERE cc.thread_id = channel_values.thread_id AND "
+                "cc.checkpoint_ns = channel_values.checkpoint_ns AND "
+                "cc.channel = channel_values.channel AND cc.version = channel_values.version)"
+            )
+            deleted_blobs = self._conn.execute(
+                "DELETE FROM blobs WHERE hash NOT IN (SELECT blob_hash FROM channel_values "
+                "WHERE blob_hash IS NOT NULL) AND hash NOT IN (SELECT blob_hash FROM writes)"
+            ).rowcount
+            self._conn.commit()
+            self._conn.execute("VACUUM")
+
+        logging.debug(
+            f"[Checkpointer] Pruned {len(expired_threads)} threads, "
+            f"{len(stale)} checkpoints, {deleted_blobs} blobs"
+        )
+        return {
+            "threads": len(expired_threads),
+            "checkpoints": len(stale),
+            "blobs": deleted_blobs,
+        }
+
+    async def aprune(self, ttl_seconds: float, keep_latest: int = 1) -> Dict[str, int]:
+        return await asyncio.to_thread(self.prune, ttl_seconds, keep_latest)
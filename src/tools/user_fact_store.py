@@ -0,0 +1,127 @@
+"""
+User Fact Store
+
+Facts a user provided during info collection, indexed by normalized topic so later
+jobs can answer the same missing-info questions without interrupting the user again.
+Persistence goes through StateDataManager (one row per user and topic, so jobs
+finishing info collection at the same time do not overwrite each other's facts).
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, Tuple
+
+from src.tools.state_data_manager import StateDataManager
+from src.utils.text_utils import distinctive_topic_tokens, normalize_topic, topic_similarity
+
+logging.basicConfig(level=logging.DEBUG)
+
+# Minimum token overlap for a stored topic to answer a differently-phrased question
+TOPIC_MATCH_THRESHOLD = 0.6
+
+
+def topic_match_score(first: Optional[str], second: Optional[str]) -> float:
+    """
+    Similarity of two topics, 0 unless their distinctive tokens are identical.
+
+    Generic words ("experience", "production") may differ, but a topic about Python
+    never answers one about Java however much of the phrasing they share.
+    """
+    first_tokens = distinctive_topic_tokens(first)
+    if not first_tokens or first_tokens != distinctive_topic_tokens(second):
+        return 0.0
+    return topic_similarity(first, second)
+
+
+def find_fact(store: Dict[str, Any], topic: str) -> Optional[Dict[str, Any]]:
+    """
+    Look up the stored fact that best answers a topic.
+
+    Exact normalized-key hits are returned directly, otherwise the most similar
+    stored topic with the same distinctive tokens and at least TOPIC_MATCH_THRESHOLD
+    similarity is used.
+
+    Args:
+        store: Fact store loaded via StateDataManager.load_user_facts
+        topic: Missing-info item to answer
+
+    Returns:
+        Stored fact entry, or None if the topic was never answered
+    """
+    key = normalize_topic(topic)
+    if not key:
+        return None
+    if key in store:
+        return store[key]
+
+    best_entry, best_score = None, TOPIC_MATCH_THRESHOLD
+    for entry in store.values():
+        score = topic_match_score(topic, entry.get("topic"))
+        if score >= best_score:
+            best_entry, best_score = entry, score
+    return best_entry
+
+
+def split_answered(
+    store: Dict[str, Any], missing_info: List[str]
+) -> Tuple[Dict[str, str], List[str]]:
+    """
+    Separate missing-info items the store already answers from new ones.
+
+    Args:
+        store: Fact store loaded via StateDataManager.load_user_facts
+        missing_info: Items a node wants to ask the user about
+
+    Returns:
+        Tuple of (item -> known fact, items still unanswered)
+    """
+    answered: Dict[str, str] = {}
+    unanswered: List[str] = []
+    for item in missing_info or []:
+        entry = find_fact(store, item)
+        if entry:
+            answered[item] = entry["fact"]
+        else:
+            unanswered.append(item)
+    return answered, unanswered
+
+
+def format_known_facts(store: Dict[str, Any]) -> str:
+    """Render stored facts as compact "topic: fact" lines for prompts"""
+    return "\n".join(
+        f"- {entry['topic']}: {entry['fact']}" for entry in store.values()
+    )
+
+
+async def record_facts(
+    user_id: str, facts: Dict[str, str], job_id: Optional[str] = None
+) -> bool:
+    """
+    Write newly collected facts back to the user's store.
+
+    Only the new entries are upserted; the store is not read and rewritten.
+
+    Args:
+        user_id: User identifier
+        facts: Missing-info item -> fact collected from the user
+        job_id: Job the facts were collected for (kept for provenance)
+
+    Returns:
+        True if the store was saved (or nothing needed saving), False otherwise
+    """
+    facts = {topic: fact for topic, fact in (facts or {}).items() if normalize_topic(topic)}
+    if not facts:
+        return True
+
+    entries: Dict[str, Any] = {}
+    updated_at = datetime.now(timezone.utc).isoformat()
+    for topic, fact in facts.items():
+        entries[normalize_topic(topic)] = {
+            "topic": topic,
+            "fact": fact,
+            "job_id": job_id,
+            "updated_at": updated_at,
+        }
+
+    logging.debug(f"[FactStore] Recording {len(facts)} facts for user {user_id}")
+    return await StateDataManager.save_user_facts(user_id, entries)
@@ -0,0 +1,235 @@
+"""
+Job Description Normalization
+
+Deterministic cleanup of scraped job postings before analysis: whitespace and
+unicode normalization, a rule library for common boilerplate (EEO statements,
+accommodation notices, benefits lists, cookie/privacy banners, apply-now footers) and removal of
+paragraphs the user has already seen across several other postings (shared
+company blurbs). No model calls.
+"""
+
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+from src.utils.text_utils import content_hash, estimate_tokens, normalize_text
+
+# Bump when the rules change so cached normalized texts are rebuilt
+NORMALIZER_VERSION = 2
+
+# A paragraph seen in at least this many other postings is treated as boilerplate
+BOILERPLATE_MIN_POSTINGS = 3
+# Very short paragraphs (headings, single skills) are never frequency-stripped
+BOILERPLATE_MIN_WORDS = 12
+
+BOILERPLATE_RULES: Dict[str, re.Pattern] = {
+    "eeo": re.compile(
+        r"equal (?:employment )?opportunity|without regard to (?:race|age|sex)|"
+        r"race,? colou?r,? religion|sexual orientation|gender identity|protected veteran|"
+        r"affirmative action|e-?verify",
+        re.IGNORECASE,
+    ),
+    "accommodation": re.compile(
+        r"reasonable accommodation|accommodations? (?:is|are) available|"
+        r"disabilit(?:y|ies).{0,40}(?:apply|application|request)",
+        re.IGNORECASE,
+    ),
+    "cookies": re.compile(
+        r"\bcookies?\b.{0,80}(?:accept|consent|preferences|policy)|"
+        r"accept all cookies|manage (?:cookie )?preferences",
+        re.IGNORECASE,
+    ),
+    "privacy": re.compile(
+        r"privacy (?:notice|policy|statement)|applicant privacy|"
+        r"how we (?:collect|use|process) (?:your )?personal (?:data|information)",
+        re.IGNORECASE,
+    ),
+    "recruiting_fraud": re.compile(
+        r"recruit(?:ment|ing) (?:fraud|scam)|never ask (?:you )?for (?:money|payment)",
+        re.IGNORECASE,
+    ),
+    "apply_footer": re.compile(
+        r"^(?:apply (?:now|today|for this job)|save job|share (?:this )?job|"
+        r"report (?:this )?job|show more|show less|see more|back to (?:search|jobs))\W*$",
+        re.IGNORECASE,
+    ),
+}
+
+# Heading of a benefits/perks block; the block runs until the next heading
+BENEFITS_HEADING_PATTERN = re.compile(
+    r"^\W*(?:our |the )?(?:benefits|perks|compensation (?:&|and) benefits|benefits (?:&|and) perks|"
+    r"what we offer|what you(?:'ll| will) get|why (?:join|work (?:for|with)) us)\b.{0,40}$",
+    re.IGNORECASE,
+)
+HEADING_LINE_PATTERN = re.compile(r"^(?:#{1,6}\s+.+|\*\*[^*]+\*\*:?|[^.!?]{2,60}:)$")
+# Plain-text section names that end a benefits block even without heading markup
+SECTION_NAME_PATTERN = re.compile(
+    r"^\W*(?:about (?:the|this) (?:role|job|position|team)|about you|who you are|"
+    r"(?:key |core |basic |minimum |preferred |required |desired )?"
+    r"(?:requirements|responsibilities|qualifications|skills)|"
+    r"what you(?:'ll| will) (?:do|bring|need)|what we(?:'re| are) looking for|"
+    r"(?:the|your) role|nice to haves?|bonus points|must haves?|duties|"
+    r"day[- ]to[- ]day|you (?:have|bring|will))\b.{0,40}$",
+    re.IGNORECASE,
+)
+# A standalone line this short without sentence punctuation reads as a heading
+SHORT_HEADING_MAX_WORDS = 5
+BULLET_LINE_PATTERN = re.compile(r"^(?:[-*+\u2022]|\d+[.)])\s+")
+SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?])\s+")
+# Rule-matched units must make up at least this share of a paragraph to remove it
+RULE_DOMINANCE_THRESHOLD = 0.5
+
+INVISIBLE_CHARACTERS = dict.fromkeys(map(ord, "​‌‍⁠﻿"), None)
+
+
+@dataclass
+class NormalizedJobDescription:
+    """Cleaned job description and what was removed from it"""
+
+    text: str
+    source_hash: str
+    removed: Dict[str, int] = field(default_factory=dict)
+    original_tokens: int = 0
+    normalized_tokens: int = 0
+    version: int = NORMALIZER_VERSION
+
+    @property
+    def saved_tokens(self) -> int:
+        """Estimated tokens saved per prompt that includes the job description"""
+        return self.original_tokens - self.normalized_tokens
+
+
+def clean_whitespace(text: str) -> str:
+    """Normalize unicode, strip invisible characters and collapse blank lines"""
+    text = unicodedata.normalize("NFKC", text or "").translate(INVISIBLE_CHARACTERS)
+    lines = [re.sub(r"[ \t]+", " ", line).strip() for line in text.splitlines()]
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip()
+
+
+def split_paragraphs(text: str) -> List[str]:
+    """Split cleaned text into blank-line separated paragraphs"""
+    return [paragraph for paragraph in text.split("\n\n") if paragraph.strip()]
+
+
+def paragraph_key(paragraph: str) -> str:
+    """Stable key for cross-posting frequency counts"""
+    return content_hash(normalize_text(paragraph))[:16]
+
+
+def boilerplate_keys(paragraphs: Iterable[str]) -> List[str]:
+    """Keys of the paragraphs long enough to be counted as potential boilerplate"""
+    return [
+        paragraph_key(paragraph)
+        for paragraph in paragraphs
+        if len(normalize_text(paragraph).split()) >= BOILERPLATE_MIN_WORDS
+    ]
+
+
+def _is_heading(line: str, standalone: bool) -> bool:
+    """Whether a line starts a new section (ending any benefits block)"""
+    if BULLET_LINE_PATTERN.match(line):
+        return False
+    if (
+        HEADING_LINE_PATTERN.match(line)
+        or BENEFITS_HEADING_PATTERN.match(line)
+        or SECTION_NAME_PATTERN.match(line)
+    ):
+        return True
+    return (
+        standalone
+        and len(line.split()) <= SHORT_HEADING_MAX_WORDS
+        and not line.rstrip().endswith((".", "!", "?", ","))
+    )
+
+
+def _matching_rule(paragraph: str) -> Optional[str]:
+    """
+    Boilerplate rule that dominates a paragraph, if any.
+
+    Each line (and each sentence of a prose line) is matched on its own; the paragraph
+    is only boilerplate when matching units make up most of it, so a single mention
+    inside a responsibilities list does not remove the list.
+    """
+    units = [
+        sentence
+        for line in paragraph.splitlines()
+        for sentence in SENTENCE_SPLIT_PATTERN.split(line.strip())
+        if sentence.strip()
+    ]
+    if not units:
+        return None
+
+    matches: Dict[str, int] = {}
+    matched_units = 0
+    for unit in units:
+        rule = next(
+            (name for name, pattern in BOILERPLATE_RULES.items() if pattern.search(unit)),
+            None,
+        )
+        if rule:
+            matched_units += 1
+            matches[rule] = matches.get(rule, 0) + 1
+
+    if matched_units / len(units) < RULE_DOMINANCE_THRESHOLD:
+        return None
+    return max(matches, key=matches.get)
+
+
+def normalize_job_description(
+    text: str, paragraph_counts: Optional[Dict[str, List[str]]] = None, job_id: str = ""
+) -> NormalizedJobDescription:
+    """
+    Strip boilerplate from a job description.
+
+    Args:
+        text: Raw job posting text
+        paragraph_counts: paragraph_key -> job ids it was seen in (other postings)
+        job_id: Current job, excluded from the cross-posting count
+
+    Returns:
+        NormalizedJobDescription with the cleaned text
+    """
+    paragraph_counts = paragraph_counts or {}
+    kept: List[str] = []
+    removed: Dict[str, int] = {}
+
+    in_benefits = False
+    for paragraph in split_paragraphs(clean_whitespace(text)):
+        # Benefits blocks are cut line by line: they run until the next section heading
+        lines = paragraph.splitlines()
+        content: List[str] = []
+        for line in lines:
+            if _is_heading(line.strip(), standalone=len(lines) == 1):
+                starts_benefits = bool(BENEFITS_HEADING_PATTERN.match(line.strip()))
+                if starts_benefits:
+                    removed["benefits"] = removed.get("benefits", 0) + 1
+                in_benefits = starts_benefits
+            if not in_benefits:
+                content.append(line)
+        if not content:
+            continue
+        paragraph = "\n".join(content)
+
+        reason = _matching_rule(paragraph)
+        if reason is None and len(normalize_text(paragraph).split()) >= BOILERPLATE_MIN_WORDS:
+            seen_in = set(paragraph_counts.get(paragraph_key(paragraph), [])) - {job_id}
+            if len(seen_in) >= BOILERPLATE_MIN_POSTINGS:
+                reason = "repeated"
+        if reason:
+            removed[reason] = removed.get(reason, 0) + 1
+            continue
+        kept.append(paragraph)
+
+    normalized = "\n\n".join(kept)
+    # Never hand an empty posting to the analysis nodes
+    if not normalized.strip():
+        normalized = clean_whitespace(text)
+
+    return NormalizedJobDescription(
+        text=normalized,
+        source_hash=content_hash(text),
+        removed=removed,
+        original_tokens=estimate_tokens(text),
+        normalized_tokens=estimate_tokens(normalized),
+    )
@@ -0,0 +1,264 @@
+"""
+Keyword Coverage Engine
+
+Deterministic ATS-style keyword matching between a job description and a resume.
+Keywords come from a skill dictionary (with aliases) and from repeated n-grams of
+the job description; all variants are compiled into one Aho-Corasick automaton so
+any resume is scanned for every keyword in a single pass. No model calls.
+"""
+
+import re
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from src.utils.tfidf_index import STOPWORDS
+
+# Canonical skill -> aliases (matched case-insensitively on word boundaries).
+# Aliases that are common English words ("go", "rest", "excel") are left out.
+SKILL_DICTIONARY: Dict[str, List[str]] = {
+    "python": ["python"],
+    "java": ["java"],
+    "javascript": ["javascript", "js", "ecmascript"],
+    "typescript": ["typescript"],
+    "go": ["golang", "go lang"],
+    "rust": ["rust"],
+    "c++": ["c++", "cpp"],
+    "c#": ["c#", ".net", "dotnet"],
+    "ruby": ["ruby", "rails", "ruby on rails"],
+    "php": ["php"],
+    "scala": ["scala"],
+    "kotlin": ["kotlin"],
+    "swift": ["swiftui", "swift programming"],
+    "sql": ["sql"],
+    "postgresql": ["postgresql", "postgres"],
+    "mysql": ["mysql"],
+    "mongodb": ["mongodb", "mongo"],
+    "redis": ["redis"],
+    "elasticsearch": ["elasticsearch", "elastic search", "opensearch"],
+    "kafka": ["kafka"],
+    "spark": ["spark", "pyspark"],
+    "airflow": ["airflow"],
+    "dbt": ["dbt"],
+    "snowflake": ["snowflake"],
+    "react": ["react", "react.js", "reactjs"],
+    "next.js": ["next.js", "nextjs"],
+    "vue": ["vue", "vue.js"],
+    "angular": ["angular"],
+    "node.js": ["node.js", "nodejs"],
+    "django": ["django"],
+    "flask": ["flask"],
+    "fastapi": ["fastapi"],
+    "spring": ["spring", "spring boot"],
+    "graphql": ["graphql"],
+    "rest api": ["restful", "rest api", "rest apis"],
+    "grpc": ["grpc"],
+    "microservices": ["microservices", "microservice"],
+    "aws": ["aws", "amazon web services"],
+    "gcp": ["gcp", "google cloud"],
+    "azure": ["azure"],
+    "docker": ["docker"],
+    "kubernetes": ["kubernetes", "k8s"],
+    "terraform": ["terraform"],
+    "ci/cd": ["ci/cd", "continuous integration", "continuous delivery", "continuous deployment"],
+    "linux": ["linux"],
+    "git": ["git"],
+    "machine learning": ["machine learning", "ml"],
+    "deep learning": ["deep learning"],
+    "llm": ["llm", "llms", "large language models", "large language model"],
+    "nlp": ["nlp", "natural language processing"],
+    "pytorch": ["pytorch"],
+    "tensorflow": ["tensorflow"],
+    "langchain": ["langchain"],
+    "data analysis": ["data analysis", "data analytics"],
+    "distributed systems": ["distributed systems"],
+    "system design": ["system design"],
+    "agile": ["agile", "scrum"],
+    "product management": ["product management"],
+    "stakeholder management": ["stakeholder management"],
+    "leadership": ["leadership", "mentored", "mentoring"],
+    "figma": ["figma"],
+    "tableau": ["tableau"],
+    "excel": ["microsoft excel", "ms excel"],
+}
+
+WORD_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#./-]*[a-z0-9+#]|[a-z0-9]")
+WORD_CHARACTER = re.compile(r"[a-z0-9+#]")
+# Short aliases ("js", "ml", "sql") need a real separator around them, so "js" does
+# not match inside "react.js"; a "." after them only counts when it ends a sentence
+SHORT_ALIAS_LENGTH = 3
+SHORT_ALIAS_SEPARATOR = re.compile(r"[\s,;:()\[\]|/]")
+NGRAM_SIZES = (2, 3)
+NGRAM_MIN_COUNT = 2
+MAX_NGRAM_KEYWORDS = 25
+
+
+class AhoCorasick:
+    """Multi-pattern matcher: finds every occurrence of all patterns in one scan"""
+
+    def __init__(self, patterns: Dict[str, str]) -> None:
+        """
+        Build the automaton.
+
+        Args:
+            patterns: pattern text (lowercase) -> keyword it reports
+        """
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[List[Tuple[str, int]]] = [[]]
+
+        for pattern, keyword in patterns.items():
+            state = 0
+            for character in pattern:
+                next_state = self.goto[state].get(character)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][character] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                state = next_state
+            self.output[state].append((keyword, len(pattern)))
+
+        # Breadth-first failure links; outputs of the fail state are inherited
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for character, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and character not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(character, 0)
+                if self.fail[next_state] == next_state:
+                    self.fail[next_state] = 0
+                self.output[next_state] = self.output[next_state] + self.output[self.fail[next_state]]
+
+    def find(self, text: str) -> Iterable[Tuple[str, int, int]]:
+        """Yield (keyword, start, end) for every pattern occurrence in text"""
+        state = 0
+        for index, character in enumerate(text):
+            while state and character not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(character, 0)
+            for keyword, length in self.output[state]:
+                yield keyword, index - length + 1, index + 1
+
+    def find_words(self, text: str) -> Set[str]:
+        """Keywords whose occurrences start and end on word boundaries"""
+        found = set()
+        for keyword, start, end in self.find(text):
+            before = text[start - 1] if start else " "
+            after = text[end] if end < len(text) else " "
+            if end - start <= SHORT_ALIAS_LENGTH:
+                if after == "." and (end + 1 == len(text) or text[end + 1].isspace()):
+                    after = " "
+                if SHORT_ALIAS_SEPARATOR.match(before) and SHORT_ALIAS_SEPARATOR.match(after):
+                    found.add(keyword)
+            elif not WORD_CHARACTER.match(before) and not WORD_CHARACTER.match(after):
+                found.add(keyword)
+        return found
+
+
+def prepare_text(text: Optional[str]) -> str:
+    """Lowercase, treat hyphenated words as separate words and collapse whitespace"""
+    text = re.sub(r"(?<=[a-z0-9])-(?=[a-z0-9])", " ", (text or "").lower())
+    return re.sub(r"\s+", " ", text)
+
+
+@lru_cache(maxsize=1)
+def skill_automaton() -> AhoCorasick:
+    """Automaton over every alias of the skill dictionary"""
+    return AhoCorasick(
+        {alias: skill for skill, aliases in SKILL_DICTIONARY.items() for alias in aliases}
+    )
+
+
+def extract_ngram_keywords(text: str, limit: int = MAX_NGRAM_KEYWORDS) -> List[str]:
+    """
+    Repeated 2-3 word phrases of a text, without stopwords at either edge.
+
+    Args:
+        text: Job description
+        limit: Maximum number of phrases
+
+    Returns:
+        Phrases, most frequent first
+    """
+    counts: Counter = Counter()
+    for line in (text or "").splitlines():
+        line = prepare_text(line)
+        words = WORD_PATTERN.findall(line)
+        for size in NGRAM_SIZES:
+            for start in range(len(words) - size + 1):
+                gram = words[start : start + size]
+                if gram[0] in STOPWORDS or gram[-1] in STOPWORDS or any(w.isdigit() for w in gram):
+                    continue
+                counts[" ".join(gram)] += 1
+
+    phrases = sorted(
+        (phrase for phrase, count in counts.items() if count >= NGRAM_MIN_COUNT),
+        key=lambda phrase: (-counts[phrase], -len(phrase.split())),
+    )
+    # Drop shorter phrases that only occur inside a kept longer one
+    kept: List[str] = []
+    for phrase in phrases:
+        if not any(phrase in longer and counts[longer] >= counts[phrase] for longer in kept):
+            kept.append(phrase)
+    return kept[:limit]
+
+
+@dataclass
+class KeywordCoverage:
+    """Which job description keywords a resume covers"""
+
+    keywords: List[str] = field(default_factory=list)
+    covered: List[str] = field(default_factory=list)
+    missing: List[str] = field(default_factory=list)
+
+    @property
+    def coverage(self) -> float:
+        """Share of keywords covered (1.0 when the job has no keywords)"""
+        return len(self.covered) / len(self.keywords) if self.keywords else 1.0
+
+
+def extract_job_keywords(job_description: str) -> List[str]:
+    """Dictionary skills mentioned in the job description plus its repeated phrases"""
+    skills = sorted(skill_automaton().find_words(prepare_text(job_description)))
+    phrases = [
+        phrase
+        for phrase in extract_ngram_keywords(job_description)
+        if phrase not in SKILL_DICTIONARY
+    ]
+    return skills + phrases
+
+
+def keyword_coverage(
+    job_description: str, resume: str, keywords: Optional[List[str]] = None
+) -> KeywordCoverage:
+    """
+    Measure which job description keywords appear in a resume, in one pass.
+
+    Args:
+        job_description: Job posting text
+        resume: Resume markdown
+        keywords: Precomputed extract_job_keywords output (extracted if None)
+
+    Returns:
+        KeywordCoverage with covered and missing keywords
+    """
+    keywords = keywords if keywords is not None else extract_job_keywords(job_description)
+    # Dictionary skills match only through their aliases ("go" the skill is "golang",
+    # not the English word); other keywords are phrases matched as written
+    patterns = {}
+    for keyword in keywords:
+        for alias in SKILL_DICTIONARY.get(keyword, [keyword]):
+            patterns[alias] = keyword
+
+    found = AhoCorasick(patterns).find_words(prepare_text(resume))
+    return KeywordCoverage(
+        keywords=keywords,
+        covered=[keyword for keyword in keywords if keyword in found],
+        missing=[keyword for keyword in keywords if keyword not in found],
+    )
@@ -0,0 +1,111 @@
+"""
+Resume Markdown Quality Check
+
+Local classifier deciding whether an uploaded text document is already a clean
+markdown resume in the layout our nodes expect (headed sections, dated entries,
+bulleted achievements), so it can be used as-is instead of being normalized by the
+model. Includes the cheap deterministic cleanup applied on that fast path.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import List
+
+from src.utils.markdown_sections import parse_heading
+from src.utils.resume_document import BULLET_PATTERN, DATE_RANGE_PATTERN, ResumeDocument
+
+KNOWN_SECTION_PATTERN = re.compile(
+    r"experience|employment|work history|education|skills|projects|summary|profile|"
+    r"certifications?|publications|awards|languages|volunteer",
+    re.IGNORECASE,
+)
+
+MIN_SECTIONS = 2
+MIN_KNOWN_SECTIONS = 2
+MIN_DATED_ENTRIES = 1
+MIN_BULLET_RATIO = 0.2
+# Lines this long are usually unwrapped paragraphs from a PDF/Word export
+LONG_LINE_CHARACTERS = 400
+MAX_LONG_LINE_RATIO = 0.1
+
+UNICODE_BULLET_PATTERN = re.compile(r"^(\s*)[•◦▪●‣–·]\s+")
+
+
+@dataclass
+class MarkdownQuality:
+    """Structural signals of a document and the fast-path decision"""
+
+    sections: int
+    known_sections: int
+    dated_entries: int
+    bullet_ratio: float
+    long_line_ratio: float
+
+    @property
+    def is_structured(self) -> bool:
+        """Whether the document already matches the resume layout"""
+        return (
+            self.sections >= MIN_SECTIONS
+            and self.known_sections >= MIN_KNOWN_SECTIONS
+            and self.dated_entries >= MIN_DATED_ENTRIES
+            and self.bullet_ratio >= MIN_BULLET_RATIO
+            and self.long_line_ratio <= MAX_LONG_LINE_RATIO
+        )
+
+
+def assess_resume_markdown(text: str) -> MarkdownQuality:
+    """
+    Measure how closely a document follows the markdown resume layout.
+
+    Args:
+        text: Document text
+
+    Returns:
+        MarkdownQuality with the structural signals
+    """
+    lines = [line for line in (text or "").splitlines() if line.strip()]
+    document = ResumeDocument.from_markdown(text or "")
+    content_lines = [line for line in lines if not parse_heading(line)]
+
+    dated_entries = sum(
+        1
+        for entry in document.all_entries()
+        if entry.start_date or DATE_RANGE_PATTERN.search(entry.markdown.split("\n", 1)[0])
+    )
+    bullets = sum(1 for line in content_lines if BULLET_PATTERN.match(line))
+
+    return MarkdownQuality(
+        sections=len(document.sections),
+        known_sections=sum(
+            1 for section in document.sections if KNOWN_SECTION_PATTERN.search(section.heading)
+        ),
+        dated_entries=dated_entries,
+        bullet_ratio=bullets / len(content_lines) if content_lines else 0.0,
+        long_line_ratio=(
+            sum(1 for line in lines if len(line) > LONG_LINE_CHARACTERS) / len(lines)
+            if lines
+            else 1.0
+        ),
+    )
+
+
+def clean_resume_markdown(text: str) -> str:
+    """
+    Deterministic cleanup for documents that pass the quality check.
+
+    Normalizes line endings and bullet characters, strips trailing whitespace,
+    puts a blank line before every heading and collapses repeated blank lines.
+
+    Args:
+        text: Structured markdown resume
+
+    Returns:
+        Cleaned markdown
+    """
+    cleaned: List[str] = []
+    for line in (text or "").replace("\r\n", "\n").replace("\r", "\n").split("\n"):
+        line = UNICODE_BULLET_PATTERN.sub(r"\1- ", line.rstrip())
+        if parse_heading(line) and cleaned and cleaned[-1]:
+            cleaned.append("")
+        cleaned.append(line)
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(cleaned)).strip() + "\n"
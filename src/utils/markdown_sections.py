@@ -0,0 +1,136 @@
+"""
+Markdown Section Utilities
+
+Deterministic splitting of markdown resumes into sections and entries, and
+reassembly in the original order. No model calls.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+# A bold line such as "**Senior Engineer** - Acme (2021-2023)" starts an entry
+BOLD_ENTRY_PATTERN = re.compile(r"^\*\*[^*]+\*\*")
+
+
+@dataclass
+class MarkdownSection:
+    """
+    A heading and the lines that belong to it.
+
+    The preamble before the first section heading has level 0 and an empty heading.
+    """
+
+    heading: str
+    level: int
+    body_lines: List[str] = field(default_factory=list)
+    heading_line: Optional[str] = None
+
+    @property
+    def body(self) -> str:
+        """Section body without the heading line"""
+        return "\n".join(self.body_lines).strip("\n")
+
+    @property
+    def markdown(self) -> str:
+        """Section rendered back to markdown"""
+        parts = [self.heading_line] if self.heading_line else []
+        if self.body:
+            parts.append(self.body)
+        return "\n".join(parts)
+
+
+def parse_heading(line: str) -> Optional[tuple]:
+    """Return (level, text) if the line is a markdown heading, None otherwise"""
+    match = HEADING_PATTERN.match(line)
+    if not match:
+        return None
+    return len(match.group(1)), match.group(2).strip()
+
+
+def split_sections(markdown: str, max_level: int = 2) -> List[MarkdownSection]:
+    """
+    Split markdown into sections at headings of level <= max_level.
+
+    The first H1 (usually the candidate name) stays in the preamble together with
+    contact details, since it is not a content section.
+
+    Args:
+        markdown: Markdown document
+        max_level: Deepest heading level that starts a new section
+
+    Returns:
+        Sections in document order, starting with the preamble
+    """
+    sections = [MarkdownSection(heading="", level=0)]
+    in_code_block = False
+    seen_title = False
+
+    for line in (markdown or "").splitlines():
+        if line.strip().startswith("```"):
+            in_code_block = not in_code_block
+
+        heading = None if in_code_block else parse_heading(line)
+        if heading and heading[0] <= max_level:
+            level, text = heading
+            if level == 1 and not seen_title and len(sections) == 1:
+                seen_title = True
+                sections[0].body_lines.append(line)
+                continue
+            sections.append(MarkdownSection(heading=text, level=level, heading_line=line))
+            continue
+
+        sections[-1].body_lines.append(line)
+
+    if not sections[0].body.strip():
+        sections = sections[1:]
+    return sections
+
+
+def split_entries(section: MarkdownSection) -> tuple:
+    """
+    Split a section body into an intro and individual entries.
+
+    Entries start at level-3+ headings, or at bold lines when the section has no
+    sub-headings (a common layout for experience sections).
+
+    Args:
+        section: Section to split
+
+    Returns:
+        Tuple of (intro markdown, list of entry markdown strings)
+    """
+    lines = section.body_lines
+    sub_levels = [
+        heading[0]
+        for line in lines
+        if (heading := parse_heading(line)) and heading[0] > section.level
+    ]
+    entry_level = min(sub_levels) if sub_levels else None
+
+    def starts_entry(line: str) -> bool:
+        if entry_level:
+            heading = parse_heading(line)
+            return bool(heading) and heading[0] == entry_level
+        return bool(BOLD_ENTRY_PATTERN.match(line))
+
+    intro: List[str] = []
+    entries: List[List[str]] = []
+    for line in lines:
+        if starts_entry(line):
+            entries.append([line])
+        elif entries:
+            entries[-1].append(line)
+        else:
+            intro.append(line)
+
+    return (
+        "\n".join(intro).strip("\n"),
+        ["\n".join(entry).strip("\n") for entry in entries],
+    )
+
+
+def join_blocks(blocks: List[str]) -> str:
+    """Join markdown blocks with a single blank line between them"""
+    return "\n\n".join(block.strip("\n") for block in blocks if block and block.strip())
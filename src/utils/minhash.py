@@ -0,0 +1,74 @@
+"""
+MinHash / LSH Near-Duplicate Detection
+
+MinHash signatures estimate the Jaccard similarity of two texts' word shingles,
+and banded LSH bucket keys find candidate near-duplicates without comparing against
+every stored signature (the buckets are persisted by tools/job_dedup_store.py).
+Pure Python, deterministic across processes (fixed hash seeds), so signatures can
+be persisted and compared later. No model calls.
+"""
+
+import hashlib
+import random
+from typing import List, Optional, Tuple
+
+from src.utils.text_utils import shingles
+
+# Bump when shingling or hashing changes so persisted indexes are rebuilt
+MINHASH_VERSION = 1
+
+NUM_PERMUTATIONS = 128
+# 16 bands x 8 rows: pairs above ~0.7 Jaccard become candidates with high probability
+LSH_BANDS = 16
+LSH_ROWS = NUM_PERMUTATIONS // LSH_BANDS
+SHINGLE_SIZE = 5
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_random = random.Random(20240601)
+_PERMUTATIONS: List[Tuple[int, int]] = [
+    (_random.randrange(1, _MERSENNE_PRIME), _random.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERMUTATIONS)
+]
+
+
+def _shingle_hash(shingle: str) -> int:
+    return int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def minhash_signature(text: Optional[str]) -> List[int]:
+    """
+    Compute the MinHash signature of a text's word shingles.
+
+    Args:
+        text: Text to sign
+
+    Returns:
+        NUM_PERMUTATIONS hash minimums (all max values for empty text)
+    """
+    hashes = [_shingle_hash(shingle) for shingle in shingles(text, SHINGLE_SIZE)]
+    if not hashes:
+        return [_MAX_HASH] * NUM_PERMUTATIONS
+    return [
+        min(((a * value + b) % _MERSENNE_PRIME) & _MAX_HASH for value in hashes)
+        for a, b in _PERMUTATIONS
+    ]
+
+
+def estimate_similarity(first: List[int], second: List[int]) -> float:
+    """Estimated Jaccard similarity: share of signature positions that agree"""
+    if not first or len(first) != len(second):
+        return 0.0
+    return sum(1 for a, b in zip(first, second) if a == b) / len(first)
+
+
+def band_keys(signature: List[int]) -> List[str]:
+    """LSH bucket keys of a signature, one per band (versioned, safe to persist)"""
+    return [
+        f"v{MINHASH_VERSION}:{band}:" + hashlib.blake2b(
+            ",".join(map(str, signature[band * LSH_ROWS : (band + 1) * LSH_ROWS])).encode(),
+            digest_size=8,
+        ).hexdigest()
+        for band in range(LSH_BANDS)
+    ]
+
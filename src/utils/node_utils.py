@@ -4,11 +4,25 @@ Node Utility Functions
 Simple utilities for common node operations to reduce code duplication.
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, List, Union
+from typing import Dict, Any, List, Union, Tuple, Awaitable, Optional
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
 from langchain_core.runnables import RunnableConfig
 from pydantic import BaseModel
 
+from src.utils.resume_patch import (
+    PATCH_INSTRUCTIONS,
+    PatchError,
+    ResumePatch,
+    apply_patch,
+    render_outline,
+)
+
+# Patches only contain the changes, so they get a much smaller budget than a full resume
+PATCH_MAX_TOKENS = 2048
+
 
 def validate_fields(
     state: BaseModel, required_fields: List[str], operation: str
@@ -87,3 +101,198 @@ def handle_error(error: Exception, node_name: str) -> Dict[str, Any]:
     error_msg = f"Error in {node_name}: {str(error)}"
     logging.error(error_msg, exc_info=True)
     return {"error": error_msg}
+
+
+def is_truncated(message: BaseMessage) -> bool:
+    """
+    Check whether a model response stopped because it hit the output token limit.
+
+    Args:
+        message: Response message from a chat model
+
+    Returns:
+        True if the stop reason indicates truncation
+    """
+    metadata = getattr(message, "response_metadata", None) or {}
+    return (
+        metadata.get("stop_reason") == "max_tokens"
+        or metadata.get("finish_reason") == "length"
+    )
+
+
+def job_context_prefix(job_description: Optional[str], company_strategy: Optional[str]) -> str:
+    """
+    Job context placed verbatim at the start of every job-level generation prompt.
+
+    Tailoring and cover letter calls for the same job start with this exact text,
+    so the provider's prompt cache can serve it to whichever call comes second.
+
+    Args:
+        job_description: Job posting text
+        company_strategy: Output of job_analyzer
+
+    Returns:
+        Prefix text
+    """
+    return f"""JOB_DESCRIPTION:
+{job_description}
+
+COMPANY_STRATEGY:
+{company_strategy}"""
+
+
+def cached_prefix_message(prefix: str, prompt: str) -> HumanMessage:
+    """
+    User message whose leading block is marked as a prompt-cache breakpoint.
+
+    Args:
+        prefix: Stable text shared with other calls (e.g. job_context_prefix)
+        prompt: Call-specific remainder of the prompt
+
+    Returns:
+        HumanMessage with the prefix and prompt as separate content blocks
+    """
+    return HumanMessage(
+        content=[
+            {"type": "text", "text": prefix, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": prompt},
+        ]
+    )
+
+
+async def ainvoke_with_continuation(
+    llm: BaseChatModel,
+    prompt: str,
+    config: RunnableConfig,
+    max_tokens: int,
+    max_continuations: int = 3,
+    prefix: Optional[str] = None,
+) -> Tuple[str, int]:
+    """
+    Invoke a model and keep generating while the response is cut off at max_tokens.
+
+    The partial output is sent back as a prefilled assistant turn, so the model
+    continues exactly where it stopped and the parts can be stitched together.
+
+    Args:
+        llm: Chat model to invoke
+        prompt: User prompt
+        config: LangChain runnable config
+        max_tokens: Output token budget per call
+        max_continuations: Maximum number of follow-up calls after truncation
+        prefix: Optional cacheable text sent before the prompt (see cached_prefix_message)
+
+    Returns:
+        Tuple of (stitched response text, number of continuations used)
+    """
+    messages: List[BaseMessage] = [
+        cached_prefix_message(prefix, prompt) if prefix else HumanMessage(content=prompt)
+    ]
+    response = await llm.ainvoke(messages, config=config, max_tokens=max_tokens)
+    text = response.content if isinstance(response.content, str) else response.text()
+
+    continuations = 0
+    while is_truncated(response) and continuations < max_continuations:
+        continuations += 1
+        # Assistant prefill must not end with whitespace
+        text = text.rstrip()
+        logging.debug(
+            f"[DEBUG] Response truncated at {len(text)} chars, continuing ({continuations}/{max_continuations})"
+        )
+        response = await llm.ainvoke(
+            messages + [AIMessage(content=text)], config=config, max_tokens=max_tokens
+        )
+        text += response.content if isinstance(response.content, str) else response.text()
+
+    if is_truncated(response):
+        logging.warning(
+            f"[DEBUG] Response still truncated after {max_continuations} continuations"
+        )
+
+    return text, continuations
+
+
+async def gather_with_limit(
+    awaitables: List[Awaitable[Any]],
+    limiter: asyncio.Semaphore,
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """
+    Run awaitables concurrently while holding the limiter for each one.
+
+    Args:
+        awaitables: Coroutines to run
+        limiter: Semaphore bounding how many run at once
+        return_exceptions: Return exceptions in place of results instead of raising
+            the first one (as asyncio.gather)
+
+    Returns:
+        Results in the same order as the awaitables
+    """
+
+    async def _run(awaitable: Awaitable[Any]) -> Any:
+        async with limiter:
+            return await awaitable
+
+    return await asyncio.gather(
+        *(_run(awaitable) for awaitable in awaitables), return_exceptions=return_exceptions
+    )
+
+
+async def merge_resume_patch(
+    llm: BaseChatModel,
+    current_resume: str,
+    new_information: str,
+    guidelines: str,
+    config: RunnableConfig,
+) -> Optional[str]:
+    """
+    Merge new information into a resume via section-level operations.
+
+    The model only emits the edits (ResumePatch); they are applied locally by the
+    patch engine, so output size scales with the change, not the resume length.
+
+    Args:
+        llm: Chat model to invoke
+        current_resume: Existing resume markdown
+        new_information: Information to merge in
+        guidelines: Node-specific merging rules
+        config: LangChain runnable config
+
+    Returns:
+        Updated resume, or None if the patch could not be generated or applied
+        (callers fall back to full regeneration)
+    """
+    prompt = f"""
+You are a professional resume writer updating a user's resume with new information.
+Do NOT rewrite the resume - describe only the edits needed to merge the new information.
+
+{guidelines}
+
+{PATCH_INSTRUCTIONS}
+
+RESUME OUTLINE:
+{render_outline(current_resume)}
+
+EXISTING RESUME:
+{current_resume}
+
+NEW INFORMATION TO MERGE:
+{new_information}
+"""
+    try:
+        patch = await llm.with_structured_output(ResumePatch).ainvoke(
+            prompt, config=config, max_tokens=PATCH_MAX_TOKENS
+        )
+        updated_resume = apply_patch(current_resume, patch.operations)
+    except PatchError as e:
+        logging.warning(f"[DEBUG] Resume patch rejected: {e}")
+        return None
+    except Exception as e:
+        logging.warning(f"[DEBUG] Resume patch generation failed: {e}")
+        return None
+
+    logging.debug(
+        f"[DEBUG] Applied {len(patch.operations)} resume patch operations"
+    )
+    return updated_resume
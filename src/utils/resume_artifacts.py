@@ -0,0 +1,98 @@
+"""
+Derived Resume Artifacts
+
+Everything tailoring derives from the user's resumes that does not depend on the
+job: section index with token counts, skill inventory and the full-resume material
+not already in the original resume. Built once when a resume is saved and stamped
+with a version and the hash of both resumes, so tailoring runs can load it instead
+of recomputing per job. No model calls.
+"""
+
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from src.utils.resume_document import ResumeDocument
+from src.utils.resume_overlap import OverlapResult, full_resume_supplement
+from src.utils.text_utils import content_hash, estimate_tokens
+
+# Bump when any derived artifact changes so persisted artifacts are rebuilt
+RESUME_ARTIFACTS_VERSION = 1
+
+
+class SectionSummary(BaseModel):
+    """Heading, hash and size of one full-resume section"""
+
+    heading: str = Field(description="Section heading text")
+    hash: str = Field(description="Content hash of the section markdown")
+    tokens: int = Field(description="Estimated token count of the section")
+
+
+class ResumeArtifacts(BaseModel):
+    """Job-independent structures derived from the original and full resume"""
+
+    version: int = Field(RESUME_ARTIFACTS_VERSION, description="Artifact layout version")
+    source_hash: str = Field(description="Hash of the original and full resume")
+    sections: List[SectionSummary] = Field(default_factory=list, description="Full-resume sections")
+    skills: List[str] = Field(default_factory=list, description="Skill inventory of the full resume")
+    original_tokens: int = Field(0, description="Estimated tokens of the original resume")
+    full_resume_supplement: str = Field(
+        "", description="Full-resume material not already in the original resume"
+    )
+    duplicate_blocks: int = Field(0, description="Full-resume blocks already in the original")
+    total_blocks: int = Field(0, description="Full-resume blocks compared")
+    full_tokens: int = Field(0, description="Estimated tokens of the full resume")
+    supplement_tokens: int = Field(0, description="Estimated tokens of the supplement")
+
+    @classmethod
+    def build(
+        cls,
+        original_resume: Optional[str],
+        full_resume: Optional[str],
+        document: Optional[ResumeDocument] = None,
+    ) -> "ResumeArtifacts":
+        """
+        Derive all artifacts from the two resumes.
+
+        Args:
+            original_resume: User's base resume
+            full_resume: User's complete resume
+            document: Already parsed full resume (parsed here if None)
+
+        Returns:
+            ResumeArtifacts stamped with the hash of both resumes
+        """
+        original_resume, full_resume = original_resume or "", full_resume or ""
+        if document is None or not document.is_current(full_resume):
+            document = ResumeDocument.from_markdown(full_resume)
+        overlap = full_resume_supplement(original_resume, full_resume)
+        return cls(
+            source_hash=content_hash(original_resume, full_resume),
+            sections=[
+                SectionSummary(heading=s.heading, hash=s.hash, tokens=s.tokens)
+                for s in document.sections
+            ],
+            skills=document.skills,
+            original_tokens=estimate_tokens(original_resume),
+            full_resume_supplement=overlap.supplement,
+            duplicate_blocks=overlap.duplicate_blocks,
+            total_blocks=overlap.total_blocks,
+            full_tokens=overlap.full_tokens,
+            supplement_tokens=overlap.supplement_tokens,
+        )
+
+    def is_current(self, original_resume: Optional[str], full_resume: Optional[str]) -> bool:
+        """Whether these artifacts were built from exactly these resumes"""
+        return self.version == RESUME_ARTIFACTS_VERSION and self.source_hash == content_hash(
+            original_resume or "", full_resume or ""
+        )
+
+    def overlap(self) -> OverlapResult:
+        """The precomputed full_resume_supplement result"""
+        return OverlapResult(
+            supplement=self.full_resume_supplement,
+            duplicate_blocks=self.duplicate_blocks,
+            total_blocks=self.total_blocks,
+            full_tokens=self.full_tokens,
+            supplement_tokens=self.supplement_tokens,
+        )
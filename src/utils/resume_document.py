@@ -0,0 +1,186 @@
+"""
+Resume Document Model
+
+Parsed, compact representation of a markdown resume: sections, entries with
+title/organization/dates, bullets and a skill inventory. Every part carries a
+content hash so nodes can select, diff and cache subsets without re-sending the
+whole document. Built deterministically from markdown - no model calls.
+"""
+
+import re
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from src.utils.markdown_sections import split_entries, split_sections
+from src.utils.text_utils import content_hash, estimate_tokens
+
+# Bump when the parsed layout changes so cached indexes are rebuilt
+RESUME_DOCUMENT_VERSION = 1
+
+BULLET_PATTERN = re.compile(r"^\s*(?:[-*+•]|\d+[.)])\s+(.*\S)\s*$")
+MONTH = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?"
+DATE = rf"(?:{MONTH}\s+)?(?:19|20)\d{{2}}|\d{{1,2}}/(?:19|20)\d{{2}}"
+DATE_RANGE_PATTERN = re.compile(
+    rf"(?P<start>{DATE})\s*(?:-|–|—|to)\s*(?P<end>{DATE}|present|current|now)"
+    rf"|(?P<single>{DATE})",
+    re.IGNORECASE,
+)
+TITLE_SEPARATOR_PATTERN = re.compile(r"\s+(?:[-–—|@]|at)\s+|\s*[|,]\s*")
+SKILL_SECTION_PATTERN = re.compile(r"skill|technolog|tools|stack|competenc", re.IGNORECASE)
+SKILL_SEPARATOR_PATTERN = re.compile(r"\s*[,;|•·]\s*")
+
+
+class ResumeEntry(BaseModel):
+    """One job, project, degree, ... inside a section"""
+
+    title: str = Field(description="Entry headline, e.g. the role or degree")
+    organization: Optional[str] = Field(None, description="Company, school or project owner")
+    start_date: Optional[str] = Field(None, description="Start date as written")
+    end_date: Optional[str] = Field(None, description="End date as written (or Present)")
+    bullets: List[str] = Field(default_factory=list, description="Bullet points")
+    markdown: str = Field(description="Original markdown of the entry")
+    hash: str = Field(description="Content hash of the entry markdown")
+
+
+class ResumeSection(BaseModel):
+    """A top-level resume section"""
+
+    heading: str = Field(description="Section heading text")
+    level: int = Field(description="Markdown heading level")
+    intro: str = Field("", description="Text before the first entry")
+    entries: List[ResumeEntry] = Field(default_factory=list, description="Entries")
+    bullets: List[str] = Field(default_factory=list, description="Bullets outside entries")
+    markdown: str = Field(description="Original markdown of the section")
+    hash: str = Field(description="Content hash of the section markdown")
+    tokens: int = Field(0, description="Estimated token count of the section")
+
+
+class ResumeDocument(BaseModel):
+    """Parsed resume with a section index and skill inventory"""
+
+    version: int = Field(RESUME_DOCUMENT_VERSION, description="Parser layout version")
+    source_hash: str = Field(description="Content hash of the source markdown")
+    preamble: str = Field("", description="Name and contact block before the first section")
+    sections: List[ResumeSection] = Field(default_factory=list, description="Sections in order")
+    skills: List[str] = Field(default_factory=list, description="Deduplicated skill inventory")
+
+    @classmethod
+    def from_markdown(cls, markdown: str) -> "ResumeDocument":
+        """Parse a markdown resume into a ResumeDocument"""
+        preamble = ""
+        sections: List[ResumeSection] = []
+        for section in split_sections(markdown, max_level=2):
+            if not section.level:
+                preamble = section.body
+                continue
+            sections.append(_parse_section(section))
+
+        skills: List[str] = []
+        for section in sections:
+            if SKILL_SECTION_PATTERN.search(section.heading):
+                skills.extend(_parse_skills(section.markdown))
+
+        return cls(
+            source_hash=content_hash(markdown),
+            preamble=preamble,
+            sections=sections,
+            skills=list(dict.fromkeys(skills)),
+        )
+
+    def is_current(self, markdown: Optional[str]) -> bool:
+        """Whether this index was built from the given markdown by the current parser"""
+        return (
+            self.version == RESUME_DOCUMENT_VERSION
+            and self.source_hash == content_hash(markdown)
+        )
+
+    def section(self, heading: str) -> Optional[ResumeSection]:
+        """Find a section by heading (case-insensitive)"""
+        key = heading.strip().lower()
+        return next((s for s in self.sections if s.heading.lower() == key), None)
+
+    def select(self, headings: List[str], include_preamble: bool = True) -> str:
+        """Render only the given sections (in document order) back to markdown"""
+        keys = {heading.strip().lower() for heading in headings}
+        blocks = [self.preamble] if include_preamble and self.preamble else []
+        blocks += [s.markdown for s in self.sections if s.heading.lower() in keys]
+        return "\n\n".join(blocks)
+
+    def section_hashes(self) -> Dict[str, str]:
+        """Mapping of section heading -> content hash"""
+        return {s.heading: s.hash for s in self.sections}
+
+    def changed_sections(self, other: "ResumeDocument") -> List[str]:
+        """Headings of sections that are new or different compared to another version"""
+        previous = other.section_hashes()
+        return [s.heading for s in self.sections if previous.get(s.heading) != s.hash]
+
+    def all_entries(self) -> List[ResumeEntry]:
+        """Entries of every section, in document order"""
+        return [entry for section in self.sections for entry in section.entries]
+
+
+def _parse_bullets(lines: List[str]) -> List[str]:
+    return [match.group(1) for line in lines if (match := BULLET_PATTERN.match(line))]
+
+
+def _parse_entry(markdown: str) -> ResumeEntry:
+    lines = markdown.splitlines()
+    headline = re.sub(r"^#+\s*", "", lines[0]).replace("**", "").replace("__", "").strip()
+
+    # Dates may sit on the headline or on the line right below it
+    start_date = end_date = None
+    for line in lines[:2]:
+        match = DATE_RANGE_PATTERN.search(line)
+        if match:
+            start_date = match.group("start") or match.group("single")
+            end_date = match.group("end")
+            break
+
+    # Drop the dates and surrounding brackets, then split title from organization
+    headline = DATE_RANGE_PATTERN.sub("", headline)
+    headline = re.sub(r"[(\[]\s*[)\]]", "", headline).strip(" -–—|,*()[]")
+    parts = [part for part in TITLE_SEPARATOR_PATTERN.split(headline, maxsplit=1) if part]
+
+    return ResumeEntry(
+        title=parts[0].strip() if parts else headline,
+        organization=parts[1].strip(" -–—|,") if len(parts) > 1 else None,
+        start_date=start_date,
+        end_date=end_date,
+        bullets=_parse_bullets(lines[1:]),
+        markdown=markdown,
+        hash=content_hash(markdown),
+    )
+
+
+def _parse_section(section) -> ResumeSection:
+    intro, entries = split_entries(section)
+    markdown = section.markdown
+    return ResumeSection(
+        heading=section.heading,
+        level=section.level,
+        intro=intro,
+        entries=[_parse_entry(entry) for entry in entries],
+        bullets=_parse_bullets(intro.splitlines()),
+        markdown=markdown,
+        hash=content_hash(markdown),
+        tokens=estimate_tokens(markdown),
+    )
+
+
+def _parse_skills(markdown: str) -> List[str]:
+    skills: List[str] = []
+    for line in markdown.splitlines()[1:]:
+        text = BULLET_PATTERN.sub(r"\1", line).replace("**", "").strip()
+        if not text or text.startswith("#"):
+            continue
+        # "Languages: Python, Go" → drop the category label
+        if ":" in text:
+            text = text.split(":", 1)[1]
+        skills.extend(
+            skill.strip(" .")
+            for skill in SKILL_SEPARATOR_PATTERN.split(text)
+            if skill.strip(" .") and len(skill) <= 60
+        )
+    return skills
@@ -0,0 +1,194 @@
+"""
+Deterministic Resume Merge
+
+Merges several markdown resumes (one per uploaded document) into one using the
+structured ResumeDocument model: sections are unioned by canonical heading,
+entries describing the same position are unified and their bullets deduplicated,
+and free-text lines are deduplicated. Only entries that describe the same position
+with contradicting dates are left as conflicts for the model to resolve.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from src.utils.markdown_sections import join_blocks
+from src.utils.resume_document import BULLET_PATTERN, ResumeDocument, ResumeEntry
+from src.utils.text_utils import normalize_text
+
+# Headings with the same meaning are merged into the first one seen
+HEADING_ALIASES: Dict[str, str] = {
+    "work experience": "experience",
+    "professional experience": "experience",
+    "employment": "experience",
+    "employment history": "experience",
+    "work history": "experience",
+    "technical skills": "skills",
+    "skills and technologies": "skills",
+    "core competencies": "skills",
+    "professional summary": "summary",
+    "profile": "summary",
+    "about": "summary",
+    "education and training": "education",
+    "certifications": "certificates",
+    "licenses and certifications": "certificates",
+}
+
+CONFLICT_PLACEHOLDER = "{{{{MERGE_CONFLICT_{index}}}}}"
+CONFLICT_PLACEHOLDER_PATTERN = re.compile(r"\{\{MERGE_CONFLICT_(\d+)\}\}")
+
+
+@dataclass
+class EntryConflict:
+    """Variants of one entry whose dates or details contradict each other"""
+
+    section: str
+    variants: List[str]
+
+
+@dataclass
+class ResumeMergeResult:
+    """Merged markdown with a placeholder per unresolved conflict"""
+
+    markdown: str
+    conflicts: List[EntryConflict] = field(default_factory=list)
+
+    def resolve(self, resolutions: Optional[Dict[int, str]] = None) -> str:
+        """
+        Substitute conflict resolutions into the merged markdown.
+
+        Args:
+            resolutions: conflict index -> resolved entry markdown; unresolved
+                conflicts fall back to their first variant
+
+        Returns:
+            Final merged markdown without placeholders
+        """
+        resolutions = resolutions or {}
+
+        def _replace(match: re.Match) -> str:
+            index = int(match.group(1))
+            return resolutions.get(index) or self.conflicts[index].variants[0]
+
+        return CONFLICT_PLACEHOLDER_PATTERN.sub(_replace, self.markdown)
+
+
+def canonical_heading(heading: str) -> str:
+    """Key under which sections with equivalent headings are merged"""
+    key = normalize_text(heading.replace("&", " and "))
+    return HEADING_ALIASES.get(key, key)
+
+
+def _entry_identity(entry: ResumeEntry) -> Tuple[str, str]:
+    return normalize_text(entry.title), normalize_text(entry.organization)
+
+
+def _dates_conflict(entries: List[ResumeEntry]) -> bool:
+    """Whether entries state different dates (a missing date never conflicts)"""
+    starts = {normalize_text(entry.start_date) for entry in entries if entry.start_date}
+    ends = {normalize_text(entry.end_date) for entry in entries if entry.end_date}
+    return len(starts) > 1 or len(ends) > 1
+
+
+def _merge_lines(blocks: List[str]) -> str:
+    """Union the lines of several text blocks, dropping repeated lines"""
+    seen = set()
+    lines: List[str] = []
+    for block in blocks:
+        for line in block.splitlines():
+            key = normalize_text(line)
+            if key and key in seen:
+                continue
+            if key:
+                seen.add(key)
+            lines.append(line)
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip("\n")
+
+
+def _merge_entries(entries: List[ResumeEntry]) -> str:
+    """Unify entries for the same position: most dated entry plus bullets only others have"""
+    base = max(entries, key=lambda entry: bool(entry.start_date) + bool(entry.end_date))
+    known = {normalize_text(bullet) for bullet in base.bullets}
+    extra: List[str] = []
+    for entry in entries:
+        for bullet in entry.bullets:
+            key = normalize_text(bullet)
+            if key not in known:
+                known.add(key)
+                extra.append(bullet)
+    if not extra:
+        return base.markdown
+
+    # Follow the bullet style of the base entry
+    marker = "-"
+    for line in base.markdown.splitlines():
+        match = BULLET_PATTERN.match(line)
+        if match:
+            marker = line.strip()[: line.strip().index(match.group(1))].strip() or "-"
+            break
+    return base.markdown.rstrip() + "\n" + "\n".join(f"{marker} {bullet}" for bullet in extra)
+
+
+def merge_resume_markdowns(markdowns: List[str]) -> ResumeMergeResult:
+    """
+    Merge markdown resumes into one, deterministically where possible.
+
+    Args:
+        markdowns: Resumes in priority order (the first wins on layout and wording)
+
+    Returns:
+        ResumeMergeResult with conflict placeholders for contradicting entries
+    """
+    documents = [ResumeDocument.from_markdown(markdown) for markdown in markdowns if markdown]
+    if not documents:
+        return ResumeMergeResult(markdown="")
+
+    preamble = next((document.preamble for document in documents if document.preamble), "")
+
+    # Canonical heading -> (first heading line, sections in document order)
+    order: List[str] = []
+    grouped: Dict[str, Tuple[str, list]] = {}
+    for document in documents:
+        for section in document.sections:
+            key = canonical_heading(section.heading)
+            if key not in grouped:
+                order.append(key)
+                grouped[key] = (section.markdown.splitlines()[0], [])
+            grouped[key][1].append(section)
+
+    conflicts: List[EntryConflict] = []
+    blocks = [preamble]
+    for key in order:
+        heading_line, sections = grouped[key]
+        intro = _merge_lines([section.intro for section in sections])
+
+        # Group entries describing the same position, keeping first-seen order
+        positions: List[Tuple[str, str]] = []
+        by_position: Dict[Tuple[str, str], List[ResumeEntry]] = {}
+        for section in sections:
+            for entry in section.entries:
+                identity = _entry_identity(entry)
+                if identity not in by_position:
+                    positions.append(identity)
+                    by_position[identity] = []
+                by_position[identity].append(entry)
+
+        # Sections without entries (summary, skills) are just the union of their lines
+        rendered = [intro]
+        for identity in positions:
+            entries = by_position[identity]
+            if _dates_conflict(entries):
+                conflicts.append(
+                    EntryConflict(
+                        section=sections[0].heading,
+                        variants=[entry.markdown for entry in entries],
+                    )
+                )
+                rendered.append(CONFLICT_PLACEHOLDER.format(index=len(conflicts) - 1))
+            else:
+                rendered.append(_merge_entries(entries))
+        body = join_blocks(rendered)
+
+        blocks.append(f"{heading_line}\n\n{body}" if body else heading_line)
+
+    return ResumeMergeResult(markdown=join_blocks(blocks) + "\n", conflicts=conflicts)
@@ -0,0 +1,119 @@
+"""
+Resume Overlap Detection
+
+The original resume is usually a subset of the full resume, so sending both to a
+prompt pays for the same bullets twice. This module finds the full-resume blocks
+(bullets and paragraphs) that are near-duplicates of original-resume content using
+word shingles, and renders only the remaining material. No model calls.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List
+
+from src.utils.markdown_sections import parse_heading, split_sections
+from src.utils.text_utils import estimate_tokens, normalize_text, shingles
+
+# Share of a block's shingles that must appear in the original to count as duplicate
+DUPLICATE_CONTAINMENT_THRESHOLD = 0.8
+SHINGLE_SIZE = 3
+
+
+@dataclass
+class OverlapResult:
+    """Full-resume material not already present in the original resume"""
+
+    supplement: str
+    duplicate_blocks: int
+    total_blocks: int
+    full_tokens: int
+    supplement_tokens: int
+
+    @property
+    def saved_tokens(self) -> int:
+        """Estimated prompt tokens saved by sending the supplement instead"""
+        return self.full_tokens - self.supplement_tokens
+
+
+def _is_duplicate(block: str, original_normalized: str, original_shingles: set) -> bool:
+    normalized = normalize_text(block)
+    # Whole-word containment only: "ai" must not match inside "maintained"
+    if not normalized or f" {normalized} " in original_normalized:
+        return True
+    block_shingles = shingles(block, SHINGLE_SIZE)
+    return (
+        len(block_shingles & original_shingles) / len(block_shingles)
+        >= DUPLICATE_CONTAINMENT_THRESHOLD
+    )
+
+
+def _blocks(lines: List[str]) -> List[List[str]]:
+    """Group lines into blocks: each heading/bullet line alone, paragraphs together"""
+    blocks: List[List[str]] = []
+    in_paragraph = False
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            in_paragraph = False
+            continue
+        is_structural = bool(parse_heading(line)) or stripped[:1] in "-*+•" or stripped[:2] == "**"
+        if in_paragraph and not is_structural:
+            blocks[-1].append(line)
+        else:
+            blocks.append([line])
+            in_paragraph = not is_structural
+    return blocks
+
+
+@lru_cache(maxsize=32)
+def full_resume_supplement(original_resume: str, full_resume: str) -> OverlapResult:
+    """
+    Render the parts of the full resume that are not already in the original.
+
+    Headings and entry headlines (bold lines / sub-headings) are kept for context
+    when anything beneath them is new; sections with nothing new are dropped.
+
+    Args:
+        original_resume: User's base resume
+        full_resume: User's complete resume
+
+    Returns:
+        OverlapResult with the supplement markdown and size statistics
+    """
+    original_normalized = f" {normalize_text(original_resume)} "
+    original_shingles = shingles(original_resume, SHINGLE_SIZE)
+
+    rendered: List[str] = []
+    duplicate_blocks = total_blocks = 0
+    for section in split_sections(full_resume, max_level=2):
+        kept: List[str] = []
+        # Last duplicate entry headline, re-emitted if something new follows it
+        context = None
+        for block in _blocks(section.body_lines):
+            text = "\n".join(block)
+            first = block[0].strip()
+            is_headline = bool(parse_heading(first)) or first.startswith("**")
+            total_blocks += 1
+            if _is_duplicate(text, original_normalized, original_shingles):
+                duplicate_blocks += 1
+                if is_headline:
+                    context = text
+                continue
+
+            if not kept and section.heading_line:
+                kept.append(section.heading_line)
+            if context and not is_headline:
+                kept.append(context)
+            context = None
+            kept.extend(block)
+        if kept:
+            rendered.append("\n".join(kept))
+
+    supplement = "\n\n".join(rendered)
+    return OverlapResult(
+        supplement=supplement,
+        duplicate_blocks=duplicate_blocks,
+        total_blocks=total_blocks,
+        full_tokens=estimate_tokens(full_resume),
+        supplement_tokens=estimate_tokens(supplement),
+    )
@@ -0,0 +1,209 @@
+"""
+Resume Patch Engine
+
+Applies structured section-level edit operations to a markdown resume, so updates
+only need the model to emit the change instead of regenerating the whole document.
+Operations are validated and applied deterministically. No model calls.
+"""
+
+import re
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+from src.utils.markdown_sections import MarkdownSection, parse_heading, split_sections
+
+PATCH_INSTRUCTIONS = """Return a list of operations. Each operation targets an EXISTING heading, copied exactly
+from the resume (without the leading #), unless it is add_section:
+- append: add content at the end of the heading's section (after any sub-sections)
+- insert: add content right after the existing line given in target (copy the line exactly)
+- replace: replace the existing text given in target (copy it exactly, it must appear once) with content
+- add_section: add a new section; heading is the new heading text, content is its body
+Content is markdown that matches the surrounding formatting. Only emit operations for real
+changes - return an empty list when the new information is already in the resume."""
+
+
+class SectionOperation(BaseModel):
+    """A single edit applied under one heading of the resume"""
+
+    action: Literal["append", "insert", "replace", "add_section"] = Field(
+        description="Edit type: append, insert, replace or add_section"
+    )
+    heading: str = Field(description="Existing heading to edit (new heading for add_section)")
+    target: Optional[str] = Field(
+        default=None,
+        description="insert: existing line to insert after; replace: existing text to replace",
+    )
+    content: str = Field(default="", description="Markdown to add or the replacement text")
+
+
+class ResumePatch(BaseModel):
+    """Structured output for a section-level resume update"""
+
+    operations: List[SectionOperation] = Field(
+        default_factory=list, description="Edits to apply in order (can be empty)"
+    )
+
+
+class PatchError(ValueError):
+    """Raised when an operation cannot be applied unambiguously"""
+
+
+def _heading_key(text: str) -> str:
+    """Compare headings case-insensitively, ignoring markdown emphasis and spacing"""
+    return re.sub(r"\s+", " ", re.sub(r"[*_`#]", "", text or "")).strip().lower()
+
+
+def render_outline(markdown: str) -> str:
+    """List the resume's headings as an indented outline, for patch prompts"""
+    sections = [s for s in split_sections(markdown, max_level=6) if s.level]
+    top_level = min((s.level for s in sections), default=1)
+    return "\n".join(
+        f"{'  ' * (section.level - top_level)}- {section.heading}" for section in sections
+    )
+
+
+def _render(sections: List[MarkdownSection]) -> str:
+    return "\n".join(
+        line
+        for section in sections
+        for line in ([section.heading_line] if section.heading_line else [])
+        + section.body_lines
+    ).strip("\n") + "\n"
+
+
+def _find_subtree(sections: List[MarkdownSection], heading: str) -> tuple:
+    """Return (start, end) indexes of the section with the heading and its sub-sections"""
+    key = _heading_key(heading)
+    matches = [i for i, s in enumerate(sections) if s.level and _heading_key(s.heading) == key]
+    if not matches:
+        raise PatchError(f"Heading not found: {heading!r}")
+    if len(matches) > 1:
+        raise PatchError(f"Heading is ambiguous: {heading!r}")
+
+    start = matches[0]
+    end = start + 1
+    while end < len(sections) and sections[end].level > sections[start].level:
+        end += 1
+    return start, end
+
+
+def _content_lines(content: str) -> List[str]:
+    return (content or "").strip("\n").splitlines()
+
+
+def _append(sections: List[MarkdownSection], operation: SectionOperation) -> None:
+    _, end = _find_subtree(sections, operation.heading)
+    last = sections[end - 1]
+    while last.body_lines and not last.body_lines[-1].strip():
+        last.body_lines.pop()
+    content = _content_lines(operation.content)
+    if content and parse_heading(content[0]) and last.body_lines:
+        content = [""] + content
+    last.body_lines.extend(content + [""])
+
+
+def _insert(sections: List[MarkdownSection], operation: SectionOperation) -> None:
+    start, end = _find_subtree(sections, operation.heading)
+    anchor = (operation.target or "").strip()
+    if not anchor:
+        raise PatchError(f"insert under {operation.heading!r} needs a target line")
+
+    hits = [
+        (index, line_index)
+        for index in range(start, end)
+        for line_index, line in enumerate(sections[index].body_lines)
+        if line.strip() == anchor
+    ]
+    if len(hits) != 1:
+        raise PatchError(
+            f"insert target {'not found' if not hits else 'is ambiguous'} under {operation.heading!r}: {anchor!r}"
+        )
+    index, line_index = hits[0]
+    sections[index].body_lines[line_index + 1 : line_index + 1] = _content_lines(
+        operation.content
+    )
+
+
+def _replace(sections: List[MarkdownSection], operation: SectionOperation) -> None:
+    start, end = _find_subtree(sections, operation.heading)
+    target = (operation.target or "").strip("\n")
+    if not target.strip():
+        raise PatchError(f"replace under {operation.heading!r} needs target text")
+
+    hits = [
+        index
+        for index in range(start, end)
+        for _ in range("\n".join(sections[index].body_lines).count(target))
+    ]
+    if len(hits) != 1:
+        raise PatchError(
+            f"replace target {'not found' if not hits else 'is ambiguous'} under {operation.heading!r}: {target!r}"
+        )
+    section = sections[hits[0]]
+    section.body_lines = (
+        "\n".join(section.body_lines).replace(target, operation.content.strip("\n")).split("\n")
+    )
+
+
+def _add_section(sections: List[MarkdownSection], operation: SectionOperation) -> None:
+    key = _heading_key(operation.heading)
+    if not key:
+        raise PatchError("add_section needs a heading")
+    if any(s.level and _heading_key(s.heading) == key for s in sections):
+        # Section already exists - treat as an append instead of duplicating it
+        _append(sections, operation)
+        return
+
+    level = min((s.level for s in sections if s.level), default=2)
+    if sections and sections[-1].body_lines and sections[-1].body_lines[-1].strip():
+        sections[-1].body_lines.append("")
+    sections.append(
+        MarkdownSection(
+            heading=operation.heading.strip(),
+            level=level,
+            body_lines=_content_lines(operation.content) + [""],
+            heading_line=f"{'#' * level} {operation.heading.strip()}",
+        )
+    )
+
+
+_OPERATIONS = {
+    "append": _append,
+    "insert": _insert,
+    "replace": _replace,
+    "add_section": _add_section,
+}
+
+
+def apply_patch(markdown: str, operations: List[SectionOperation]) -> str:
+    """
+    Apply section operations to a markdown resume.
+
+    All operations are validated against the document as they are applied; any
+    operation that cannot be applied unambiguously fails the whole patch, so a
+    partial update is never returned.
+
+    Args:
+        markdown: Current resume markdown
+        operations: Operations to apply in order
+
+    Returns:
+        Updated resume markdown
+
+    Raises:
+        PatchError: If an operation targets a missing/ambiguous heading or text
+    """
+    sections = split_sections(markdown, max_level=6)
+    headings_before = {_heading_key(s.heading) for s in sections if s.level}
+
+    for operation in operations:
+        _OPERATIONS[operation.action](sections, operation)
+        # Re-split so headings added by this operation can be targeted by the next
+        sections = split_sections(_render(sections), max_level=6)
+
+    headings_after = {_heading_key(s.heading) for s in sections if s.level}
+    if not headings_before <= headings_after:
+        raise PatchError(f"Patch removed headings: {sorted(headings_before - headings_after)}")
+
+    return _render(sections)
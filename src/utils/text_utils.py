@@ -0,0 +1,219 @@
+"""
+Text Utility Functions
+
+Deterministic helpers for hashing and normalizing text content.
+"""
+
+import hashlib
+import math
+import re
+import unicodedata
+from typing import Optional, FrozenSet, Set
+
+# Rough characters-per-token ratio for English prose and markdown
+CHARS_PER_TOKEN = 4
+
+WORD_PATTERN = re.compile(r"[a-z0-9+#]+")
+# Filler words that carry no topic meaning in missing-info phrasing
+TOPIC_STOPWORDS = frozenset(
+    {
+        "a", "an", "and", "any", "are", "as", "at", "by", "did", "do", "for",
+        "from", "how", "in", "information", "info", "is", "many", "missing",
+        "of", "on", "or", "specific", "the", "their", "to", "was", "what",
+        "which", "with", "you", "your",
+    }
+)
+# Tokens shared by topics about different subjects; they never tell two topics apart
+GENERIC_TOPIC_TOKENS = frozenset(
+    {
+        "experience", "production", "professional", "work", "working", "level",
+        "knowledge", "background", "detail", "total", "overall", "relevant",
+        "hands", "practical", "industry", "skill",
+    }
+)
+
+
+def content_hash(*parts: Optional[str]) -> str:
+    """
+    Compute a stable SHA-256 hex digest over one or more text parts.
+
+    Parts are separated by a unit separator so ("ab", "c") and ("a", "bc")
+    produce different hashes. None is treated as an empty string.
+
+    Args:
+        parts: Text values to hash in order
+
+    Returns:
+        Hex digest string
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update((part or "").encode("utf-8"))
+        digest.update(b"\x1f")
+    return digest.hexdigest()
+
+
+def estimate_tokens(text: Optional[str]) -> int:
+    """
+    Cheaply estimate the token count of a text without calling a tokenizer.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Approximate number of tokens
+    """
+    return math.ceil(len(text or "") / CHARS_PER_TOKEN)
+
+
+def topic_tokens(text: Optional[str]) -> FrozenSet[str]:
+    """
+    Reduce a free-text topic to its set of meaningful tokens.
+
+    Lowercases, drops filler words and strips a trailing plural "s" so
+    "Size of teams managed" and "team size managed" map to the same set.
+
+    Args:
+        text: Topic text, e.g. a missing_info item
+
+    Returns:
+        Frozen set of normalized tokens
+    """
+    tokens = set()
+    for word in WORD_PATTERN.findall((text or "").lower()):
+        if word in TOPIC_STOPWORDS:
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        tokens.add(word)
+    return frozenset(tokens)
+
+
+def distinctive_topic_tokens(text: Optional[str]) -> FrozenSet[str]:
+    """
+    Topic tokens that tell topics apart, without generic ones like "experience".
+
+    "Python experience in production" and "Java experience in production" share most
+    tokens but differ in {"python"} vs {"java"}.
+
+    Args:
+        text: Topic text, e.g. a missing_info item
+
+    Returns:
+        Frozen set of distinctive normalized tokens
+    """
+    return topic_tokens(text) - GENERIC_TOPIC_TOKENS
+
+
+def normalize_topic(text: Optional[str]) -> str:
+    """Canonical key for a topic: its normalized tokens, sorted and space-joined"""
+    return " ".join(sorted(topic_tokens(text)))
+
+
+def topic_similarity(first: Optional[str], second: Optional[str]) -> float:
+    """
+    Jaccard similarity between the normalized token sets of two topics.
+
+    Args:
+        first: First topic text
+        second: Second topic text
+
+    Returns:
+        Similarity in [0, 1], 0 when either topic has no meaningful tokens
+    """
+    first_tokens, second_tokens = topic_tokens(first), topic_tokens(second)
+    if not first_tokens or not second_tokens:
+        return 0.0
+    return len(first_tokens & second_tokens) / len(first_tokens | second_tokens)
+
+
+# Legal-form suffixes ignored when comparing company names
+COMPANY_SUFFIXES = frozenset(
+    {
+        "ag", "bv", "co", "company", "corp", "corporation", "gmbh", "inc",
+        "incorporated", "limited", "llc", "llp", "ltd", "plc", "pty", "sa", "sas",
+    }
+)
+
+
+# Company keys are used in storage paths, so symbols are spelled out
+COMPANY_KEY_WORD_PATTERN = re.compile(r"[a-z0-9]+")
+COMPANY_NAME_SYMBOLS = {"&": " and ", "+": " plus ", "#": " sharp "}
+# Header lines that state the employer ("Company: Acme", "About Acme")
+COMPANY_HEADER_PATTERNS = (
+    re.compile(r"^(?:company|employer|organization|hiring company)\s*[:\-\u2013]\s*(.+)$", re.IGNORECASE),
+    re.compile(
+        r"^about\s+(?!(?:the|this|our|us|you|your)\b)(.+?)\s*:?$", re.IGNORECASE
+    ),
+)
+COMPANY_HEADER_MAX_LINES = 40
+COMPANY_NAME_MAX_WORDS = 6
+
+
+def normalize_company_name(name: Optional[str]) -> str:
+    """
+    Canonical key for a company name, safe to use in a storage path.
+
+    "Acme, Inc.", "ACME Inc" and "acme" all map to "acme"; "C# Labs" maps to
+    "c-sharp-labs".
+
+    Args:
+        name: Company name as written on a posting
+
+    Returns:
+        Lowercase [a-z0-9] tokens without legal-form suffixes, hyphen-joined
+    """
+    name = unicodedata.normalize("NFKD", (name or "").lower())
+    for symbol, spelled in COMPANY_NAME_SYMBOLS.items():
+        name = name.replace(symbol, spelled)
+    words = COMPANY_KEY_WORD_PATTERN.findall(name)
+    while len(words) > 1 and words[-1] in COMPANY_SUFFIXES:
+        words.pop()
+    return "-".join(words)
+
+
+def company_name_from_header(job_description: Optional[str]) -> str:
+    """
+    Company name stated in a posting's header lines, without a model call.
+
+    Args:
+        job_description: Job posting text
+
+    Returns:
+        Company name as written, empty if no header line states it
+    """
+    lines = (job_description or "").splitlines()[:COMPANY_HEADER_MAX_LINES]
+    for line in lines:
+        line = line.strip().strip("#*_ ").strip()
+        for pattern in COMPANY_HEADER_PATTERNS:
+            match = pattern.match(line)
+            if not match:
+                continue
+            name = match.group(1).strip().strip("*_:. ")
+            if name and len(name.split()) <= COMPANY_NAME_MAX_WORDS:
+                return name
+    return ""
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """Lowercase and reduce text to its word tokens, dropping markdown and punctuation"""
+    return " ".join(WORD_PATTERN.findall((text or "").lower()))
+
+
+def shingles(text: Optional[str], size: int = 3) -> Set[str]:
+    """
+    Word k-shingles of a text, after normalize_text.
+
+    Texts shorter than the shingle size yield a single shingle of all their words.
+
+    Args:
+        text: Text to shingle
+        size: Number of words per shingle
+
+    Returns:
+        Set of space-joined word windows
+    """
+    words = normalize_text(text).split()
+    if len(words) <= size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i : i + size]) for i in range(len(words) - size + 1)}
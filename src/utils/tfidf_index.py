@@ -0,0 +1,143 @@
+"""
+TF-IDF Inverted Index
+
+Pure-Python sparse TF-IDF index for ranking documents against a query text.
+Uses SMART lnc.ltc weighting: document vectors are log-tf and cosine-normalized
+without idf, so adding or removing a document only touches that document's
+postings; idf is applied on the query side at scoring time. Scoring walks only the
+postings of the query's terms, so it stays fast for thousands of documents.
+"""
+
+import heapq
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+# Bump when tokenization changes so persisted indexes are rebuilt
+TFIDF_INDEX_VERSION = 1
+
+TERM_PATTERN = re.compile(r"[a-z][a-z0-9+#.]*[a-z0-9+#]|[a-z]")
+STOPWORDS = frozenset(
+    """a about above after all also an and any are as at be been being both but by can
+    could did do does doing during each few for from further had has have having he her
+    here his how i if in into is it its itself just me more most my no nor not now of off
+    on once only or other our out over own same she should so some such than that the
+    their them then there these they this those through to too under until up very was we
+    were what when where which while who whom why will with would you your yours
+    etc e.g i.e per via within across including ability strong excellent experience
+    work working team role job candidate position company years year""".split()
+)
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lowercase word terms without stopwords; keeps tokens like c++, c#, node.js"""
+    return [
+        term
+        for term in TERM_PATTERN.findall((text or "").lower())
+        if term not in STOPWORDS and len(term) > 1
+    ]
+
+
+def _log_tf(terms: List[str]) -> Dict[str, float]:
+    return {term: 1.0 + math.log(count) for term, count in Counter(terms).items()}
+
+
+def _normalize(vector: Dict[str, float]) -> Dict[str, float]:
+    norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+    if not norm:
+        return {}
+    return {term: weight / norm for term, weight in vector.items()}
+
+
+class TfidfIndex:
+    """Incrementally updatable inverted index with lnc.ltc cosine scoring"""
+
+    def __init__(self) -> None:
+        self.doc_vectors: Dict[str, Dict[str, float]] = {}
+        self.doc_hashes: Dict[str, str] = {}
+        self.postings: Dict[str, Dict[str, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self.doc_vectors)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self.doc_vectors
+
+    def add(self, doc_id: str, text: str, content_hash: str = "") -> None:
+        """Add or replace a document"""
+        self.remove(doc_id)
+        vector = _normalize(_log_tf(tokenize(text)))
+        self.doc_vectors[doc_id] = vector
+        self.doc_hashes[doc_id] = content_hash
+        for term, weight in vector.items():
+            self.postings.setdefault(term, {})[doc_id] = weight
+
+    def remove(self, doc_id: str) -> None:
+        """Remove a document if present"""
+        for term in self.doc_vectors.pop(doc_id, {}):
+            term_postings = self.postings.get(term)
+            if term_postings is not None:
+                term_postings.pop(doc_id, None)
+                if not term_postings:
+                    del self.postings[term]
+        self.doc_hashes.pop(doc_id, None)
+
+    def query_vector(self, text: str) -> Dict[str, float]:
+        """
+        ltc query weights: log-tf times idf, cosine-normalized.
+
+        idf is smoothed (log(1 + N/df)) so terms found in every document still count;
+        otherwise a single indexed job would never match anything.
+        """
+        total = len(self.doc_vectors)
+        weights = {
+            term: tf * math.log(1 + total / len(self.postings[term]))
+            for term, tf in _log_tf(tokenize(text)).items()
+            if term in self.postings
+        }
+        return _normalize(weights)
+
+    def search(self, text: str, limit: Optional[int] = None) -> List[Tuple[str, float]]:
+        """
+        Rank documents by cosine similarity to the text.
+
+        Args:
+            text: Query text (e.g. a resume)
+            limit: Maximum number of results (all matching documents if None)
+
+        Returns:
+            (doc_id, score) pairs, best first
+        """
+        scores: Dict[str, float] = {}
+        for term, query_weight in self.query_vector(text).items():
+            for doc_id, doc_weight in self.postings[term].items():
+                scores[doc_id] = scores.get(doc_id, 0.0) + query_weight * doc_weight
+
+        if limit is None:
+            return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+
+    def to_dict(self) -> Dict:
+        """Serializable form (postings are rebuilt on load, weights rounded for size)"""
+        return {
+            "version": TFIDF_INDEX_VERSION,
+            "doc_vectors": {
+                doc_id: {term: round(weight, 5) for term, weight in vector.items()}
+                for doc_id, vector in self.doc_vectors.items()
+            },
+            "doc_hashes": self.doc_hashes,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict]) -> "TfidfIndex":
+        """Restore an index saved with to_dict; empty if missing or outdated"""
+        index = cls()
+        if not data or data.get("version") != TFIDF_INDEX_VERSION:
+            return index
+        index.doc_hashes = dict(data.get("doc_hashes", {}))
+        for doc_id, vector in data.get("doc_vectors", {}).items():
+            index.doc_vectors[doc_id] = vector
+            for term, weight in vector.items():
+                index.postings.setdefault(term, {})[doc_id] = weight
+        return index